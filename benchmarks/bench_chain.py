@@ -0,0 +1,56 @@
+"""Benchmark the latency of a chain of dependent tasks.
+
+Measures the time from the scheduler start to the finish of
+the last task in a chain of tasks each running after the
+previous one succeeded.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_chain.py --steps 50 --cycle-sleep 0.1
+"""
+
+import argparse
+import time
+
+from rocketry import Rocketry
+from rocketry.conditions import TaskStarted, TaskSucceeded
+from rocketry.conds import after_success
+
+def run_chain(steps:int, cycle_sleep:float, dispatch:str, execution:str):
+    app = Rocketry(config={
+        "cycle_sleep": cycle_sleep,
+        "dispatch_dependents": None if dispatch == "none" else dispatch,
+        "task_execution": execution,
+    })
+
+    def do_nothing():
+        ...
+
+    app.task(~TaskStarted(), name="step 0")(do_nothing)
+    for i in range(1, steps):
+        app.task(after_success(f"step {i-1}"), name=f"step {i}")(do_nothing)
+
+    app.session.config.shut_cond = TaskSucceeded(task=f"step {steps - 1}") >= 1
+
+    start = time.perf_counter()
+    app.run()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--cycle-sleep", type=float, default=0.1)
+    parser.add_argument("--execution", default="async")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for dispatch in ("none", "wake", "same_cycle"):
+        timings = [
+            run_chain(args.steps, args.cycle_sleep, dispatch, args.execution)
+            for _ in range(args.repeat)
+        ]
+        best = min(timings)
+        print(f"dispatch={dispatch:<10} steps={args.steps} best={best:.3f}s per step={best / args.steps * 1000:.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark creating many tasks.
+
+Creates the tasks one by one with ``session.create_task``
+and in bulk with ``session.create_tasks`` and reports the
+time of both. The tasks are like generated from a config:
+a command each and a start condition from a small set.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_create_tasks.py --tasks 5000
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from rocketry import Session
+from rocketry.log import MinimalRecord
+
+CONDITIONS = [
+    "daily",
+    "hourly",
+    "every 10 minutes",
+    "daily between 10:00 and 12:00",
+    "weekly on Monday",
+]
+
+def get_specs(n_tasks:int):
+    return [
+        {
+            "command": f"python job_{i}.py",
+            "name": f"job {i}",
+            "start_cond": CONDITIONS[i % len(CONDITIONS)],
+        }
+        for i in range(n_tasks)
+    ]
+
+def create_session():
+    return Session(config={"execution": "async", "task_pre_exist": "raise"})
+
+def run_single(n_tasks:int) -> float:
+    session = create_session()
+    specs = get_specs(n_tasks)
+    start = time.perf_counter()
+    for spec in specs:
+        session.create_task(**spec)
+    return time.perf_counter() - start
+
+def run_bulk(n_tasks:int) -> float:
+    session = create_session()
+    specs = get_specs(n_tasks)
+    start = time.perf_counter()
+    session.create_tasks(specs)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--skip-single", action="store_true", help="Only create in bulk")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("rocketry.task")
+    logger.handlers = [RepoHandler(repo=MemoryRepo(model=MinimalRecord))]
+    logger.setLevel(logging.INFO)
+    warnings.simplefilter("ignore")
+
+    if not args.skip_single:
+        elapsed = run_single(args.tasks)
+        print(f"create_task:  {args.tasks} tasks in {elapsed:.2f}s ({elapsed / args.tasks * 1e6:.0f}us per task)")
+    elapsed = run_bulk(args.tasks)
+    print(f"create_tasks: {args.tasks} tasks in {elapsed:.2f}s ({elapsed / args.tasks * 1e6:.0f}us per task)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the import time of Rocketry.
+
+Runs ``python -X importtime -c "import rocketry"`` in
+fresh processes (like a process task does) and reports
+the median cumulative import time and the slowest
+modules. Exits with an error if the median exceeds
+the budget.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_import.py --repeat 10 --budget 400
+
+The budget is 400ms by default.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+def import_times(module:str):
+    "Get cumulative import times (in microseconds) of the modules"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, env=os.environ,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        # Ie. "import time:       386 |       2428 |     rocketry.log"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="rocketry")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to show")
+    parser.add_argument("--budget", type=float, default=400, help="Maximum median import time (ms), 0 to disable")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+    print(f"import {args.module}: median {median:.1f}ms (min {min(totals):.1f}ms, max {max(totals):.1f}ms)")
+
+    # Slowest modules by self time
+    self_times = {}
+    for run in runs:
+        for name, (self_us, _) in run.items():
+            self_times.setdefault(name, []).append(self_us / 1000)
+    slowest = sorted(self_times.items(), key=lambda x: statistics.median(x[1]), reverse=True)
+    print(f"{'module':<50} {'self':>10}")
+    for name, times in slowest[:args.top]:
+        print(f"{name:<50} {statistics.median(times):>8.1f}ms")
+
+    if args.budget and median > args.budget:
+        print(f"Over budget: {median:.1f}ms > {args.budget:.1f}ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
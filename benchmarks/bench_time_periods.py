@@ -0,0 +1,61 @@
+"""Benchmark rolling the time periods.
+
+Measures the per-call time of rollforward, rollback
+and membership check of each TimeOfX class with
+times spread over a year.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_time_periods.py --number 2000
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from rocketry.time import (
+    TimeOfSecond, TimeOfMinute, TimeOfHour, TimeOfDay,
+    TimeOfWeek, TimeOfMonth, TimeOfYear,
+)
+
+PERIODS = {
+    "TimeOfSecond": TimeOfSecond("100", "600"),
+    "TimeOfMinute": TimeOfMinute("15", "45"),
+    "TimeOfHour": TimeOfHour("15:00", "45:00"),
+    "TimeOfDay": TimeOfDay("08:00", "18:00"),
+    "TimeOfDay (over midnight)": TimeOfDay("22:00", "02:00"),
+    "TimeOfWeek": TimeOfWeek("Mon", "Fri"),
+    "TimeOfMonth": TimeOfMonth("5th", "10th"),
+    "TimeOfYear": TimeOfYear("Feb", "Apr"),
+}
+
+def get_times(n:int, timezone=None):
+    rand = random.Random(0)
+    start = datetime.datetime(2024, 1, 1, tzinfo=timezone)
+    return [
+        start + datetime.timedelta(microseconds=rand.randrange(366 * 24 * 60 * 60 * 1_000_000))
+        for _ in range(n)
+    ]
+
+def bench(func, times, repeat:int):
+    timings = timeit.repeat(lambda: [func(dt) for dt in times], number=1, repeat=repeat)
+    return min(timings) / len(times) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="Number of times to roll")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--utc", action="store_true", help="Use timezone aware times")
+    args = parser.parse_args()
+
+    times = get_times(args.number, timezone=datetime.timezone.utc if args.utc else None)
+    print(f"{'period':<26} {'rollforward':>12} {'rollback':>12} {'contains':>12}")
+    for name, period in PERIODS.items():
+        forward = bench(period.rollforward, times, args.repeat)
+        back = bench(period.rollback, times, args.repeat)
+        contains = bench(period.__contains__, times, args.repeat)
+        print(f"{name:<26} {forward:>10.2f}us {back:>10.2f}us {contains:>10.2f}us")
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ import warnings
 
 from redbird import BaseRepo
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
 from rocketry.log.log_record import LogRecord
 
 from rocketry.conditions import FuncCond
@@ -19,13 +18,13 @@ class _AppMixin:
         "Create a task"
         return self.session.create_task(start_cond=start_cond, name=name, **kwargs)
 
-    def param(self, name:Optional[str]=None):
+    def param(self, name:Optional[str]=None, **kwargs):
         "Set one session parameter (decorator)"
-        return FuncParam(name, session=self.session)
+        return FuncParam(name, session=self.session, **kwargs)
 
-    def cond(self, syntax: Union[str, Pattern, List[Union[str, Pattern]]]=None):
+    def cond(self, syntax: Union[str, Pattern, List[Union[str, Pattern]]]=None, **kwargs):
         "Create a condition (decorator)"
-        return FuncCond(syntax=syntax, session=self.session, decor_return_func=False)
+        return FuncCond(syntax=syntax, session=self.session, decor_return_func=False, **kwargs)
 
     def params(self, **kwargs):
         "Set session parameters"
@@ -42,6 +41,13 @@ class _AppMixin:
             self.session.add_task(task)
         self.session.parameters.update(group.session.parameters)
 
+    def discover(self, path, pattern:str="**/*.py"):
+        """Create the tasks of the modules in a directory.
+        The modules are imported only when their tasks are
+        run. See :py:func:`rocketry.tasks.discover.discover_tasks`"""
+        from rocketry.tasks.discover import discover_tasks
+        return discover_tasks(path, app=self, pattern=pattern)
+
 class Rocketry(_AppMixin):
     """Rocketry scheduling application"""
 
@@ -81,6 +87,7 @@ class Rocketry(_AppMixin):
 
     def _set_logger_with_repo(self, repo):
         if repo is None:
+            from redbird.repos import MemoryRepo
             repo = MemoryRepo(model=LogRecord)
         logger = self._get_task_logger()
         logger.handlers.insert(0, RepoHandler(repo=repo))
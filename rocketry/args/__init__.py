@@ -1,3 +1,3 @@
 
-from .builtin import Arg, FuncArg, Return, Session, Config, Task, TaskLogger, SchedulerLogger, TerminationFlag, SimpleArg, EnvArg, CliArg, argument
+from .builtin import Arg, FuncArg, PoolArg, Return, Session, Config, Task, TaskLogger, SchedulerLogger, TerminationFlag, SimpleArg, EnvArg, CliArg, argument
 from .secret import Private
@@ -1,8 +1,10 @@
 
+import datetime
 import logging
 import os
 import sys
 import threading
+import time
 import warnings
 from typing import Any, Callable, Optional, Union
 from rocketry.core.log.adapter import TaskAdapter
@@ -13,6 +15,7 @@ except ImportError: # pragma: no cover
 
 from rocketry.core.task import Task as BaseTask
 from rocketry.core.parameters import BaseArgument, Parameters
+from rocketry.core.utils.cache import TTLCache, get_ttl
 
 class NotSet:
     def __repr__(self):
@@ -198,6 +201,19 @@ class FuncArg(BaseArgument):
         Function that is executed and passed as value.
     *args : tuple
         Positional arguments passed to func.
+    materialize : str, optional
+        Whether to materialize the argument before
+        ('pre') or after ('post') passing it to a
+        child thread or process.
+    cache_ttl : str, int, float, timedelta, optional
+        How long the value is cached. The value is
+        shared by the tasks (and runs) using the
+        argument. By default, not cached.
+    cache_size : int, optional
+        Maximum number of values cached (one per
+        task if ``cache_by_task``). If None, unbounded.
+    cache_by_task : bool
+        Whether each task has its own cached value.
     **kwargs : dict
         Keyword arguments passed to func.
 
@@ -233,19 +249,56 @@ class FuncArg(BaseArgument):
         >>> session.parameters
         Parameters(myarg1=FuncArg(myarg1), myarg2=FuncArg(myfunc))
     """
-    def __init__(self, __func:Callable, *args, materialize:Optional[Literal['pre', 'post']]=None, **kwargs):
+    def __init__(self, __func:Callable, *args, materialize:Optional[Literal['pre', 'post']]=None,
+                 cache_ttl:Union[str, int, float, datetime.timedelta]=None, cache_size:Optional[int]=128,
+                 cache_by_task:bool=False, **kwargs):
         self.func = __func
         self.materialize = materialize
         self.args = args
         self.kwargs = kwargs
+        self.cache_by_task = cache_by_task
+        self._cache = TTLCache(get_ttl(cache_ttl), maxsize=cache_size) if cache_ttl is not None else None
 
     def get_value(self, **kwargs):
+        if self._cache is not None:
+            return self._get_cached_value(**kwargs)
         return self(**kwargs)
 
+    def _get_cached_value(self, **kwargs):
+        task = kwargs.get("task")
+        session = kwargs.get("session")
+        if session is None:
+            session = task.session if task is not None else self.session
+        key = task.name if self.cache_by_task and task is not None else None
+        return self._cache.get(
+            key, lambda: self(**kwargs),
+            now=session._get_time_now(), time_func=session.get_time
+        )
+
+    def clear_cache(self, task:Union[BaseTask, str, None]=None):
+        """Clear the cached value(s) of the argument.
+
+        Parameters
+        ----------
+        task : Task, str, optional
+            Clear only the value of the task
+            (if ``cache_by_task``). By default
+            all values are cleared.
+        """
+        if self._cache is None:
+            return
+        if task is None:
+            self._cache.clear()
+        else:
+            self._cache.discard(task if isinstance(task, str) else task.name)
+
     def __call__(self, **kwargs):
         param_kwargs = Parameters._from_signature(self.func)
         params = param_kwargs.materialize(**kwargs)
-        return self.func(*self.args, **params, **self.kwargs)
+        try:
+            return self.func(*self.args, **params, **self.kwargs)
+        finally:
+            param_kwargs.release(params, **kwargs)
 
     def stage(self, **kwargs):
         session = kwargs['session']
@@ -259,6 +312,183 @@ class FuncArg(BaseArgument):
         cls_name = type(self).__name__
         return f'{cls_name}({self.func.__name__})'
 
+class PoolArg(BaseArgument):
+    """An argument that lends a resource (ie. a
+    database connection) from a pool to task runs.
+
+    The resources are created by the factory when
+    needed (at most ``size`` at a time) and returned
+    to the pool after the run has finished. If all
+    of the resources are lent, the run waits for one
+    to be returned.
+
+    Parameters
+    ----------
+    factory : Callable
+        Function that creates a resource.
+    size : int
+        Maximum number of resources.
+    timeout : str, int, float, timedelta, optional
+        How long to wait for a resource before
+        raising TimeoutError. By default, waits
+        forever.
+    close : Callable, optional
+        Function to close a resource (when the pool
+        is closed or the resource is discarded).
+    discard_failed : bool
+        Whether to discard (and close) the resource
+        if the run failed, for example, due to a
+        broken connection.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import sqlite3
+        from rocketry.args import PoolArg
+
+        db = PoolArg(lambda: sqlite3.connect("app.db", check_same_thread=False), size=2, close=lambda conn: conn.close())
+
+        @app.task(execution="thread")
+        def do_things(conn=db):
+            conn.execute(...)
+
+    Notes
+    -----
+    The pool is not passed to child processes: a
+    task executed in a process creates a new
+    resource for each run and closes it when the
+    run finishes. Use the pool with threaded or
+    async tasks to reuse the resources.
+    """
+
+    def __init__(self, factory:Callable, size:int=5, timeout:Union[str, int, float, datetime.timedelta]=None,
+                 close:Optional[Callable]=None, discard_failed:bool=False):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self.timeout = get_ttl(timeout) if timeout is not None else None
+        self.close_func = close
+        self.discard_failed = discard_failed
+        self._is_copy = False
+        self._init_pool()
+
+    def _init_pool(self):
+        self._idle = []
+        self._n_created = 0
+        self._cond = threading.Condition()
+        # Statistics
+        self.n_checkouts = 0
+        self.n_waits = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def get_value(self, **kwargs):
+        "Check out a resource from the pool"
+        start = time.perf_counter()
+        create = False
+        with self._cond:
+            while not self._idle and self._n_created >= self.size:
+                remaining = None if self.timeout is None else self.timeout - (time.perf_counter() - start)
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No resource available in the pool in {self.timeout} seconds")
+                self._cond.wait(remaining)
+            if self._idle:
+                resource = self._idle.pop()
+            else:
+                self._n_created += 1
+                create = True
+
+            waited = time.perf_counter() - start
+            self.n_checkouts += 1
+            if waited > 0.001:
+                self.n_waits += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+        if create:
+            try:
+                resource = self.factory()
+            except Exception:
+                with self._cond:
+                    self._n_created -= 1
+                    self._cond.notify()
+                raise
+        return resource
+
+    def release(self, value, status=None, **kwargs):
+        "Return the resource to the pool"
+        if self._is_copy or (self.discard_failed and status == "failed"):
+            # The pool of a copy (in a child process)
+            # is discarded after the run
+            self._discard(value)
+            return
+        with self._cond:
+            self._idle.append(value)
+            self._cond.notify()
+
+    def _discard(self, resource):
+        with self._cond:
+            self._n_created -= 1
+            self._cond.notify()
+        if self.close_func is not None:
+            self.close_func(resource)
+
+    def close(self):
+        "Close the idle resources of the pool"
+        with self._cond:
+            idle = self._idle
+            self._idle = []
+            self._n_created -= len(idle)
+            self._cond.notify_all()
+        if self.close_func is not None:
+            for resource in idle:
+                self.close_func(resource)
+
+    def stage(self, **kwargs):
+        # The resource is checked out in the
+        # thread or process that runs the task
+        return self
+
+    @property
+    def stats(self) -> dict:
+        "Statistics of the pool"
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._n_created,
+                "idle": len(self._idle),
+                "in_use": self._n_created - len(self._idle),
+                "checkouts": self.n_checkouts,
+                "waits": self.n_waits,
+                "wait_time": self.wait_time,
+                "max_wait_time": self.max_wait_time,
+            }
+
+    def __getstate__(self):
+        # The resources and the lock cannot be
+        # pickled. The copy has an empty pool.
+        state = self.__dict__.copy()
+        for attr in ("_idle", "_n_created", "_cond", "n_checkouts", "n_waits", "wait_time", "max_wait_time"):
+            del state[attr]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._is_copy = True
+        self._init_pool()
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        return f'PoolArg({getattr(self.factory, "__name__", self.factory)}, size={self.size})'
+
 class TerminationFlag(BaseArgument):
 
     def get_value(self, task=None, session=None, terminate_event=None, **kwargs) -> Any:
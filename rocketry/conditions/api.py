@@ -309,5 +309,5 @@ def scheduler_cycles(more_than:int=None, less_than:int=None):
 # Custom
 # ------
 
-def condition():
-    return FuncCond(syntax=None, decor_return_func=False)
\ No newline at end of file
+def condition(**kwargs):
+    return FuncCond(syntax=None, decor_return_func=False, **kwargs)
\ No newline at end of file
@@ -1,8 +1,10 @@
 
 import copy
+import datetime
 from typing import Callable, List, Optional, Pattern, Union
 from rocketry.core.parameters.parameters import Parameters
 from rocketry.core.condition import BaseCondition
+from rocketry.core.utils.cache import TTLCache, get_ttl
 
 class FuncCond(BaseCondition):
     """Condition from a function.
@@ -25,6 +27,18 @@ class FuncCond(BaseCondition):
         kwargs : dict
             Keyword arguments to be passed to the function.
             Optional
+        cache_ttl : str, int, float, timedelta, optional
+            How long the state of the condition is cached.
+            The cache is shared with the tasks using the
+            condition with the same arguments. If not
+            given, the function is called on every check.
+        cache_refresh : bool
+            If True, stale states are refreshed in a background
+            thread and the previous state is used meanwhile.
+            By default False
+        cache_size : int, optional
+            Maximum number of states cached (one per
+            set of arguments), by default 128
 
     Examples
     --------
@@ -56,6 +70,14 @@ class FuncCond(BaseCondition):
 
     >>> parse_condition("is foo in house")
     FuncCond(is_foo, syntax=re.compile('is foo in (?P<myval>.+)'), args=(), kwargs={'myval': 'house'})
+
+    Cache the state for 10 minutes and refresh it in the
+    background after that:
+
+    >>> @FuncCond(syntax="is bar", cache_ttl="10 minutes", cache_refresh=True)
+    ... def is_bar():
+    ...     ...
+    ...     return True
     """
 
     def __init__(self,
@@ -64,13 +86,17 @@ class FuncCond(BaseCondition):
                  args:Optional[tuple]=None,
                  kwargs:Optional[dict]=None,
                  decor_return_func=False,
-                 session=None):
+                 session=None,
+                 cache_ttl:Union[str, int, float, datetime.timedelta]=None,
+                 cache_refresh:bool=False,
+                 cache_size:Optional[int]=128):
 
         self.func = func
         self.syntax = syntax
         self.args = () if args is None else args
         self.kwargs = {} if kwargs is None else kwargs
         self.decor_return_func = decor_return_func
+        self._cache = self._get_cache(cache_ttl, refresh=cache_refresh, maxsize=cache_size)
         if session:
             self.session = session
         if self.syntax is not None:
@@ -101,11 +127,45 @@ class FuncCond(BaseCondition):
     def observe(self, **kwargs) -> bool:
         func_params = Parameters._from_signature(self.func, **kwargs)
         param_dict = func_params.materialize(**kwargs)
-        return self.get_state(*self.args, **self.kwargs, **param_dict)
+        try:
+            if self._cache is not None:
+                return self._get_cached_state(param_dict, **kwargs)
+            return self.get_state(*self.args, **self.kwargs, **param_dict)
+        finally:
+            func_params.release(param_dict, **kwargs)
 
     def get_state(self, *args, **kwargs):
         return self.func(*args, **kwargs)
 
+    @staticmethod
+    def _get_cache(ttl, refresh=False, maxsize=128) -> Optional[TTLCache]:
+        if ttl is None:
+            return None
+        return TTLCache(get_ttl(ttl), refresh=refresh, maxsize=maxsize)
+
+    def _get_cached_state(self, param_dict:dict, task=None, session=None, **kwargs):
+        if session is None:
+            session = task.session if task is not None else self.session
+        key = (
+            self.args,
+            tuple(sorted(self.kwargs.items())),
+            tuple(sorted(param_dict.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments cannot be cached
+            return self.get_state(*self.args, **self.kwargs, **param_dict)
+
+        def get_state():
+            return self.get_state(*self.args, **self.kwargs, **param_dict)
+        return self._cache.get(key, get_state, now=session._get_time_now(), time_func=session.get_time)
+
+    def clear_cache(self):
+        "Clear the cached states of the condition"
+        if self._cache is not None:
+            self._cache.clear()
+
     def _set_parsing(self):
 
         session = self.session
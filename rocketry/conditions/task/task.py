@@ -10,7 +10,7 @@ from rocketry.time.construct import get_before, get_between, get_full_cycle, get
 from rocketry.args import Task, Session
 from rocketry.core.time.utils import get_period_span
 from rocketry.core.time import TimeDelta
-from .utils import DependMixin, TaskStatusMixin
+from .utils import DependMixin, DueMixin, TaskStatusMixin
 
 from ..time import IsPeriod
 
@@ -252,7 +252,7 @@ class TaskInacted(TaskStatusMixin):
         return f"task '{task_name}' inacted"
 
 
-class TaskExecutable(BaseCondition):
+class TaskExecutable(DueMixin, BaseCondition):
     """Condition for checking whether a given
     task has not finished (for given period).
     Useful to set the given task to run once
@@ -282,11 +282,23 @@ class TaskExecutable(BaseCondition):
         # TODO: How to consider termination? Probably should be considered as failures without retries
         # NOTE: inaction is not considered at all
 
+    _due_actions = ('success', 'inaction', 'fail', 'terminate')
+
+    def _get_due_period(self, task):
+        if self.retries:
+            # Failures need to be counted
+            return None
+        return self.period
+
     def get_state(self, task=Task(default=None), session=Session()):
         task = self.task if self.task is not None else task
         period = self.period
         retries = 0 if self.retries is None else self.retries
 
+        due = self._get_due(task=task, session=session)
+        if due is not None:
+            return due.is_due(session._get_time_now())
+
         # Form the sub statements
         has_not_succeeded = TaskSucceeded(period=period, task=task) == 0
         has_not_inacted = TaskInacted(period=period, task=task) == 0
@@ -331,22 +343,31 @@ class TaskExecutable(BaseCondition):
         return cls(period=period)
 
 
-class TaskRunnable(BaseCondition):
+class TaskRunnable(DueMixin, BaseCondition):
     """Condition for checking whether a given
     task has not run (for given period).
     Useful to set the given task to run once
     in given period.
     """
 
+    _due_actions = ('run',)
+
     def __init__(self, task=None, period=None):
         self.period = period
         self.task = task
         super().__init__()
 
+    def _get_due_period(self, task):
+        return self.period
+
     def get_state(self, task=Task(default=None), session=Session()):
         task = self.task if self.task is not None else task
         period = self.period
 
+        due = self._get_due(task=task, session=session)
+        if due is not None:
+            return due.is_due(session._get_time_now())
+
         has_not_run = TaskStarted(period=period, task=task) == 0
 
         isin_period = (
@@ -1,12 +1,161 @@
+import math
+from typing import Optional
+import datetime
+
 from redbird.oper import in_, between
 
 from rocketry.core.condition import All, Any
 from rocketry.args import Task, Session
 from rocketry.core.condition import BaseCondition
 from rocketry.core.condition.base import BaseComparable
+from rocketry.core.time import TimeDelta, TimeInterval
 from rocketry.core.time.utils import get_period_span
 from rocketry.pybox.time import to_timestamp
 from rocketry.log.utils import get_field_value
+from rocketry.time.cron import Cron
+
+class DueTime:
+    """Compiled due time of a task for a period.
+
+    The condition is due (true) when the current
+    time is between ``start`` and ``end``. The due
+    time is valid only between ``valid_from`` and
+    ``valid_until`` and as long as the latest
+    timestamp of the actions (``last``) does not
+    change.
+    """
+
+    __slots__ = ("last", "start", "end", "valid_from", "valid_until")
+
+    def __init__(self, last, start, end, valid_from, valid_until):
+        self.last = last
+        self.start = start
+        self.end = end
+        self.valid_from = valid_from
+        self.valid_until = valid_until
+
+    @classmethod
+    def from_period(cls, period, last:Optional[float], now:float, session) -> Optional['DueTime']:
+        """Compile the due time for given period.
+
+        The task is due if none of the actions
+        occurred in the current interval of the
+        period (and the current time is in the
+        period) or, if the period is a time delta,
+        if none of the actions occurred in the
+        past delta. Returns None if cannot be
+        determined from the latest action.
+        """
+        if isinstance(period, TimeDelta):
+            if last is None:
+                return cls(last, -math.inf, math.inf, -math.inf, math.inf)
+            due = last + (period.past + period.resolution).total_seconds()
+            return cls(last, due, math.inf, last, math.inf)
+
+        now_dt = session._format_timestamp(now)
+        if now_dt in period:
+            prev_interval = period.rollback(now_dt)
+            start = to_timestamp(prev_interval.left)
+            if period.rollback(now_dt + period.resolution).left != prev_interval.left:
+                # Start of an interval, the previous interval
+                # is considered (only) at this moment
+                valid_until = now + 1e-6
+                if last is None or last < start:
+                    return cls(last, now, valid_until, now, valid_until)
+                if last <= to_timestamp(prev_interval.right):
+                    return cls(last, math.inf, math.inf, now, valid_until)
+                return None
+            end_dt = period.rollforward(now_dt).right
+            end = to_timestamp(end_dt)
+            if last is None or last < start:
+                return cls(last, start, end, now, end)
+            # Already done in the current interval
+            interval = period.rollforward(end_dt)
+            return cls(last, to_timestamp(interval.left), to_timestamp(interval.right), now, end)
+
+        # Not in the period, possibly due when the next interval starts
+        interval = period.rollforward(now_dt)
+        start = to_timestamp(interval.left)
+        return cls(last, start, to_timestamp(interval.right), now, start)
+
+    def is_valid(self, last:Optional[float], now:float) -> bool:
+        "Check whether the due time is still valid"
+        return last == self.last and self.valid_from <= now < self.valid_until
+
+    def is_due(self, now:float) -> bool:
+        "Check whether due on given time"
+        return self.start <= now < self.end
+
+class DueMixin:
+    """Mixin for task conditions that can be
+    compiled to a due time of the task.
+
+    The due time is computed only when the
+    task logs a new action (or the current
+    interval of the period ends) so that
+    checking the condition is a comparison
+    of timestamps.
+    """
+
+    _due_actions = None
+
+    def _get_due_period(self, task) -> Optional['TimePeriod']:
+        "Get the period for the due time (None if not supported)"
+        return None
+
+    def _get_due(self, task, session) -> Optional[DueTime]:
+        if session.config.force_status_from_logs:
+            return None
+        task = session[task] if isinstance(task, str) else task
+        period = self._get_due_period(task)
+        if isinstance(period, TimeDelta):
+            if period.future or period.reference is not None:
+                return None
+        elif not isinstance(period, (TimeInterval, Cron)):
+            return None
+
+        actions = (self._due_actions,) if isinstance(self._due_actions, str) else tuple(self._due_actions)
+        last = max(
+            (
+                timestamp
+                for timestamp in (getattr(task, f"_last_{action}") for action in actions)
+                if timestamp is not None
+            ),
+            default=None
+        )
+        now = session._get_time_now()
+        if last is not None and last > now:
+            # Cannot be determined from the last action
+            return None
+
+        key = (actions, period)
+        try:
+            due = task._due_cache.get(key)
+        except TypeError:
+            # Period not hashable
+            return None
+        if due is None or not due.is_valid(last, now):
+            due = DueTime.from_period(period, last=last, now=now, session=session)
+            task._due_cache[key] = due
+        return due
+
+    def get_next_due(self, task=Task(default=None), session=Session()) -> Optional[datetime.datetime]:
+        """Get when the condition is next due (true)
+        if the task does not log new actions. Returns
+        None if cannot be determined.
+
+        Parameters
+        ----------
+        task : Task, str
+            Task the condition is for (if not set in the condition).
+        session : Session
+            Session of the task.
+        """
+        task = self.task if self.task is not None else task
+        due = self._get_due(task=task, session=session)
+        if due is None or due.start == math.inf:
+            return None
+        return session._format_timestamp(max(due.start, session._get_time_now()))
 
 class DependMixin(BaseCondition):
 
@@ -37,7 +186,23 @@ class DependMixin(BaseCondition):
         actual_task = session[self.task] if self.task is not None else task
         depend_task = session[self.depend_task]
 
-        #! TODO: use Task._last_success & Task._last_run if not none and not forced
+        if not session.config.force_status_from_logs:
+            # Use the cached timestamps (kept up to date by the tasks' logging)
+            last_depend_finish = max(
+                (
+                    timestamp
+                    for timestamp in (depend_task._get_last_action(action) for action in self._dep_actions)
+                    if timestamp is not None
+                ),
+                default=None
+            )
+            last_actual_start = actual_task._get_last_action("run")
+            if last_depend_finish is None:
+                return False
+            if last_actual_start is None:
+                return True
+            return last_depend_finish > last_actual_start
+
         last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
         last_actual_start = actual_task.logger.get_latest(action="run")
 
@@ -50,7 +215,7 @@ class DependMixin(BaseCondition):
 
         return get_field_value(last_depend_finish, "created") > get_field_value(last_actual_start, "created")
 
-class TaskStatusMixin(BaseComparable):
+class TaskStatusMixin(DueMixin, BaseComparable):
 
     _action = None
 
@@ -59,12 +224,29 @@ class TaskStatusMixin(BaseComparable):
         self.period = period
         super().__init__()
 
+    @property
+    def _due_actions(self):
+        return self._action
+
+    def _get_due_period(self, task):
+        period = self.period if self.period is not None else task.period
+        if not isinstance(period, TimeDelta) or not self._is_equal_zero():
+            # Only "has not ... in the past ..."
+            return None
+        return period
+
     def get_measurement(self, task=Task(default=None), session=Session()):
         task = session[self.task] if self.task is not None else task
-        _start_, _end_ = get_period_span(self.period if self.period is not None else task.period, session=session)
 
         allow_optimization = not self.session.config.force_status_from_logs
 
+        if allow_optimization:
+            due = self._get_due(task=task, session=session)
+            if due is not None:
+                return due.is_due(session._get_time_now())
+
+        _start_, _end_ = get_period_span(self.period if self.period is not None else task.period, session=session)
+
         if allow_optimization:
 
             # Get features that could be used to bypass reading logs
@@ -100,6 +282,13 @@ class TaskStatusMixin(BaseComparable):
                 if occurred_on_period:
                     return True
 
+            # Check if can be counted from the cached counts
+            # of the calendar periods (minute, hour, day etc.)
+            counter = task._action_counter
+            if counter is not None:
+                count = counter.count(self._action, _start_, _end_)
+                if count is not None:
+                    return count
 
         records = task.logger.get_records(
             created=between(to_timestamp(_start_), to_timestamp(_end_)),
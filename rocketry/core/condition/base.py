@@ -64,7 +64,10 @@ class BaseCondition(RedBase):
         "Observe the status of the condition"
         cond_params = Parameters._from_signature(self.get_state, **kwargs)
         param_dict = cond_params.materialize(**kwargs)
-        return self.get_state(**param_dict)
+        try:
+            return self.get_state(**param_dict)
+        finally:
+            cond_params.release(param_dict, **kwargs)
 
     def __bool__(self) -> bool:
         """Check whether the condition holds."""
@@ -265,7 +268,10 @@ class BaseComparable(BaseCondition):
     def observe(self, **kwargs):
         params = Parameters._from_signature(self.get_measurement, **kwargs)
         param_dict = params.materialize(**kwargs)
-        value = self.get_measurement(**param_dict)
+        try:
+            value = self.get_measurement(**param_dict)
+        finally:
+            params.release(param_dict, **kwargs)
         if isinstance(value, bool):
             # Possibly has some optimization and already did the comparison
             return value
@@ -12,20 +12,33 @@ class _Hooker:
     def prerun(self, *args, **kwargs):
         from rocketry.core import Parameters
         self._post_hooks = []
+        self._kwargs = kwargs
         for hook in self.hooks:
-            kwds = Parameters._from_signature(hook).materialize(**kwargs)
-            result = hook(*args, **kwds)
-            if inspect.isgeneratorfunction(hook):
-                gener = result
-                next(gener, None) # Executes first yield
-                self._post_hooks.append(gener)
+            params = Parameters._from_signature(hook)
+            kwds = params.materialize(**kwargs)
+            is_gener = inspect.isgeneratorfunction(hook)
+            try:
+                result = hook(*args, **kwds)
+                if is_gener:
+                    gener = result
+                    next(gener, None) # Executes first yield
+            except Exception:
+                params.release(kwds, **kwargs)
+                raise
+            if is_gener:
+                # Values are released after the generator has finished
+                self._post_hooks.append((gener, params, kwds))
+            else:
+                params.release(kwds, **kwargs)
 
     def postrun(self, *args):
-        for gener in self._post_hooks:
+        for gener, params, kwds in self._post_hooks:
             try:
                 gener.send(args)
             except StopIteration:
                 pass
+            finally:
+                params.release(kwds, **self._kwargs)
 
 def clear_hooks():
     "Remove all hooks."
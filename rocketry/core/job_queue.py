@@ -0,0 +1,356 @@
+import datetime
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from rocketry.core.utils.cache import get_ttl
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rocketry_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    params TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS rocketry_jobs_ready ON rocketry_jobs (queue, state, visible_at, id);
+CREATE TABLE IF NOT EXISTS rocketry_job_stats (
+    queue TEXT NOT NULL,
+    minute INTEGER NOT NULL,
+    succeeded INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (queue, minute)
+);
+"""
+
+class Job(NamedTuple):
+    """Job claimed from a job queue
+
+    The number of attempts identifies the claim: if
+    the job is claimed again (ie. the run exceeded
+    the visibility timeout), the earlier claim is no
+    longer valid.
+    """
+    id: int
+    params: Dict[str, Any]
+    attempts: int
+
+class JobQueue:
+    """Durable queue of run batches (parameters)
+    stored in a local SQLite database.
+
+    A task with the queue (``job_queue``) is run
+    when the queue has jobs and each run consumes
+    a job: the parameters of the job are passed to
+    the task. The jobs survive restarts and can be
+    put from other processes (ie. a web API) by
+    creating a queue with the same file and name.
+
+    A claimed job is hidden from the other runs for
+    the visibility timeout. If the run crashes (ie.
+    the scheduler is killed), the job is claimed
+    again after the timeout. Runs that take longer
+    should extend the timeout (``extend``): a run
+    which job was claimed again cannot finish it
+    anymore. Failed and terminated
+    runs return the job to the queue until it has
+    been tried ``max_attempts`` times after which
+    it is left to the queue as failed.
+
+    Parameters
+    ----------
+    path : path-like
+        SQLite database file. Created if missing.
+    name : str
+        Name of the queue (a file can contain many).
+    consumers : int
+        Maximum number of runs of a task consuming
+        the queue at the same time. Requires
+        ``multilaunch`` if more than one.
+    visibility_timeout : str, int, float, timedelta
+        How long a claimed job is hidden.
+    max_attempts : int, optional
+        How many times a job is tried. If None, tried
+        until succeeded.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from rocketry.core.job_queue import JobQueue
+
+        queue = JobQueue("jobs.db", name="resize", consumers=4)
+
+        @app.task(job_queue=queue, execution="process", multilaunch=True)
+        def resize(image):
+            ...
+
+        # In another process
+        JobQueue("jobs.db", name="resize").put_many({"image": file} for file in files)
+
+    Extending the timeout in a long run:
+
+    .. code-block:: python
+
+        from rocketry.args import Task
+
+        @app.task(job_queue=queue)
+        def process(item, this_task=Task()):
+            for part in item:
+                ...
+                queue.extend(this_task.get_current_run().job)
+
+    Notes
+    -----
+    The parameters of the jobs must be JSON
+    serializable.
+    """
+
+    def __init__(self, path:Union[str, Path], name:str="default", consumers:int=1,
+                 visibility_timeout:Union[str, int, float, datetime.timedelta]=600,
+                 max_attempts:Optional[int]=3):
+        self.path = str(path)
+        self.name = name
+        self.consumers = consumers
+        self.visibility_timeout = get_ttl(visibility_timeout)
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._create()
+
+    def _create(self):
+        conn = self._get_connection()
+        conn.executescript(_SCHEMA)
+
+    def _get_connection(self) -> 'sqlite3.Connection':
+        # SQLite connections cannot be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, params:Dict[str, Any]=None, **kwargs) -> int:
+        "Put a job to the queue and return its ID"
+        return self.put_many([{**(params or {}), **kwargs}])[0]
+
+    def put_many(self, batches:Iterable[Dict[str, Any]]) -> List[int]:
+        "Put jobs to the queue (in one transaction)"
+        now = time.time()
+        rows = [(self.name, json.dumps(dict(params)), now, now) for params in batches]
+        conn = self._get_connection()
+        ids = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for row in rows:
+                cur = conn.execute(
+                    "INSERT INTO rocketry_jobs (queue, params, created, visible_at) VALUES (?, ?, ?, ?)",
+                    row
+                )
+                ids.append(cur.lastrowid)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return ids
+
+    def has_ready(self) -> bool:
+        "Whether there are jobs that can be claimed"
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM rocketry_jobs WHERE queue = ? AND state IN ('pending', 'running') AND visible_at <= ? LIMIT 1",
+            (self.name, time.time())
+        ).fetchone()
+        return row is not None
+
+    def claim(self) -> Optional[Job]:
+        "Claim the next job (None if no jobs)"
+        now = time.time()
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Running jobs that are visible again
+            # are from crashed runs
+            row = conn.execute(
+                "SELECT id, params, attempts FROM rocketry_jobs "
+                "WHERE queue = ? AND state IN ('pending', 'running') AND visible_at <= ? "
+                "ORDER BY visible_at, id LIMIT 1",
+                (self.name, now)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE rocketry_jobs SET state = 'running', attempts = attempts + 1, visible_at = ? WHERE id = ?",
+                    (now + self.visibility_timeout, row[0])
+                )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        if row is None:
+            return None
+        return Job(id=row[0], params=json.loads(row[1]), attempts=row[2] + 1)
+
+    def extend(self, job:Job, timeout:Union[str, int, float, datetime.timedelta]=None) -> bool:
+        """Extend the visibility timeout of a claimed job.
+
+        Parameters
+        ----------
+        job : Job
+            Claimed job.
+        timeout : str, int, float, timedelta, optional
+            How long the job is hidden from now on.
+            By default, the visibility timeout of
+            the queue.
+
+        Returns
+        -------
+        bool
+            Whether the claim was still valid (the
+            job was not claimed again).
+        """
+        timeout = self.visibility_timeout if timeout is None else get_ttl(timeout)
+        conn = self._get_connection()
+        cur = conn.execute(
+            "UPDATE rocketry_jobs SET visible_at = ? WHERE id = ? AND attempts = ? AND state = 'running'",
+            (time.time() + timeout, job.id, job.attempts)
+        )
+        return cur.rowcount > 0
+
+    def finish(self, job:Job, status:str, error:str=None) -> bool:
+        """Mark a claimed job finished.
+
+        Parameters
+        ----------
+        job : Job
+            Claimed job.
+        status : str
+            Status of the run: 'succeeded' and
+            'inaction' remove the job, others
+            return it to the queue (or mark it
+            failed if it has no attempts left).
+        error : str, optional
+            Error of the run.
+
+        Returns
+        -------
+        bool
+            Whether the claim was still valid. If
+            the job was claimed again, it is left
+            to the other run.
+        """
+        now = time.time()
+        conn = self._get_connection()
+        is_success = status in ("succeeded", "inaction")
+        # Only the latest claim can finish the job
+        claim = "WHERE id = ? AND attempts = ? AND state = 'running'"
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if is_success:
+                cur = conn.execute(f"DELETE FROM rocketry_jobs {claim}", (job.id, job.attempts))
+            elif self.max_attempts is not None and job.attempts >= self.max_attempts:
+                cur = conn.execute(
+                    f"UPDATE rocketry_jobs SET state = 'failed', error = ? {claim}",
+                    (error, job.id, job.attempts)
+                )
+            else:
+                cur = conn.execute(
+                    f"UPDATE rocketry_jobs SET state = 'pending', visible_at = ?, error = ? {claim}",
+                    (now, error, job.id, job.attempts)
+                )
+            is_valid = cur.rowcount > 0
+            if is_valid:
+                column = "succeeded" if is_success else "failed"
+                conn.execute(
+                    f"INSERT INTO rocketry_job_stats (queue, minute, {column}) VALUES (?, ?, 1) "
+                    f"ON CONFLICT (queue, minute) DO UPDATE SET {column} = {column} + 1",
+                    (self.name, int(now // 60))
+                )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return is_valid
+
+    def get_failed(self) -> List[Job]:
+        "Get the jobs that have no attempts left"
+        conn = self._get_connection()
+        rows = conn.execute(
+            "SELECT id, params, attempts FROM rocketry_jobs WHERE queue = ? AND state = 'failed' ORDER BY id",
+            (self.name,)
+        ).fetchall()
+        return [Job(id=row[0], params=json.loads(row[1]), attempts=row[2]) for row in rows]
+
+    def retry_failed(self) -> int:
+        "Return the failed jobs to the queue"
+        conn = self._get_connection()
+        cur = conn.execute(
+            "UPDATE rocketry_jobs SET state = 'pending', attempts = 0, visible_at = ? WHERE queue = ? AND state = 'failed'",
+            (time.time(), self.name)
+        )
+        return cur.rowcount
+
+    def clear(self):
+        "Remove the jobs and the statistics of the queue"
+        conn = self._get_connection()
+        conn.execute("DELETE FROM rocketry_jobs WHERE queue = ?", (self.name,))
+        conn.execute("DELETE FROM rocketry_job_stats WHERE queue = ?", (self.name,))
+
+    def stats(self, minutes:int=5) -> dict:
+        """Get the numbers of the jobs and the
+        throughput of the queue.
+
+        Parameters
+        ----------
+        minutes : int
+            Number of latest minutes the throughput
+            is calculated from.
+        """
+        conn = self._get_connection()
+        now = time.time()
+        counts = dict(conn.execute(
+            "SELECT state, COUNT(*) FROM rocketry_jobs WHERE queue = ? GROUP BY state",
+            (self.name,)
+        ).fetchall())
+        succeeded, failed = conn.execute(
+            "SELECT COALESCE(SUM(succeeded), 0), COALESCE(SUM(failed), 0) FROM rocketry_job_stats WHERE queue = ? AND minute > ?",
+            (self.name, int(now // 60) - minutes)
+        ).fetchone()
+        return {
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "failed": counts.get("failed", 0),
+            "succeeded_recently": succeeded,
+            "failed_recently": failed,
+            "throughput": succeeded / (minutes * 60),
+        }
+
+    def __len__(self):
+        conn = self._get_connection()
+        return conn.execute(
+            "SELECT COUNT(*) FROM rocketry_jobs WHERE queue = ? AND state IN ('pending', 'running')",
+            (self.name,)
+        ).fetchone()[0]
+
+    def __getstate__(self):
+        # Connections cannot be pickled. The
+        # copy opens its own.
+        state = self.__dict__.copy()
+        state["_local"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"JobQueue({self.path!r}, name={self.name!r})"
@@ -0,0 +1,213 @@
+import datetime
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Union
+
+class ActionCounter:
+    """Counts of the actions of a task per
+    calendar bucket.
+
+    The actions (run, success, fail etc.) are
+    counted per minute, hour, day, week and
+    month so that the number of actions in a
+    calendar period can be determined without
+    reading the logs. The counts are complete
+    only after the counter is rebuilt from the
+    logs (at scheduler startup) and old buckets
+    are dropped after their retention. The
+    counter is thread-safe as the actions are
+    added from the threads running the tasks.
+
+    Parameters
+    ----------
+    retention : dict, optional
+        How long the buckets of each granularity
+        are kept. None means forever.
+    """
+
+    granularities = ("month", "week", "day", "hour", "minute")
+    default_retention = {
+        "minute": datetime.timedelta(hours=2),
+        "hour": datetime.timedelta(days=2),
+        "day": datetime.timedelta(days=62),
+        "week": datetime.timedelta(weeks=10),
+        "month": None,
+    }
+
+    def __init__(self, retention:Optional[Dict[str, Optional[datetime.timedelta]]]=None):
+        self.retention = {**self.default_retention, **(retention or {})}
+        self.timezone = None
+        self._since = None
+        self._lock = threading.RLock()
+        self._init_counts()
+
+    def _init_counts(self):
+        # action -> granularity -> bucket start -> count
+        self._counts = {}
+        # action -> minute boundary -> count
+        # (needed as the end of a span is inclusive)
+        self._boundary = {}
+        # action -> latest timestamp
+        self._last = {}
+        # granularity -> current bucket (used for pruning)
+        self._current = {}
+
+    @property
+    def is_complete(self):
+        "Whether the counts are complete (rebuilt from the logs)"
+        return self._since is not None
+
+    def rebuild(self, records:Iterable, since:datetime.datetime, timezone=None):
+        """Rebuild the counts from log records.
+
+        Parameters
+        ----------
+        records : iterable of dict or records
+            Records of the task created at or after ``since``.
+        since : datetime.datetime
+            Start of the time the records cover.
+        timezone : datetime.tzinfo, optional
+            Timezone of the calendar buckets.
+        """
+        with self._lock:
+            self.timezone = timezone
+            self._init_counts()
+            self._since = {gran: since for gran in self.granularities}
+            for record in records:
+                if isinstance(record, dict):
+                    action, created = record["action"], record["created"]
+                else:
+                    action, created = record.action, record.created
+                self.add(action, created)
+
+    def add(self, action:str, timestamp:float):
+        "Count an action that occurred on given time"
+        with self._lock:
+            dt = datetime.datetime.fromtimestamp(timestamp, tz=self.timezone)
+            counts = self._counts.setdefault(action, {})
+            for gran in self.granularities:
+                bucket = self._floor(dt, gran)
+                counts.setdefault(gran, Counter())[bucket] += 1
+                current = self._current.get(gran)
+                if current is None or bucket > current:
+                    # New bucket, drop the expired ones
+                    self._current[gran] = bucket
+                    self._prune(gran, bucket)
+            if dt == self._floor(dt, "minute"):
+                self._boundary.setdefault(action, Counter())[dt] += 1
+            self._last[action] = max(timestamp, self._last.get(action, timestamp))
+
+    def count(self, action:Union[str, Iterable[str]], start:datetime.datetime, end:datetime.datetime) -> Optional[int]:
+        """Count the actions in a period (both ends
+        inclusive). Returns None if the count cannot
+        be determined from the buckets.
+
+        Parameters
+        ----------
+        action : str, list of str
+            Action(s) to count.
+        start : datetime.datetime
+            Start of the period.
+        end : datetime.datetime
+            End of the period.
+        """
+        with self._lock:
+            if self._since is None or end < start:
+                return None
+            actions = [action] if isinstance(action, str) else list(action)
+            start = self._to_timezone(start)
+            end = self._to_timezone(end)
+            if start is None or end is None:
+                return None
+            return self._count_span(actions, start, end, self.granularities)
+
+    def _count_span(self, actions, start, end, granularities):
+        for i, gran in enumerate(granularities):
+            if self._floor(start, gran) != start or start < self._since[gran]:
+                continue
+            total = 0
+            bucket = start
+            latest = self._current.get(gran)
+            while True:
+                if latest is None or bucket > latest:
+                    # Nothing has occurred after this
+                    return total
+                next_bucket = self._next(bucket, gran)
+                if next_bucket > end:
+                    break
+                total += self._get(actions, gran, bucket)
+                bucket = next_bucket
+                if bucket == end:
+                    # End is inclusive
+                    return total + sum(self._boundary.get(action, {}).get(end, 0) for action in actions)
+
+            # End is inside the bucket
+            rest = self._get(actions, gran, bucket)
+            last = max(self._last.get(action, float("-inf")) for action in actions)
+            if rest and last > end.timestamp():
+                # Something occurred after the end, count
+                # the rest using smaller buckets
+                rest = self._count_span(actions, bucket, end, granularities[i+1:])
+                if rest is None:
+                    return None
+            return total + rest
+        return None
+
+    def _get(self, actions, gran, bucket):
+        return sum(
+            self._counts.get(action, {}).get(gran, {}).get(bucket, 0)
+            for action in actions
+        )
+
+    def _prune(self, gran, current):
+        # Called with the lock held
+        retention = self.retention.get(gran)
+        if retention is None:
+            return
+        cutoff = self._floor(current - retention, gran)
+        for counts in self._counts.values():
+            buckets = counts.get(gran, {})
+            for bucket in [bucket for bucket in buckets if bucket < cutoff]:
+                del buckets[bucket]
+        if gran == "minute":
+            for boundaries in self._boundary.values():
+                for bucket in [bucket for bucket in boundaries if bucket < cutoff]:
+                    del boundaries[bucket]
+        if self._since is not None and self._since[gran] < cutoff:
+            self._since[gran] = cutoff
+
+    def _to_timezone(self, dt:datetime.datetime):
+        is_aware = dt.tzinfo is not None
+        if is_aware != (self.timezone is not None):
+            # Cannot compare naive and aware datetimes
+            return None
+        if is_aware:
+            dt = dt.astimezone(self.timezone)
+        return dt
+
+    @staticmethod
+    def _floor(dt:datetime.datetime, gran:str) -> datetime.datetime:
+        if gran == "minute":
+            return dt.replace(second=0, microsecond=0)
+        if gran == "hour":
+            return dt.replace(minute=0, second=0, microsecond=0)
+        day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        if gran == "day":
+            return day
+        if gran == "week":
+            return day - datetime.timedelta(days=day.weekday())
+        return day.replace(day=1)
+
+    @staticmethod
+    def _next(dt:datetime.datetime, gran:str) -> datetime.datetime:
+        if gran == "minute":
+            return dt + datetime.timedelta(minutes=1)
+        if gran == "hour":
+            return dt + datetime.timedelta(hours=1)
+        if gran == "day":
+            return dt + datetime.timedelta(days=1)
+        if gran == "week":
+            return dt + datetime.timedelta(weeks=1)
+        if dt.month == 12:
+            return dt.replace(year=dt.year + 1, month=1)
+        return dt.replace(month=dt.month + 1)
@@ -78,6 +78,22 @@ class BaseArgument(RedBase):
         """
         return self.get_value(**kwargs)
 
+    def release(self, value:Any, **kwargs):
+        """Release the value after the run of the
+        task has finished (succeeded, failed or
+        terminated). Override for custom behaviour
+        (ie. returning a resource to a pool).
+
+        Parameters
+        ----------
+        value : Any
+            Value that was got from ``get_value``.
+        task : rocketry.core.Task, optional
+            Task that used the value.
+        status : str, optional
+            How the run finished.
+        """
+
     def __eq__(self, other):
         if isinstance(other, type(self)):
             return self.get_value() == other.get_value()
@@ -1,11 +1,10 @@
 from collections.abc import Mapping
 from typing import Callable, Type, Union, TYPE_CHECKING
 from functools import partial
-import inspect
 
 from rocketry._base import RedBase
 from rocketry.core.utils import is_pickleable
-from rocketry.core.utils import filter_keyword_args
+from rocketry.core.utils import filter_keyword_args, get_func_plan
 
 from .arguments import BaseArgument
 
@@ -52,13 +51,12 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         # Get parameters from a function signature
         # ie.
         # def myfunc(task=Task(), session=Session()): ...
-        func_params = inspect.signature(__func).parameters
-        params = cls()
-        for name, param in func_params.items():
-            default = param.default
-            if isinstance(default, BaseArgument):
-                params[name] = default
-        return params
+        defaults = get_func_plan(__func).defaults
+        return cls({
+            name: default
+            for name, default in defaults.items()
+            if isinstance(default, BaseArgument)
+        })
 
 # For mapping interface
     def get(self, key, default=None):
@@ -103,13 +101,36 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         final values.
         """
 
-        return {
-            key:
-                value
-                if not isinstance(value, BaseArgument)
-                else value.get_value(*args, **get_kwargs(value.get_value, **kwargs))
-            for key, value in self._params.items()
-        }
+        values = {}
+        try:
+            for key, value in self._params.items():
+                values[key] = (
+                    value
+                    if not isinstance(value, BaseArgument)
+                    else _get_value(value, *args, **kwargs)
+                )
+        except Exception:
+            # Release the values got so far
+            self.release(values, **kwargs)
+            raise
+        return values
+
+    def release(self, values:dict, **kwargs):
+        """Release materialized values (after the
+        run has finished).
+
+        Parameters
+        ----------
+        values : dict
+            Values from ``materialize``.
+        **kwargs : dict
+            Passed to the arguments (ie. task
+            and status).
+        """
+        for key, value in values.items():
+            arg = self._params.get(key)
+            if isinstance(arg, BaseArgument):
+                arg.release(value, **kwargs)
 
     def __setitem__(self, key, item):
         "Set parameter value"
@@ -146,6 +167,28 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         # See: https://bugs.python.org/issue1121475
         return _func
 
+    def clear_cache(self, *keys, task=None):
+        """Clear the cached values of the arguments.
+
+        Parameters
+        ----------
+        *keys : str, Callable
+            Keys (or functions of ``FuncParam``) of
+            the arguments. By default all arguments.
+            Keys that are not parameters or that are
+            not arguments with a cache are skipped.
+        task : Task, str, optional
+            Clear only the values cached for the task.
+        """
+        keys = [
+            key.__rocketry__['param_name'] if callable(key) and "param_name" in getattr(key, "__rocketry__", {}) else key
+            for key in keys
+        ] if keys else list(self._params)
+        for key in keys:
+            value = self._params.get(key)
+            if isinstance(value, BaseArgument) and hasattr(value, "clear_cache"):
+                value.clear_cache(task=task)
+
     def __repr__(self):
         cls_name = type(self).__name__
         params = ', '.join(f'{name}={repr(arg)}' for name, arg in self._params.items())
@@ -213,4 +256,13 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
 def get_kwargs(__func, **kwargs) -> dict:
     "Get function arguments"
     sig_kwargs = Parameters._from_signature(__func).materialize(**kwargs)
-    return {**sig_kwargs, **kwargs}
\ No newline at end of file
+    return {**sig_kwargs, **kwargs}
+
+def _get_value(arg:BaseArgument, *args, **kwargs):
+    "Get the value of an argument (the arguments of its signature are released after)"
+    sig_params = Parameters._from_signature(arg.get_value)
+    sig_kwargs = sig_params.materialize(**kwargs)
+    try:
+        return arg.get_value(*args, **{**sig_kwargs, **kwargs})
+    finally:
+        sig_params.release(sig_kwargs, **kwargs)
\ No newline at end of file
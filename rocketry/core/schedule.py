@@ -90,6 +90,20 @@ class Scheduler(RedBase):
 
         self._log_queue = multiprocessing.Queue(-1)
 
+        # Tracks tasks that only depend on other tasks
+        # so that their conditions are checked only if
+        # the dependencies have changed
+        from rocketry.utils.dependencies import DependencyGraph
+        self._dependencies = DependencyGraph(self.session)
+
+        # Set when a task with dependents finishes to wake
+        # up the scheduler from hibernation (set in serve)
+        self._flag_wakeup = None
+        self._loop = None
+        # Updated by the tasks running in threads
+        self._pending_dependents = set()
+        self._pending_lock = threading.Lock()
+
     @property
     def tasks(self):
 
@@ -114,6 +128,8 @@ class Scheduler(RedBase):
         self._flag_enabled.set()
 
         self.is_alive = True
+        self._loop = asyncio.get_running_loop()
+        self._flag_wakeup = asyncio.Event()
         exception = None
         try:
             await self.startup()
@@ -170,35 +186,107 @@ class Scheduler(RedBase):
         hooker = _Hooker(self.session.hooks.scheduler_cycle)
         hooker.prerun(scheduler=self)
 
+        self._dependencies.refresh(tasks)
+        # All tasks are checked in this cycle anyways
+        self._pop_pending_dependents()
         for task in tasks:
-            with task.lock:
-                self.handle_logs()
-                task._clean_run_stack()
-                if task.on_startup or task.on_shutdown:
-                    # Startup or shutdown tasks are not run in main sequence
-                    pass
-                elif self._flag_enabled.is_set() and self.is_task_runnable(task):
-                    # Run the actual task
-                    await self.run_task(task)
-                    # Reset force_run as a run has forced
-                    task.force_run = False
-                await task._check_termination()
+            await self._check_task(task)
         self.handle_logs()
+        if self.session.config.dispatch_dependents == "same_cycle":
+            await self._run_pending_dependents()
         self.check_thread_errors()
         # Running hooks
         hooker.postrun()
 
         self.n_cycles += 1
 
+    async def _check_task(self, task:Task):
+        "Check whether to run or terminate a task"
+        with task.lock:
+            self.handle_logs()
+            task._clean_run_stack()
+            if task.on_startup or task.on_shutdown:
+                # Startup or shutdown tasks are not run in main sequence
+                pass
+            elif self._flag_enabled.is_set() and self.is_task_runnable(task):
+                # Run the actual task
+                await self.run_task(task)
+                # Reset force_run as a run has forced
+                task.force_run = False
+                # Launch the rest of the queued runs if
+                # the task can run parallel
+                while task._has_queued_runs() and self._allows_multilaunch(task) and self.is_task_runnable(task):
+                    await self.run_task(task)
+            await task._check_termination()
+
+    async def _run_pending_dependents(self):
+        "Check the tasks which dependencies finished during the cycle"
+        checked = set()
+        while True:
+            names = self._pop_pending_dependents() - checked
+            if not names:
+                break
+            tasks = [task for task in self.tasks if task.name in names]
+            for task in tasks:
+                await self._check_task(task)
+            checked.update(names)
+            self.handle_logs()
+
+    def _handle_task_action(self, task:Task, action:str):
+        "Handle a logged action of a task (called by the task)"
+        self._dependencies.mark_dirty(task)
+        dispatch = self.session.config.dispatch_dependents
+        if dispatch is None or action == "run":
+            return
+        children = self._dependencies.get_children(task)
+        if children:
+            with self._pending_lock:
+                self._pending_dependents.update(children)
+            self._wake_up()
+
+    def _pop_pending_dependents(self) -> set:
+        "Take the names of the pending dependents (thread-safe)"
+        with self._pending_lock:
+            pending, self._pending_dependents = self._pending_dependents, set()
+        return pending
+
+    def _wake_up(self):
+        "Wake up the scheduler from hibernation (thread-safe)"
+        loop = self._loop
+        flag = self._flag_wakeup
+        if loop is None or flag is None or loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            flag.set()
+        else:
+            loop.call_soon_threadsafe(flag.set)
+
     def check_shut_cond(self, cond: Optional[BaseCondition]) -> bool:
         # Note that failure in scheduler shut_cond always crashes the system
         if cond is None:
             return False
-        return cond.observe(scheduler=self, session=self.session)
+        with self.session.time_snapshot():
+            return cond.observe(scheduler=self, session=self.session)
 
     def check_task_cond(self, task:Task):
+        dependencies = self._dependencies
+        use_dependencies = not self.session.config.force_status_from_logs
         try:
-            return task.is_runnable()
+            if use_dependencies and not task._has_queued_runs() and dependencies.is_clean(task):
+                # None of the dependencies have changed since
+                # the condition was found false
+                return False
+            # Parents may finish (in threads) during the check
+            generation = dependencies.get_generation(task)
+            with self.session.time_snapshot():
+                is_runnable = task.is_runnable()
+            if use_dependencies and not task.disabled:
+                dependencies.set_state(task, is_runnable, generation=generation)
+            return is_runnable
         except Exception:
             self.logger.exception(f"Condition crashed for task '{task.name}'")
             if not self.session.config.silence_cond_check:
@@ -243,15 +331,21 @@ class Scheduler(RedBase):
             if not has_free_processors:
                 return False
         if execution in ("thread", "async", "process"):
-            if task.multilaunch is None:
-                allow_multilaunch = self.session.config.multilaunch
-            else:
-                allow_multilaunch = task.multilaunch
-            if not allow_multilaunch and task.is_alive():
+            if not self._allows_multilaunch(task) and task.is_alive():
+                return False
+            if task.job_queue is not None and task.n_alive >= task.job_queue.consumers:
                 return False
         is_condition = self.check_task_cond(task)
         return is_condition
 
+    def _allows_multilaunch(self, task:Task) -> bool:
+        "Whether the task can be run parallel"
+        if task.get_execution() not in ("thread", "async", "process"):
+            return False
+        if task.multilaunch is None:
+            return self.session.config.multilaunch
+        return task.multilaunch
+
     def handle_logs(self):
         """Handle the status queue and carries the logging on their behalf."""
         # TODO: This could be maybe done in the tasks
@@ -278,9 +372,10 @@ class Scheduler(RedBase):
                     record.exc_text = record.exc_text
                     if record.exc_text is not None and record.exc_text not in record.message:
                         record.message = record.message + "\n" + record.message
-                elif record.action == "success":
+                elif record.action == "success" or hasattr(record, "__return__"):
                     # Take the return value from the record and delete
                     # Note that record has attr __return__ only if task running as process
+                    # (inaction has it only if it carries a return value)
                     return_value = record.__return__
                     task._handle_return(return_value)
                     del record.__return__
@@ -289,7 +384,15 @@ class Scheduler(RedBase):
     async def _hibernate(self):
         """Go to sleep and wake up when next task can be executed."""
         delay = self.session.config.cycle_sleep
-        if delay is not None:
+        flag = self._flag_wakeup
+        if delay is not None and flag is not None:
+            # Sleep but wake up earlier if a task with dependents finished
+            try:
+                await asyncio.wait_for(flag.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            flag.clear()
+        elif delay is not None:
             await asyncio.sleep(delay)
         else:
             # delay is None, sleep 0 to release the async execution
@@ -1,4 +1,5 @@
 import asyncio
+from contextvars import ContextVar
 from dataclasses import dataclass
 import inspect
 from pickle import PicklingError
@@ -21,14 +22,17 @@ except ImportError: # pragma: no cover
     from typing_extensions import Literal
 
 from pydantic import BaseModel, Field, PrivateAttr, validator
+from redbird.oper import greater_equal
 
 from rocketry._base import RedBase
 from rocketry.core.condition import BaseCondition, AlwaysFalse, All
 from rocketry.core.time import TimePeriod
 from rocketry.core.parameters import Parameters
-from rocketry.core.log import TaskAdapter
-from rocketry.pybox.time import to_timedelta
+from rocketry.core.log import TaskAdapter, ActionCounter
+from rocketry.pybox.time import to_timedelta, to_timestamp
 from rocketry.core.utils import is_pickleable, filter_keyword_args, is_main_subprocess
+from rocketry.core.utils.run_queue import RunQueue
+from rocketry.core.job_queue import Job, JobQueue
 from rocketry.exc import SchedulerRestart, SchedulerExit, TaskInactionException, TaskTerminationException, TaskLoggingError, TaskSetupError
 from rocketry.core.hook import _Hooker
 from rocketry.log import QueueHandler
@@ -39,17 +43,33 @@ if TYPE_CHECKING:
 
 _IS_WINDOWS = platform.system()
 
+# Run that is executing in the current context
+# (thread or asyncio task)
+_CURRENT_RUN: ContextVar = ContextVar("current_run", default=None)
+
+# Marks that a run has no return value
+_NO_RETURN = object()
+
 def _create_session():
     # To avoid circular imports
     from rocketry import Session
     return Session()
 
+def _to_dict(params) -> dict:
+    "Get the parameters as dict (without materializing)"
+    if params is None:
+        return {}
+    if isinstance(params, Parameters):
+        return params._params
+    return params
+
 @dataclass
 class TaskRun:
 
     start: float
     task: Union[asyncio.Task, threading.Thread, multiprocessing.Process, None]
     run_id: str = None
+    job: Optional[Job] = None
 
     # Thread related
     event_terminate: Optional[threading.Event] = None
@@ -160,6 +180,23 @@ class Task(RedBase, BaseModel):
         Whether run the task as daemon process
         or not. Only applicable for execution='process',
         by default use Scheduler default
+    coalesce_runs : bool
+        If True, a run set with ``run()`` is not queued
+        if a run with identical parameters is already
+        queued, by default False
+    max_queued_runs : int, optional
+        Maximum number of runs queued with ``run()``,
+        by default unlimited
+    on_queue_full : str
+        What to do if ``run()`` is called when the
+        queue is full: 'raise' (TaskRunQueueFull),
+        'drop' (the new run) or 'drop_oldest',
+        by default 'raise'
+    job_queue : rocketry.core.job_queue.JobQueue, optional
+        Durable queue the runs are consumed from. The
+        task is run when the queue has jobs and each
+        run gets the parameters of a job. ``run()``
+        puts a job to the queue.
     on_exists : str
         What to do if the name of the task already
         exists in the session, options: 'raise',
@@ -212,10 +249,14 @@ class Task(RedBase, BaseModel):
     fmt_log_message: str = r"Task '{task}' status: '{action}'"
 
     daemon: Optional[bool]
-    batches: List[Parameters] = Field(
-        default_factory=list,
+    batches: RunQueue = Field(
+        default_factory=RunQueue,
         description="Run batches (parameters). If not empty, run is triggered regardless of starting condition"
     )
+    coalesce_runs: bool = False
+    max_queued_runs: Optional[int] = None
+    on_queue_full: Literal['raise', 'drop', 'drop_oldest'] = 'raise'
+    job_queue: Optional[JobQueue] = None
 
     # Instance
     name: Optional[str] = Field(description="Name of the task. Must be unique")
@@ -246,6 +287,8 @@ class Task(RedBase, BaseModel):
     _last_inaction: Optional[float]
     _last_crash: Optional[float]
 
+    _action_counter: ActionCounter = PrivateAttr(default_factory=ActionCounter)
+    _due_cache: Dict[tuple, Any] = PrivateAttr(default_factory=dict)
     _run_stack: List[TaskRun] = PrivateAttr(default_factory=list)
     _lock: Optional[Type] = PrivateAttr(default=None)
     _main_alive: bool = PrivateAttr(default=False)
@@ -371,6 +414,12 @@ class Task(RedBase, BaseModel):
             raise ValueError(f"Task name '{value}' already exists. Please pick another")
         return value
 
+    @validator('batches', pre=True)
+    def parse_batches(cls, value):
+        if isinstance(value, RunQueue):
+            return value
+        return RunQueue(value)
+
     @validator('parameters', pre=True)
     def parse_parameters(cls, value):
         if isinstance(value, Parameters):
@@ -381,7 +430,7 @@ class Task(RedBase, BaseModel):
     def parse_force_run(cls, value, values):
         if value:
             warnings.warn("Attribute 'force_run' is deprecated. Please use method set_running() instead", DeprecationWarning)
-            values['batches'].append(Parameters())
+            values['batches'].put(Parameters())
         return value
 
     def __hash__(self):
@@ -408,7 +457,15 @@ class Task(RedBase, BaseModel):
             params.update(_params)
         if kwargs:
             params.update(kwargs)
-        self.batches.append(params)
+        if self.job_queue is not None:
+            self.job_queue.put(_to_dict(params))
+            return
+        self.batches.put(
+            params,
+            coalesce=self.coalesce_runs,
+            maxsize=self.max_queued_runs,
+            on_full=self.on_queue_full,
+        )
 
     def delete(self):
         """Delete the task from the session.
@@ -481,8 +538,12 @@ class Task(RedBase, BaseModel):
             self.force_run = False
             params = self.get_extra_params(params, execution=execution)
             direct_params = self._get_direct_params()
+            if self.job_queue is not None:
+                task_run.job = self.job_queue.claim()
+                if task_run.job is not None:
+                    direct_params.update(task_run.job.params)
 
-            task_run.run_id = self.get_run_id(task_run, params=params | direct_params)
+            task_run.run_id = self.get_run_id(task_run, params=Parameters({**_to_dict(params), **_to_dict(direct_params)}))
 
             # Run the actual task
             if execution in ("main", "async"):
@@ -557,7 +618,7 @@ class Task(RedBase, BaseModel):
         #    set_pending() : Set forced_state to False
         #    resume() : Reset forced_state to None
         #    set_running() : Set forced_state to True
-        forced_run = bool(self.batches)
+        forced_run = self._has_queued_runs()
         if forced_run:
             return True
         if self.disabled:
@@ -567,6 +628,12 @@ class Task(RedBase, BaseModel):
 
         return cond
 
+    def _has_queued_runs(self) -> bool:
+        "Whether there are runs waiting in the queues"
+        if self.batches:
+            return True
+        return self.job_queue is not None and self.job_queue.has_ready()
+
     def run_as_main(self, params:Parameters):
         self.log_running()
         return self._run_as_main(params, direct_params=self.get_task_params())
@@ -589,14 +656,18 @@ class Task(RedBase, BaseModel):
         output = None
         exc_info = (None, None, None)
         params = self.postfilter_params(params)
-        params = Parameters(params) | Parameters(direct_params)
-        params = params.materialize(task=self, session=self.session)
+        params = Parameters({**_to_dict(params), **_to_dict(direct_params)})
+        values = params.materialize(task=self, session=self.session)
 
+        token = _CURRENT_RUN.set(task_run)
         try:
+            if self.job_queue is not None and task_run.job is None:
+                # Another consumer took the job
+                raise TaskInactionException()
             if inspect.iscoroutinefunction(self.execute):
-                output = await self.execute(**params)
+                output = await self.execute(**values)
             else:
-                output = self.execute(**params)
+                output = self.execute(**values)
 
             # NOTE: we process success here in case the process_success
             # fails (therefore task fails)
@@ -610,11 +681,15 @@ class Task(RedBase, BaseModel):
             # Note that these are never silenced
             raise
 
-        except TaskInactionException:
+        except TaskInactionException as exc:
             # Task did not fail, it did not succeed:
             #   The task started but quickly determined was not needed to be run
             #   and therefore the purpose of the task was not executed.
-            self.log_inaction(task_run)
+            # The exception may still carry a return value (ie. cached)
+            return_value = getattr(exc, "return_value", _NO_RETURN)
+            if return_value is not _NO_RETURN and execution != 'process':
+                self._handle_return(return_value)
+            self.log_inaction(task_run, return_value=return_value)
             status = "inaction"
             exc_info = sys.exc_info()
 
@@ -652,7 +727,12 @@ class Task(RedBase, BaseModel):
             return output
 
         finally:
+            params.release(values, task=self, session=self.session, status=status)
+            if task_run.job is not None:
+                error = repr(exc_info[1]) if exc_info[1] is not None else None
+                self.job_queue.finish(task_run.job, status=status, error=error)
             self.process_finish(status=status)
+            _CURRENT_RUN.reset(token)
             hooker.postrun(*exc_info)
 
     def run_as_thread(self, params:Parameters, direct_params, task_run:TaskRun, **kwargs):
@@ -790,20 +870,23 @@ class Task(RedBase, BaseModel):
         Parameters
             Additional parameters
         """
-        passed_params = Parameters(params)
-        session_params = self.session.parameters
-        extra_params = Parameters(_session_=self.session, _task_=self, **kwargs)
+        # Assembled to one dict (in order of priority)
+        params = {
+            **_to_dict(self.session.parameters),
+            **_to_dict(params),
+            "_session_": self.session,
+            "_task_": self,
+            **kwargs,
+        }
         if execution == "thread":
-            extra_params['_thread_terminate_'] = threading.Event()
-
-        params = Parameters(self.prefilter_params(session_params | passed_params | extra_params))
+            params['_thread_terminate_'] = threading.Event()
 
-        return params
+        return Parameters(self.prefilter_params(Parameters(params)))
 
     def _get_direct_params(self):
         direct_params = self.get_task_params()
         if self.batches:
-            direct_params.update(self.batches.pop(0))
+            direct_params.update(self.batches.get())
         return direct_params
 
     def get_task_params(self):
@@ -924,6 +1007,7 @@ class Task(RedBase, BaseModel):
         self._last_terminate = self._get_last_action("terminate", from_logs=True, logger=logger)
         self._last_inaction = self._get_last_action("inaction", from_logs=True, logger=logger)
         self._last_crash = self._get_last_action("crash", from_logs=True, logger=logger)
+        self._set_cached_counts(logger=logger)
 
         times = {
             name: getattr(self, f"_last_{name}")
@@ -941,11 +1025,30 @@ class Task(RedBase, BaseModel):
             else:
                 self.status = status
 
+    def _set_cached_counts(self, logger=None):
+        "Rebuild the action counts of the current month and week from the logs"
+        logger = logger if logger is not None else self.logger
+        now = self.session._get_datetime_now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        since = min(today.replace(day=1), today - datetime.timedelta(days=today.weekday()))
+        counter = ActionCounter()
+        try:
+            records = logger.get_records(created=greater_equal(to_timestamp(since)))
+            counter.rebuild(records, since=since, timezone=self.session.config.timezone)
+        except AttributeError:
+            # Logs not readable, counts are not complete
+            counter = ActionCounter()
+        self._action_counter = counter
+
     def get_default_name(self, **kwargs):
         """Create a name for the task when name was not passed to initiation of
         the task. Override this method."""
         raise NotImplementedError(f"Method 'get_default_name' not implemented to {type(self)}")
 
+    def get_current_run(self) -> Optional[TaskRun]:
+        "Get the run of the task that is executing in the current context"
+        return _CURRENT_RUN.get()
+
     def get_run_id(self, run, params=None):
         if self.func_run_id is not None:
             return self.func_run_id(self, params)
@@ -972,7 +1075,8 @@ class Task(RedBase, BaseModel):
     async def _check_termination(self):
         "Terminate task if can"
         try:
-            is_end_cond = self.end_cond.observe(task=self, session=self.session)
+            with self.session.time_snapshot():
+                is_end_cond = self.end_cond.observe(task=self, session=self.session)
         except Exception:
             if not self.session.config.silence_cond_check:
                 raise
@@ -1093,9 +1197,9 @@ class Task(RedBase, BaseModel):
         # Reset event and force_termination (for threads)
         self.force_termination = False
 
-    def log_inaction(self, task_run:TaskRun=None):
+    def log_inaction(self, task_run:TaskRun=None, return_value=_NO_RETURN):
         """Make a log that the task did nothing."""
-        self._set_status("inaction", task_run)
+        self._set_status("inaction", task_run, return_value=return_value)
 
     def log_crash(self, task_run:TaskRun=None):
         """Make a log that the task had previously crashed"""
@@ -1106,7 +1210,6 @@ class Task(RedBase, BaseModel):
         Also sets the status according to the record.
         """
         # Set last_run/last_success/last_fail etc.
-        cache_attr = f"_last_{record.action}"
         record_time = record.created
 
         try:
@@ -1115,17 +1218,16 @@ class Task(RedBase, BaseModel):
             if record.action == "run":
                 # The task started and the run must be set
                 # even though the task partly failed already
-                setattr(self, cache_attr, record_time)
-                self.status = record.action
+                self._cache_action(record.action, record_time)
             else:
                 # Logging is part of the task so even if the task
                 # function itself succeeded, the task failed
-                setattr(self, "_last_fail", record_time)
-                self.status = "fail"
+                self._cache_action("fail", record_time)
+            self._notify_scheduler(self.status)
             raise TaskLoggingError(f"Logging for task '{self.name}' failed.") from exc
         else:
-            setattr(self, cache_attr, record_time)
-            self.status = record.action
+            self._cache_action(record.action, record_time)
+            self._notify_scheduler(self.status)
 
     def get_status(self) -> Literal['run', 'fail', 'success', 'terminate', 'inaction', None]:
         """Get latest status of the task."""
@@ -1168,14 +1270,13 @@ class Task(RedBase, BaseModel):
         extra['run_id'] = task_run.run_id if task_run is not None else None
 
         is_running_as_child = self.logger.name.endswith("._process")
-        if is_running_as_child and action == "success":
+        has_return = action == "success" or (action == "inaction" and return_value is not _NO_RETURN)
+        if is_running_as_child and has_return:
             # If child process, the return value is passed via QueueHandler to the main process
             # and it's handled then in Scheduler.
             # Else the return value is handled in Task itself (__call__ & _run_as_thread)
             extra["__return__"] = return_value
 
-        cache_attr = f"_last_{action}"
-
         log_method = self.logger.exception if action == "fail" else self.logger.info
         try:
             log_method(
@@ -1184,15 +1285,27 @@ class Task(RedBase, BaseModel):
             )
         except Exception as exc:
             if action == "run":
-                setattr(self, cache_attr, time_now)
-                self.status = action
+                self._cache_action(action, time_now)
             else:
-                setattr(self, "_last_fail", time_now)
-                self.status = "fail"
+                self._cache_action("fail", time_now)
+            self._notify_scheduler(self.status)
             raise TaskLoggingError(f"Logging for task '{self.name}' failed.") from exc
         else:
-            setattr(self, cache_attr, time_now)
-            self.status = action
+            self._cache_action(action, time_now)
+            self._notify_scheduler(self.status)
+
+    def _cache_action(self, action:str, timestamp:float):
+        "Set the status and update the cached action times and counts"
+        setattr(self, f"_last_{action}", timestamp)
+        self.status = action
+        if self._action_counter is not None:
+            self._action_counter.add(action, timestamp)
+
+    def _notify_scheduler(self, action:str):
+        "Notify the scheduler that the task logged an action"
+        scheduler = getattr(self.session, "scheduler", None)
+        if scheduler is not None:
+            scheduler._handle_task_action(self, action)
 
     def get_last_success(self) -> datetime.datetime:
         """Get the lastest timestamp when the task succeeded."""
@@ -1300,6 +1413,7 @@ class Task(RedBase, BaseModel):
         priv_attrs['_process'] = None
         priv_attrs['_thread'] = None
         priv_attrs['_run_stack'] = None
+        priv_attrs['_action_counter'] = None
 
         # We also get rid of the conditions as if there is a task
         # containing an attr that cannot be pickled (like FuncTask
@@ -4,6 +4,8 @@ from .base import (
     TimeDelta,
     StaticInterval,
     All, Any,
+    NoOverlapError,
+    CachedPeriod,
 
     PARSERS,
 
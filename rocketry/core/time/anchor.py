@@ -1,10 +1,31 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import ClassVar, Dict, List, Tuple, Union
 from abc import abstractmethod
 from dataclasses import dataclass
 
-from rocketry.pybox.time import to_microseconds, timedelta_to_str, datetime_to_dict, to_timedelta
-from .base import Any, TimeInterval
+from rocketry.pybox.time import to_microseconds, timedelta_to_str, datetime_to_dict, to_timedelta, Interval
+from .base import EPOCH, Any, TimeInterval, import_numpy
+
+def to_epoch_us(dt:datetime) -> int:
+    """Turn the wall clock time of a datetime to
+    microseconds from 0001-01-01 (a Monday).
+    The timezone offset is not applied."""
+    seconds = ((dt.toordinal() - 1) * 24 + dt.hour) * 3600 + dt.minute * 60 + dt.second
+    return seconds * 1_000_000 + dt.microsecond
+
+def shift_us(dt:datetime, us:int) -> datetime:
+    "Shift datetime by microseconds"
+    if not us:
+        return dt
+    seconds, us = divmod(us, 1_000_000)
+    return dt + timedelta(0, seconds, us)
+
+def to_day_us(dt:datetime) -> int:
+    "Turn the time of day of a datetime to microseconds"
+    return ((dt.hour * 60 + dt.minute) * 60 + dt.second) * 1_000_000 + dt.microsecond
+
+# Microseconds from 0001-01-01 to the epoch of the batch methods
+EPOCH_US = to_epoch_us(EPOCH)
 
 @dataclass(frozen=True, repr=False)
 class AnchoredInterval(TimeInterval):
@@ -96,6 +117,10 @@ class AnchoredInterval(TimeInterval):
 
     def anchor_dt(self, dt: datetime, **kwargs) -> int:
         "Turn datetime to nanoseconds according to the scope (by removing higher time elements)"
+        if self._scope in self._fixed_components:
+            # The scope has fixed length thus the time on
+            # the scope is the remainder from the epoch
+            return to_epoch_us(dt) % self._scope_max
         components = self.components
         components = components[components.index(self._scope) + 1:]
         d = datetime_to_dict(dt)
@@ -190,17 +215,16 @@ class AnchoredInterval(TimeInterval):
 
     def __contains__(self, dt) -> bool:
         "Whether dt is in the interval"
-
-        ms_start = self._start
-        ms_end = self._end
-
         if self.is_full():
             # As there is no time in between,
             # the interval is considered full
             # cycle (ie. from 10:00 to 10:00)
             return True
+        return self._contains_ms(self.anchor_dt(dt))
 
-        ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+    def _contains_ms(self, ms:int) -> bool:
+        ms_start = self._start
+        ms_end = self._end
 
         is_over_period = ms_start > ms_end # period is overnight, over weekend etc.
         if not is_over_period:
@@ -235,7 +259,73 @@ class AnchoredInterval(TimeInterval):
 
     def next_start(self, dt):
         "Get next start point of the period"
-        ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return shift_us(dt, self._next_start_offset(dt, self.anchor_dt(dt)))
+
+    def next_end(self, dt):
+        "Get next end point of the period"
+        return shift_us(dt, self._next_end_offset(dt, self.anchor_dt(dt)))
+
+    def prev_start(self, dt):
+        "Get previous start point of the period"
+        return shift_us(dt, self._prev_start_offset(dt, self.anchor_dt(dt)))
+
+    def prev_end(self, dt):
+        "Get pervious end point of the period"
+        return shift_us(dt, self._prev_end_offset(dt, self.anchor_dt(dt)))
+
+    def rollforward(self, dt) -> Interval:
+        "Get next time interval of the period"
+        # The interval is calculated in microseconds
+        # relative to dt and turned to datetimes last
+        ms = self.anchor_dt(dt)
+        end = self._next_end_offset(dt, ms)
+        if self.is_full():
+            # Full period so dt always belongs on it
+            start = 0
+            if end == start:
+                # Expanding the interval
+                dt_next = dt + self.resolution
+                end = self._next_end_offset(dt_next, self.anchor_dt(dt_next)) + 1
+        else:
+            start = 0 if self._contains_ms(ms) else self._next_start_offset(dt, ms)
+            if start == end:
+                # The interval is left closed so this should
+                # not contain any points. We look for another
+                # one
+                return self.rollforward(shift_us(dt, end) + self.resolution)
+        return Interval(
+            shift_us(dt, start),
+            shift_us(dt, end),
+            closed="left"
+        )
+
+    def rollback(self, dt) -> Interval:
+        "Get previous time interval of the period"
+        ms = self.anchor_dt(dt)
+        start = self._prev_start_offset(dt, ms)
+        closed = "left"
+        if self.is_full():
+            # Full period so dt always belongs on it
+            end = 0
+            if end == start:
+                # Expanding the interval
+                dt_prev = dt - self.resolution
+                start = self._prev_start_offset(dt_prev, self.anchor_dt(dt_prev)) - 1
+        else:
+            end = 0 if self._contains_ms(ms) else self._prev_end_offset(dt, ms)
+            if start == end:
+                # The interval is left closed but the start
+                # is included in the interval. Therefore
+                # we include a single point (both sides closed)
+                closed = "both"
+        return Interval(
+            shift_us(dt, start),
+            shift_us(dt, end),
+            closed=closed
+        )
+
+    def _next_start_offset(self, dt, ms:int) -> int:
+        "Get microseconds from dt (anchored as ms) to the next start"
         ms_start = self._start
         ms_end = self._end
 
@@ -254,7 +344,7 @@ class AnchoredInterval(TimeInterval):
             #            dt
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
-            offset = to_timedelta(int(ms_start) - int(ms), unit="microsecond")
+            return int(ms_start) - int(ms)
         else:
             # not in period, later than start
             #      dt
@@ -271,12 +361,10 @@ class AnchoredInterval(TimeInterval):
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
             ms_scope = self.get_scope_forward(dt)
-            offset = to_timedelta(int(ms_start) - int(ms) + ms_scope, unit="microsecond")
-        return dt + offset
+            return int(ms_start) - int(ms) + ms_scope
 
-    def next_end(self, dt):
-        "Get next end point of the period"
-        ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+    def _next_end_offset(self, dt, ms:int) -> int:
+        "Get microseconds from dt (anchored as ms) to the next end"
         ms_start = self._start
         ms_end = self._end
 
@@ -295,7 +383,7 @@ class AnchoredInterval(TimeInterval):
             #          dt
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
-            offset = to_timedelta(int(ms_end) - int(ms), unit="microsecond")
+            return int(ms_end) - int(ms)
         else:
             # not in period, over night
             #                     dt
@@ -312,12 +400,10 @@ class AnchoredInterval(TimeInterval):
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
             ms_scope = self.get_scope_forward(dt)
-            offset = to_timedelta(int(ms_end) - int(ms) + ms_scope, unit="microsecond")
-        return dt + offset
+            return int(ms_end) - int(ms) + ms_scope
 
-    def prev_start(self, dt):
-        "Get previous start point of the period"
-        ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+    def _prev_start_offset(self, dt, ms:int) -> int:
+        "Get microseconds from dt (anchored as ms) to the previous start"
         ms_start = self._start
 
         if ms < ms_start:
@@ -336,7 +422,7 @@ class AnchoredInterval(TimeInterval):
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
             ms_scope = self.get_scope_back(dt)
-            offset = to_timedelta(int(ms_start) - int(ms) - ms_scope, unit="microsecond")
+            return int(ms_start) - int(ms) - ms_scope
         else:
             # not in period, later than start
             #      dt
@@ -352,12 +438,10 @@ class AnchoredInterval(TimeInterval):
             #                    dt
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
-            offset = to_timedelta(int(ms_start) - int(ms), unit="microsecond")
-        return dt + offset
+            return int(ms_start) - int(ms)
 
-    def prev_end(self, dt):
-        "Get pervious end point of the period"
-        ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+    def _prev_end_offset(self, dt, ms:int) -> int:
+        "Get microseconds from dt (anchored as ms) to the previous end"
         ms_end = self._end
 
         if ms < ms_end:
@@ -376,7 +460,7 @@ class AnchoredInterval(TimeInterval):
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
             ms_scope = self.get_scope_back(dt)
-            offset = to_timedelta(int(ms_end) - int(ms) - ms_scope, unit="microsecond")
+            return int(ms_end) - int(ms) - ms_scope
         else:
             # not in period, over night
             #                     dt
@@ -392,9 +476,72 @@ class AnchoredInterval(TimeInterval):
             #       dt
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
-            offset = to_timedelta(int(ms_end) - int(ms), unit="microsecond")
+            return int(ms_end) - int(ms)
+
+    def anchor_many(self, us):
+        """Turn microseconds from epoch (1970-01-01) to
+        microseconds according to the scope (vectorized
+        anchor_dt). Returns None if not supported
+        by the period (the scalar methods are used)."""
+        if self._scope in self._fixed_components:
+            return (us + EPOCH_US) % self._scope_max
+        return None
+
+    def _get_scope_forward_many(self, us):
+        "Override if offsetting forward depends on time"
+        return self._scope_max
 
-        return dt + offset
+    def _contains_many(self, us):
+        np = import_numpy()
+        if self.is_full():
+            return np.ones(len(us), dtype=bool)
+        ms = self.anchor_many(us)
+        if ms is None:
+            return super()._contains_many(us)
+        return self._contains_ms_many(ms)
+
+    def _contains_ms_many(self, ms):
+        ms_start = int(self._start)
+        ms_end = int(self._end)
+        if ms_start <= ms_end:
+            return (ms_start <= ms) & (ms < ms_end)
+        return (ms >= ms_start) | (ms < ms_end)
+
+    def _rollforward_many(self, us):
+        # Same as rollforward but for all of the
+        # times simultaneously
+        np = import_numpy()
+        ms = self.anchor_many(us)
+        if ms is None:
+            return super()._rollforward_many(us)
+
+        ms_start = int(self._start)
+        ms_end = int(self._end)
+        scope = self._get_scope_forward_many(us)
+        end = np.where(ms < ms_end, ms_end - ms, ms_end - ms + scope)
+        if self.is_full():
+            # Full period so dt always belongs on it
+            start = np.zeros(len(us), dtype=np.int64)
+            empty = end == start
+            if empty.any():
+                # Expanding the interval
+                _, next_end = self._rollforward_many(us[empty] + 1)
+                end[empty] = next_end - us[empty]
+        else:
+            start = np.where(
+                self._contains_ms_many(ms),
+                0,
+                np.where(ms < ms_start, ms_start - ms, ms_start - ms + scope)
+            )
+            empty = start == end
+            if empty.any():
+                # The interval is left closed so this should
+                # not contain any points. We look for another
+                # one
+                next_start, next_end = self._rollforward_many(us[empty] + end[empty] + 1)
+                start[empty] = next_start - us[empty]
+                end[empty] = next_end - us[empty]
+        return us + start, us + end
 
     def repr_ms(self, n:int):
         "Microseconds to representative format"
@@ -7,10 +7,25 @@ import itertools
 from dataclasses import dataclass, field
 
 from rocketry._base import RedBase
-from rocketry.pybox.time import to_datetime, to_timedelta, Interval
+from rocketry.pybox.time import to_datetime, to_timedelta, Interval, IntervalSet
 
 PARSERS: Dict[Union[str, Pattern], Union[Callable, 'TimePeriod']] = {}
 
+# Times in the batch methods are microseconds from this
+EPOCH = datetime.datetime(1970, 1, 1)
+DAY_US = 24 * 60 * 60 * 1_000_000
+
+class NoOverlapError(ValueError):
+    "Time periods have no overlapping interval within the search horizon"
+
+def import_numpy():
+    "Import NumPy (optional dependency of the batch methods)"
+    try:
+        import numpy
+    except ImportError as exc: # pragma: no cover
+        raise ImportError("NumPy is required for the batch methods. Install it with 'pip install numpy'") from exc
+    return numpy
+
 @dataclass(frozen=True)
 class TimePeriod(RedBase):
     """Base for all classes that represent a time period.
@@ -69,6 +84,98 @@ class TimePeriod(RedBase):
         "Get previous time interval of the period."
         raise NotImplementedError
 
+    def contains_many(self, times):
+        """Check which of the times are on the period.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        times : array-like of numpy.datetime64 or datetime.datetime
+            Times to check. Timezone naive (wall clock).
+
+        Returns
+        -------
+        numpy.ndarray of bool
+        """
+        np = import_numpy()
+        times = np.asarray(times, dtype="datetime64[us]")
+        us = times.reshape(-1).astype(np.int64)
+        return self._contains_many(us).reshape(times.shape)
+
+    def next_starts(self, times):
+        """Get the next start of the period
+        (or the time itself if on the period)
+        for each of the times.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        times : array-like of numpy.datetime64 or datetime.datetime
+            Times to roll forward. Timezone naive (wall clock).
+
+        Returns
+        -------
+        numpy.ndarray of numpy.datetime64
+        """
+        np = import_numpy()
+        times = np.asarray(times, dtype="datetime64[us]")
+        us = times.reshape(-1).astype(np.int64)
+        start, _ = self._rollforward_many(us)
+        return start.astype("datetime64[us]").reshape(times.shape)
+
+    def _contains_many(self, us):
+        # Override for vectorized version
+        np = import_numpy()
+        return np.array([_from_us(t) in self for t in us.tolist()], dtype=bool)
+
+    def _rollforward_many(self, us):
+        # Override for vectorized version
+        # Returns starts and ends as microseconds
+        np = import_numpy()
+        intervals = [self.rollforward(_from_us(t)) for t in us.tolist()]
+        start = np.array([_to_us(interval.left) for interval in intervals], dtype=np.int64)
+        end = np.array([_to_us(interval.right) for interval in intervals], dtype=np.int64)
+        return start, end
+
+    def get_intervals(self, start, end) -> IntervalSet:
+        """Get the intervals of the period between
+        start and end (end exclusive)."""
+        intervals = []
+        dt = start
+        while dt < end:
+            interval = self.rollforward(dt)
+            if interval.left >= end:
+                break
+            if interval.right > end:
+                closed = "left" if interval.closed in ('left', 'both') else "neither"
+                interval = Interval(interval.left, end, closed=closed)
+            intervals.append(interval)
+            # Make sure we always move forward
+            dt = max(interval.right, dt + self.resolution)
+        return IntervalSet(intervals)
+
+def split_many(us):
+    """Split microseconds from epoch (batch methods) to
+    months from epoch, days from month start and
+    microseconds from day start"""
+    np = import_numpy()
+    days = us // DAY_US
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    return months, days - month_start_many(months), us - days * DAY_US
+
+def month_start_many(months):
+    "Get the days from epoch to the start of the months (months from epoch)"
+    np = import_numpy()
+    return months.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+
+def _from_us(us:int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(microseconds=us)
+
+def _to_us(dt:datetime.datetime) -> int:
+    return (dt.replace(tzinfo=None) - EPOCH) // datetime.timedelta(microseconds=1)
+
 class TimeInterval(TimePeriod):
     """Base for all time intervals
 
@@ -254,7 +361,21 @@ class TimeDelta(TimePeriod):
         return f"TimeDelta(past={repr(self.past)}, future={repr(self.future)})"
 
 def all_overlap(times:List[Interval]):
-    return all(a.overlaps(b) for a, b in itertools.combinations(times, 2))
+    # All intervals overlap pairwise only if the
+    # interval that starts last overlaps with the
+    # interval that ends first (if they are not
+    # touching each other). Checking that is O(n).
+    start = max(interval.left for interval in times)
+    end = min(interval.right for interval in times)
+    if start < end:
+        return True
+    if start > end:
+        return False
+    return all(
+        a.overlaps(b)
+        for a in times if a.left == start
+        for b in times if b.right == end
+    )
 
 def get_overlapping(times):
     # Example:
@@ -271,10 +392,25 @@ def get_overlapping(times):
 
 @dataclass(frozen=True)
 class All(TimePeriod):
+    """Intersection of time periods.
+
+    Parameters
+    ----------
+    *args : TimePeriod
+        Time periods to intersect.
+    horizon : datetime.timedelta, optional
+        How far the overlapping interval is
+        searched before raising NoOverlapError.
+        By default, the class attribute ``horizon``.
+    """
 
     periods: FrozenSet[TimePeriod]
+    horizon: ClassVar[datetime.timedelta] = datetime.timedelta(days=366 * 50)
+    # Max number of intervals swept to check whether
+    # the periods with a fixed cycle ever overlap
+    max_sweep: ClassVar[int] = 20_000
 
-    def __init__(self, *args):
+    def __init__(self, *args, horizon=None):
         if any(not isinstance(arg, TimePeriod) for arg in args):
             raise TypeError("Only TimePeriods supported")
         if not args:
@@ -293,71 +429,159 @@ class All(TimePeriod):
                 periods.append(arg)
 
         object.__setattr__(self, "periods", frozenset(periods))
+        if horizon is not None:
+            # Not a field (not part of equality)
+            object.__setattr__(self, "horizon", to_timedelta(horizon))
 
     def rollback(self, dt):
 
         # We solve this iteratively
         # 1. rollback
         # 2. check if everything overlaps
-        # 3. If not overlaps, take max and check again
+        # 3. If not overlaps, take min of the ends and check again
         # 4. If overlaps, get the period that overlaps
-
-        intervals = [
-            period.rollback(dt)
-            for period in self.periods
-        ]
-        all_overlaps = all(a.overlaps(b) for a, b in itertools.combinations(intervals, 2))
-        if all_overlaps:
-            return reduce(lambda a, b: a & b, intervals)
-        # Not found, trying again with next period
-        # Example:
-        # Current:                     |
-        # A:         <-------------->
-        # B:         <---> <--->
-        # C:         <------>
-        # Next try:         |
-        next_dt = min(intervals, key=lambda x: x.right).right
-
-        opened = any(
-            interv.closed not in ('right', 'both')
-            for interv in intervals
-            if interv.right == next_dt
-        )
-        # TODO: If
-        if dt == next_dt:
-            next_dt -= self.resolution
-        return self.rollback(next_dt)
+        limit = self._get_limit(dt, forward=False)
+        origin = dt
+        while True:
+            intervals = [
+                period.rollback(dt)
+                for period in self.periods
+            ]
+            if all_overlap(intervals):
+                return reduce(lambda a, b: a & b, intervals)
+            if self._never_overlap(dt):
+                raise self._no_overlap(origin, limit)
+            # Not found, trying again with next period
+            # Example:
+            # Current:                     |
+            # A:         <-------------->
+            # B:         <---> <--->
+            # C:         <------>
+            # Next try:         |
+            next_dt = min(intervals, key=lambda x: x.right).right
+            if next_dt >= dt:
+                # Make sure we always move
+                next_dt = dt - self.resolution
+            if next_dt < limit:
+                raise self._no_overlap(origin, limit)
+            dt = next_dt
 
     def rollforward(self, dt):
         # We solve this iteratively
         # 1. rollforward
         # 2. check if everything overlaps
-        # 3. If not overlaps, take max and check again
+        # 3. If not overlaps, take max of the starts and check again
         # 4. If overlaps, get the period that overlaps
-
-        intervals = [
-            period.rollforward(dt)
-            for period in self.periods
-        ]
-        all_overlaps = all(a.overlaps(b) for a, b in itertools.combinations(intervals, 2))
-        if all_overlaps:
-            return reduce(lambda a, b: a & b, intervals)
-        # Not found, trying again with next period
-        # Example:
-        # Current: |
-        # A:         <-------------->
-        # B:         <---> <--->
-        # C:                 <------>
-        # Next try:          |
-        next_dt = max(intervals, key=lambda x: x.left).left
-        opened = any(
-            interv.closed not in ('left', 'both')
-            for interv in intervals
-            if interv.left == next_dt
+        limit = self._get_limit(dt, forward=True)
+        origin = dt
+        while True:
+            intervals = [
+                period.rollforward(dt)
+                for period in self.periods
+            ]
+            if all_overlap(intervals):
+                return reduce(lambda a, b: a & b, intervals)
+            if self._never_overlap(dt):
+                raise self._no_overlap(origin, limit)
+            # Not found, trying again with next period
+            # Example:
+            # Current: |
+            # A:         <-------------->
+            # B:         <---> <--->
+            # C:                 <------>
+            # Next try:          |
+            next_dt = max(intervals, key=lambda x: x.left).left
+            opened = any(
+                interv.closed not in ('left', 'both')
+                for interv in intervals
+                if interv.left == next_dt
+            )
+            if opened:
+                next_dt -= self.resolution
+            if next_dt <= dt:
+                # Make sure we always move
+                next_dt = dt + self.resolution
+            if next_dt > limit:
+                raise self._no_overlap(origin, limit)
+            dt = next_dt
+
+    def _contains_many(self, us):
+        return reduce(lambda a, b: a & b, (period._contains_many(us) for period in self.periods))
+
+    def _rollforward_many(self, us):
+        # Same as rollforward but for all of the
+        # times simultaneously
+        np = import_numpy()
+        periods = list(self.periods)
+        start = np.empty_like(us)
+        end = np.empty_like(us)
+        limit = us + self.horizon // datetime.timedelta(microseconds=1)
+        idx = np.arange(len(us))
+        curr = us.copy()
+        while len(idx):
+            intervals = [period._rollforward_many(curr) for period in periods]
+            lefts = np.max([left for left, _ in intervals], axis=0)
+            rights = np.min([right for _, right in intervals], axis=0)
+            overlaps = lefts < rights
+            start[idx[overlaps]] = lefts[overlaps]
+            end[idx[overlaps]] = rights[overlaps]
+
+            # Not found, trying again from the
+            # latest start (always moving)
+            keep = ~overlaps
+            idx = idx[keep]
+            if len(idx) and self._never_overlap(_from_us(int(us[idx[0]]))):
+                raise self._no_overlap(_from_us(int(us[idx[0]])), _from_us(int(limit[idx[0]])))
+            curr = np.maximum(lefts[keep], curr[keep] + 1)
+            if (curr > limit[idx]).any():
+                pos = int(np.argmax(curr > limit[idx]))
+                raise self._no_overlap(_from_us(int(us[idx[pos]])), _from_us(int(limit[idx[pos]])))
+        return start, end
+
+    def get_intervals(self, start, end) -> IntervalSet:
+        # Sweep the intervals of each period
+        return reduce(
+            lambda a, b: a & b,
+            (period.get_intervals(start, end) for period in self.periods)
         )
-        if opened:
-            next_dt -= self.resolution
-        return self.rollforward(next_dt)
+
+    def _never_overlap(self, dt) -> bool:
+        """Check whether the periods that repeat in a
+        fixed cycle (ie. TimeOfHour, TimeOfDay) have no
+        overlap at all.
+
+        The intersection of such periods repeats with the
+        longest of the cycles thus if the intersection is
+        empty in one cycle, it is empty everywhere. The
+        result is cached as it does not depend on dt.
+        """
+        never = self.__dict__.get("_never_overlaps")
+        if never is None:
+            from .anchor import AnchoredInterval
+            cycles = [
+                period for period in self.periods
+                if isinstance(period, AnchoredInterval) and period._scope in period._fixed_components
+            ]
+            cycle = max((period._scope_max for period in cycles), default=None)
+            never = False
+            if len(cycles) > 1 and cycle // min(period._scope_max for period in cycles) <= self.max_sweep:
+                end = dt + datetime.timedelta(microseconds=cycle)
+                overlap = reduce(lambda a, b: a & b, (period.get_intervals(dt, end) for period in cycles))
+                never = len(overlap) == 0
+            object.__setattr__(self, "_never_overlaps", never)
+        return never
+
+    def _get_limit(self, dt, forward:bool):
+        tz = dt.tzinfo
+        try:
+            if forward:
+                return min(dt + self.horizon, to_datetime(self.max, timezone=tz))
+            return max(dt - self.horizon, to_datetime(self.min, timezone=tz))
+        except OverflowError:
+            return to_datetime(self.max if forward else self.min, timezone=tz)
+
+    def _no_overlap(self, dt, limit):
+        return NoOverlapError(f"Time periods {self} have no overlapping interval between {min(dt, limit)} and {max(dt, limit)}")
 
     def __eq__(self, other):
         # self | other
@@ -478,6 +702,39 @@ class Any(TimePeriod):
             curr_interval.right
         )
 
+    def _contains_many(self, us):
+        return reduce(lambda a, b: a | b, (period._contains_many(us) for period in self.periods))
+
+    def _rollforward_many(self, us):
+        # Same as rollforward but for all of the
+        # times simultaneously
+        np = import_numpy()
+        intervals = [period._rollforward_many(us) for period in self.periods]
+        lefts = np.array([left for left, _ in intervals])
+        rights = np.array([right for _, right in intervals])
+
+        # Sorting the closest first (left is newest)
+        order = np.argsort(lefts, axis=0, kind="stable")
+        lefts = np.take_along_axis(lefts, order, axis=0)
+        rights = np.take_along_axis(rights, order, axis=0)
+
+        curr_left = lefts[0]
+        curr_right = rights[0]
+        extending = np.ones(len(us), dtype=bool)
+        for left, right in zip(lefts[1:], rights[1:]):
+            extends = right > curr_right
+            overlaps = (left < curr_right) & (curr_left < right)
+            extending &= extends & overlaps
+            curr_left = np.where(extending, left, curr_left)
+            curr_right = np.where(extending, right, curr_right)
+        return lefts[0], curr_right
+
+    def get_intervals(self, start, end) -> IntervalSet:
+        return reduce(
+            lambda a, b: a | b,
+            (period.get_intervals(start, end) for period in self.periods)
+        )
+
     def __eq__(self, other):
         # self | other
         # bitwise or
@@ -541,5 +798,104 @@ class StaticInterval(TimePeriod):
             return 'never'
         return f"StaticInterval(start={self.start!r}, end={self.end!r})"
 
+@dataclass(frozen=True)
+class CachedPeriod(TimePeriod):
+    """Time period with its intervals precomputed.
+
+    The intervals of the wrapped period are
+    materialized over a sliding horizon around
+    the given time so that rolling and checking
+    the membership are binary searches. The
+    intervals are regenerated when the time
+    gets close to the edge of the horizon.
+
+    Parameters
+    ----------
+    period : TimePeriod
+        Time period to cache. Cannot be relative
+        to the current time (TimeDelta).
+    horizon : datetime.timedelta, str
+        How far to the past and to the future
+        the intervals are materialized.
+    """
+
+    period: TimePeriod
+    horizon: datetime.timedelta
+
+    def __init__(self, period:TimePeriod, horizon=datetime.timedelta(days=7)):
+        if not isinstance(period, TimePeriod):
+            raise TypeError("Only TimePeriods supported")
+        if not _is_fixed(period):
+            raise TypeError(f"Cannot cache a time period relative to current time: {period!r}")
+        horizon = to_timedelta(horizon)
+        if horizon <= datetime.timedelta(0):
+            raise ValueError("Horizon must be positive")
+        object.__setattr__(self, "period", period)
+        object.__setattr__(self, "horizon", horizon)
+        # (start, end, tzinfo, intervals)
+        object.__setattr__(self, "_cache", None)
+
+    def _get_cache(self, dt):
+        cache = self._cache
+        if cache is not None:
+            start, end, tz, _ = cache
+            margin = self.horizon / 2
+            if tz is dt.tzinfo and start + margin <= dt <= end - margin:
+                return cache
+        start = dt - self.horizon
+        end = dt + self.horizon
+        cache = (start, end, dt.tzinfo, self.period.get_intervals(start, end))
+        object.__setattr__(self, "_cache", cache)
+        return cache
+
+    def __contains__(self, dt):
+        _, _, _, intervals = self._get_cache(dt)
+        return dt in intervals
+
+    def rollforward(self, dt):
+        _, end, _, intervals = self._get_cache(dt)
+        interval = intervals.rollforward(dt)
+        if interval is None or interval.right >= end:
+            # May continue after the horizon
+            return self.period.rollforward(dt)
+        return interval
+
+    def rollback(self, dt):
+        start, _, _, intervals = self._get_cache(dt)
+        interval = intervals.rollback(dt)
+        if interval is None or interval.left <= start:
+            # May continue before the horizon
+            return self.period.rollback(dt)
+        if interval.left == dt:
+            # The periods differ on what is the
+            # previous interval at its start
+            return self.period.rollback(dt)
+        return interval
+
+    def get_intervals(self, start, end) -> IntervalSet:
+        return self.period.get_intervals(start, end)
+
+    def _contains_many(self, us):
+        return self.period._contains_many(us)
+
+    def _rollforward_many(self, us):
+        return self.period._rollforward_many(us)
+
+    def __repr__(self):
+        return f"CachedPeriod({self.period!r}, horizon={self.horizon!r})"
+
+    def __str__(self):
+        return str(self.period)
+
+def _is_fixed(period:TimePeriod) -> bool:
+    "Whether the intervals of the period do not depend on current time"
+    if isinstance(period, TimeDelta):
+        return False
+    if isinstance(period, (All, Any)):
+        return all(_is_fixed(sub) for sub in period.periods)
+    if isinstance(period, CachedPeriod):
+        return _is_fixed(period.period)
+    return True
+
 always = StaticInterval()
 never = StaticInterval(StaticInterval.max, StaticInterval.max)
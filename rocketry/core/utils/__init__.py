@@ -1,4 +1,4 @@
 
 from .pickle import is_pickleable
-from .meta import filter_keyword_args
+from .meta import filter_keyword_args, get_func_plan
 from .process import is_main_subprocess
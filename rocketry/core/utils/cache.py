@@ -0,0 +1,135 @@
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Union
+
+from rocketry.pybox.time import to_timedelta
+
+def get_ttl(ttl:Union[str, int, float, datetime.timedelta]) -> float:
+    "Get time to live as seconds"
+    if isinstance(ttl, (int, float)):
+        return float(ttl)
+    return to_timedelta(ttl).total_seconds()
+
+class TTLCache:
+    """Cache of values that expire after a time.
+
+    Used by function conditions (states shared by
+    the copies of the condition) and by function
+    arguments (values shared by the tasks).
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a value is considered fresh.
+    refresh : bool
+        Whether stale values are refreshed in a
+        background thread while the previous value
+        is returned.
+    maxsize : int, optional
+        Maximum number of values (keys) kept in
+        the cache. If None, unbounded.
+
+    Only one thread computes a missing value at a
+    time, the others wait for it.
+    """
+
+    def __init__(self, ttl:float, refresh:bool=False, maxsize:Optional[int]=128):
+        self.ttl = ttl
+        self.refresh = refresh
+        self.maxsize = maxsize
+
+        self._states = OrderedDict()
+        self._refreshing = set()
+        self._pending = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def get(self, key:Hashable, func:Callable, now:float, time_func:Callable):
+        while True:
+            with self._lock:
+                if key in self._errors:
+                    raise self._errors.pop(key)
+                cached = self._states.get(key)
+                if cached is not None:
+                    self._states.move_to_end(key)
+                    value, updated = cached
+                    if now - updated < self.ttl:
+                        return value
+                    if self.refresh:
+                        if key not in self._refreshing:
+                            self._refreshing.add(key)
+                            thread = threading.Thread(target=self._refresh, args=(key, func, time_func), daemon=True)
+                            thread.start()
+                        return value
+                pending = self._pending.get(key)
+                if pending is None:
+                    # This thread computes the value
+                    pending = self._pending[key] = threading.Event()
+                    break
+            # Another thread is computing the value
+            pending.wait()
+
+        try:
+            value = func()
+            self._set(key, value, time_func())
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+        return value
+
+    def _refresh(self, key, func, time_func):
+        try:
+            value = func()
+        except Exception as exc:
+            # Raised in the next check
+            with self._lock:
+                self._errors[key] = exc
+        else:
+            self._set(key, value, time_func())
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _set(self, key, value, updated:float):
+        with self._lock:
+            self._states[key] = (value, updated)
+            self._states.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._states) > self.maxsize:
+                    self._states.popitem(last=False)
+
+    def discard(self, key:Hashable):
+        "Remove a value from the cache"
+        with self._lock:
+            self._states.pop(key, None)
+            self._errors.pop(key, None)
+
+    def clear(self):
+        "Empty the cache"
+        with self._lock:
+            self._states.clear()
+            self._errors.clear()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return (self.ttl, self.refresh, self.maxsize) == (other.ttl, other.refresh, other.maxsize)
+        return False
+
+    def __getstate__(self):
+        # Locks and threads cannot be pickled
+        state = self.__dict__.copy()
+        state['_states'] = OrderedDict()
+        state['_refreshing'] = set()
+        state['_pending'] = {}
+        state['_errors'] = {}
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,23 +1,73 @@
-
 import inspect
+from typing import Callable, Dict, NamedTuple, Tuple
+from weakref import WeakKeyDictionary
 
 # Copied from rocketry.pybox\meta\func\func.py
 
+class FuncPlan(NamedTuple):
+    "Precompiled signature of a function"
+    signature: inspect.Signature
+    kw_args: Tuple[str, ...]
+    pos_args: Tuple[str, ...]
+    defaults: Dict[str, object]
+
+# Plans of functions and plans of bound methods
+# (by the underlying function)
+_PLANS = WeakKeyDictionary()
+_METHOD_PLANS = WeakKeyDictionary()
+
+def _create_plan(func:Callable) -> FuncPlan:
+    sig = inspect.signature(func)
+    params = sig.parameters.values()
+    return FuncPlan(
+        signature=sig,
+        kw_args=tuple(
+            param.name for param in params
+            if param.kind in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD, # Normal argument
+                inspect.Parameter.KEYWORD_ONLY # Keyword argument
+            )
+        ),
+        pos_args=tuple(
+            param.name for param in params
+            if param.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD
+            )
+        ),
+        defaults={
+            param.name: param.default for param in params
+            if param.default is not inspect.Parameter.empty
+        },
+    )
+
+def get_func_plan(func:Callable) -> FuncPlan:
+    """Get the signature of a function.
+
+    The signature is inspected once per function
+    (or per method of a class) as inspecting is
+    relatively slow. Functions that cannot be
+    weakly referenced are inspected every time."""
+    cache = _PLANS
+    key = func
+    if inspect.ismethod(func):
+        cache = _METHOD_PLANS
+        key = func.__func__
+    try:
+        return cache[key]
+    except KeyError:
+        plan = cache[key] = _create_plan(func)
+        return plan
+    except TypeError:
+        # Not hashable or cannot be weakly referenced
+        return _create_plan(func)
+
 def filter_keyword_args(_func, _params:dict=None, **kwargs):
     """Filter only keyword arguments that the
     function requires."""
     if _params:
         kwargs.update(_params)
-    sig = inspect.signature(_func)
-
-    kw_args = [
-        val.name
-        for name, val in sig.parameters.items()
-        if val.kind in (
-            inspect.Parameter.POSITIONAL_OR_KEYWORD, # Normal argument
-            inspect.Parameter.KEYWORD_ONLY # Keyword argument
-        )
-    ]
+    kw_args = get_func_plan(_func).kw_args
     return {
         key: val for key, val in kwargs.items()
         if key in kw_args
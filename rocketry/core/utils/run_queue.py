@@ -0,0 +1,102 @@
+from collections import Counter, deque
+from typing import Hashable, Optional
+
+from rocketry.core.parameters import BaseArgument, Parameters
+from rocketry.exc import TaskRunQueueFull
+
+def _get_key(params:Parameters) -> Optional[Hashable]:
+    "Get a key identifying the parameters (None if not hashable)"
+    items = tuple(
+        (name, ("arg", id(value)) if isinstance(value, BaseArgument) else value)
+        # Arguments are compared by identity as
+        # comparing by value would compute them
+        for name, value in sorted(params.items(), key=lambda item: item[0])
+    )
+    try:
+        hash(items)
+    except TypeError:
+        return None
+    return items
+
+class RunQueue(deque):
+    """Queue of run batches (parameters) of a task.
+
+    Batches are added to the end and taken from the
+    front (in constant time). Identical batches can
+    be coalesced (the batch is not added if an equal
+    one is already waiting) and the length of the
+    queue can be limited.
+
+    Compares equal to a list of the same batches.
+    """
+
+    def __init__(self, batches=()):
+        super().__init__()
+        self._keys = Counter()
+        for params in batches:
+            self.put(params)
+
+    def put(self, params:Parameters, coalesce:bool=False, maxsize:Optional[int]=None, on_full:str="raise") -> bool:
+        """Add a batch to the queue.
+
+        Parameters
+        ----------
+        params : Parameters
+            Parameters of the run.
+        coalesce : bool
+            Whether to skip the batch if an identical
+            batch is already in the queue.
+        maxsize : int, optional
+            Maximum number of batches in the queue.
+        on_full : str
+            What to do if the queue is full:
+            ``'raise'`` (raise TaskRunQueueFull),
+            ``'drop'`` (the new batch is not added)
+            or ``'drop_oldest'`` (the first batch is
+            removed).
+
+        Returns
+        -------
+        bool
+            Whether the batch was added.
+        """
+        key = _get_key(params)
+        if coalesce and key is not None and self._keys[key]:
+            return False
+        if maxsize is not None and len(self) >= maxsize:
+            if on_full == "drop":
+                return False
+            if on_full == "drop_oldest":
+                while len(self) >= max(maxsize, 1):
+                    self.get()
+            else:
+                raise TaskRunQueueFull(f"Run queue is full ({len(self)} batches)")
+        self.append(params)
+        if key is not None:
+            self._keys[key] += 1
+        return True
+
+    def get(self) -> Parameters:
+        "Take the first batch from the queue"
+        params = self.popleft()
+        key = _get_key(params)
+        if self._keys.get(key):
+            self._keys[key] -= 1
+            if not self._keys[key]:
+                del self._keys[key]
+        return params
+
+    def clear(self):
+        super().clear()
+        self._keys.clear()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return f"RunQueue({list(self)!r})"
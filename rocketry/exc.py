@@ -24,3 +24,6 @@ class TaskSetupError(Exception):
 
 class TaskLoggingError(Exception):
     """Task's logging failed"""
+
+class TaskRunQueueFull(Exception):
+    """Task has the maximum number of runs queued"""
@@ -1,9 +1,10 @@
-from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
 from .log_record import MinimalRecord
 
 def create_default_handler():
     "Create default handler that can be read"
+    # Imported here as the repos are slow to import
+    from redbird.logging import RepoHandler
+    from redbird.repos import MemoryRepo
     return RepoHandler(
         repo=MemoryRepo(model=MinimalRecord)
     )
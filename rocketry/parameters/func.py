@@ -12,6 +12,9 @@ class FuncParam:
         name : str
             Name of the parameter, by default
             the name of the function.
+        **kwargs : dict
+            Passed to ``FuncArg`` (ie. ``cache_ttl``
+            to cache the value).
 
     Examples
     --------
@@ -32,14 +35,15 @@ class FuncParam:
         ... # Send email list
 
     """
-    def __init__(self, name=None, session=None):
+    def __init__(self, name=None, session=None, **kwargs):
         self.name = name
         self.session = session
+        self.kwargs = kwargs
 
     def __call__(self, func: Callable):
         session = FuncArg.session if self.session is None else self.session
         name = self._get_name(func)
-        session.parameters[name] = FuncArg(func)
+        session.parameters[name] = FuncArg(func, **self.kwargs)
         func.__rocketry__ = {'param_name': name}
         return func
 
@@ -1,4 +1,5 @@
 import re
+import threading
 from functools import partial
 
 from rocketry.conditions.task import TaskFailed, TaskSucceeded, TaskFinished, TaskTerminated, TaskInacted, TaskStarted, TaskRunning, DependSuccess, DependFailure, DependFinish, get_on
@@ -175,11 +176,34 @@ def _set_misc_parsing():
         }
     )
 
-_set_is_period_parsing()
-_set_task_has_parsing()
-_set_scheduler_parsing()
-_set_task_exec_parsing()
-
-_set_task_running_parsing()
-_set_task_pipelining_parsing()
-_set_misc_parsing()
+_LOCK = threading.Lock()
+_IS_SET = False
+
+def setup_cond_parsers():
+    """Register the default condition parsers.
+
+    The parsers are registered on first parse instead
+    of on import as compiling them is relatively slow.
+    The defaults are put before the parsers added
+    earlier."""
+    global _IS_SET
+    if _IS_SET:
+        return
+    with _LOCK:
+        if _IS_SET:
+            return
+        cond_parsers = Session._cls_cond_parsers
+        added = cond_parsers.copy()
+        cond_parsers.clear()
+
+        _set_is_period_parsing()
+        _set_task_has_parsing()
+        _set_scheduler_parsing()
+        _set_task_exec_parsing()
+
+        _set_task_running_parsing()
+        _set_task_pipelining_parsing()
+        _set_misc_parsing()
+
+        cond_parsers.update(added)
+        _IS_SET = True
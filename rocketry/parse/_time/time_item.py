@@ -1,8 +1,7 @@
 
-from typing import Pattern
 from rocketry.core.time.base import TimePeriod
 from rocketry.session import Session
-from ..utils import ParserError
+from ..utils import ParserError, get_parser_index
 
 
 def parse_time_item(s:str, session=None):
@@ -11,21 +10,22 @@ def parse_time_item(s:str, session=None):
         # Old way
         session = Session.session
     parsers = session._time_parsers
-    for statement, parser in parsers.items():
-        if isinstance(statement, Pattern):
-            res = statement.fullmatch(s)
-            if res:
-                args = ()
-                kwargs = res.groupdict()
-                break
-        else:
-            if s == statement:
-                args = (s,)
-                kwargs = {}
-                break
-    else:
+    index = get_parser_index(session, "time", parsers)
+    cache = index.results
+    if s in cache:
+        # Time periods are immutable thus can be shared
+        cache.move_to_end(s)
+        return cache[s]
+
+    match = index.match(s)
+    if match is None:
         raise ParserError(f"Could not find parser for string {repr(s)}.")
+    statement, kwargs = match
+    parser = parsers[statement]
 
-    if isinstance(parser, TimePeriod):
-        return parser
-    return parser(**kwargs)
+    period = parser if isinstance(parser, TimePeriod) else parser(**kwargs)
+    if isinstance(period, TimePeriod):
+        cache[s] = period
+        if len(cache) > index.maxsize:
+            cache.popitem(last=False)
+    return period
@@ -0,0 +1,135 @@
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Pattern, Tuple
+
+# Characters that make a regex not a literal
+_SPECIAL = set(r".^$*+?{}[]\|()")
+_QUANTIFIERS = set("*+?{")
+
+def _get_first_token(statement) -> Optional[str]:
+    "Get the literal first word the statement must start with"
+    if not isinstance(statement, Pattern):
+        return statement.split(" ", 1)[0]
+    pattern = statement.pattern
+    if not isinstance(pattern, str) or statement.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    if "|" in pattern:
+        # Alternatives may start with other words
+        return None
+    for i, char in enumerate(pattern):
+        if char in _SPECIAL:
+            return None
+        if char == " ":
+            if i == 0 or pattern[i+1:i+2] in _QUANTIFIERS:
+                # The space is optional
+                return None
+            return pattern[:i]
+    # The whole pattern is a literal
+    return pattern
+
+class ParserIndex:
+    """Dispatch index of string parsers.
+
+    The statements (strings and regexes) are indexed
+    by the literal first word they start with so that
+    only the regexes that could match are tried. The
+    statements are still tried in the order they were
+    registered thus the first matching statement wins
+    as before. Matched strings are kept in a bounded
+    cache and the parsed results of immutable items
+    (time periods) can be kept in ``results``.
+
+    Parameters
+    ----------
+    parsers : dict
+        Statements (strings or compiled regexes) and
+        their parsers.
+    maxsize : int
+        Maximum number of matched strings (and
+        results) to cache.
+    """
+
+    def __init__(self, parsers:Dict, maxsize:int=4096):
+        self.parsers = parsers
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.results = OrderedDict()
+
+        self._version = getattr(parsers, "version", None)
+        self._keys = tuple(parsers)
+        # Parsers can be replaced under the same statement
+        self._values = tuple(parsers.values())
+        self._exact = {}
+        by_token = {}
+        generic = []
+        for pos, statement in enumerate(self._keys):
+            if not isinstance(statement, Pattern):
+                self._exact.setdefault(statement, pos)
+                continue
+            token = _get_first_token(statement)
+            if token is None:
+                generic.append((pos, statement))
+            else:
+                by_token.setdefault(token, []).append((pos, statement))
+
+        # Each word has its own regexes and the ones
+        # that could start with anything in order
+        self._generic = generic
+        self._by_token = {
+            token: sorted(statements + generic, key=lambda x: x[0])
+            for token, statements in by_token.items()
+        }
+
+    def is_valid(self, parsers:Dict) -> bool:
+        "Whether the index is up to date with the parsers"
+        if parsers is not self.parsers:
+            return False
+        if self._version is not None:
+            # Versioned dict, modifications are counted
+            return parsers.version == self._version
+        return (
+            tuple(parsers) == self._keys
+            and all(a is b for a, b in zip(parsers.values(), self._values))
+        )
+
+    def match(self, s:str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Find the statement matching the string.
+
+        Returns
+        -------
+        tuple of statement and keyword arguments
+            None if no match.
+        """
+        cache = self.cache
+        if s in cache:
+            cache.move_to_end(s)
+            return cache[s]
+
+        exact = self._exact.get(s)
+        result = (s, {}) if exact is not None else None
+        for pos, statement in self._by_token.get(s.split(" ", 1)[0], self._generic):
+            if exact is not None and pos > exact:
+                # The exact string comes first
+                break
+            res = statement.fullmatch(s)
+            if res:
+                result = (statement, res.groupdict())
+                break
+        if result is None:
+            return None
+
+        cache[s] = result
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return result
+
+def get_parser_index(session, name:str, parsers:Dict) -> ParserIndex:
+    "Get (or rebuild) the parser index of the session"
+    indexes = session._parser_indexes
+    if indexes is None:
+        # Unpickled session
+        indexes = session._parser_indexes = {}
+    index = indexes.get(name)
+    if index is None or not index.is_valid(parsers):
+        index = indexes[name] = ParserIndex(parsers)
+    return index
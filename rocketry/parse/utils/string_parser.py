@@ -1,13 +1,21 @@
-from functools import partial
 import re
 
 from typing import Callable, Dict, List
 
-from rocketry.pybox.string.parse import ClosureParser
-from rocketry.pybox.container.visitor import Visitor
+from .exception import ParserError
 
 
 class InstructionParser:
+    """Parser for strings with logical operators.
+
+    The string is tokenized in one pass and parsed
+    using precedence climbing thus the parsing is
+    linear in the length of the string. The operators
+    bind in the order they are given (first binds the
+    tightest). The function of a binary operator is
+    called once with all the operands chained with the
+    operator (ie. ``a & b & c`` calls ``func(a, b, c)``).
+    """
 
     def __init__(self, item_parser:Callable, operators:List[Dict[str, Callable]]):
         self.item_parser = item_parser
@@ -15,6 +23,11 @@ class InstructionParser:
         self.operators = operators
         self.symbols = set(oper["symbol"] for oper in operators)
 
+        # Loosest binding first
+        self._levels = list(reversed(operators))
+        symbols = ''.join(re.escape(oper["symbol"]) for oper in operators)
+        self._regex = re.compile(r'([' + symbols + r'()])')
+
     def __call__(self, s:str, **kwargs):
         """Parse a string to condition. Allows logical operators.
 
@@ -29,123 +42,82 @@ class InstructionParser:
         individual condition parsing (ie.
         in the names of tasks).
         """
-        p = ClosureParser()
-        v = Visitor(visit_types=(list,))
-
-        # 1. Split closures
-        l = p.to_list(s)
-
-        # 2. Split operations
-        v.assign_elements(l, self._split_operations)
-
-        # 2a. Remove extra tuples
-        v.apply(l, _flatten_tuples)
-
-        v.assign_elements(l, partial(self._parse, **kwargs))
-
-        e = v.reduce(l, self._assemble)
+        tokens = self._tokenize(s)
+        state = _State(tokens, kwargs)
+        e = self._parse_level(state, 0)
+        if state.pos != len(tokens):
+            raise ParserError(f"Unexpected {tokens[state.pos]!r} in {s!r}")
         return e
 
-    def _parse(self, __s:tuple, **kwargs):
-        s = __s
-        def parse_string(s):
-            s = s.strip()
-            if s in ("&", "|", "~"):
-                return s
-            return self.item_parser(s, **kwargs)
-
-        if isinstance(s, str):
-            return parse_string(s)
-        return tuple(parse_string(e) for e in s)
-
-    def _assemble(self, *s:tuple):
-
-        v = Visitor(visit_types=(list, tuple))
-        s = v.flatten(s)
-
-        #s = self._assemble_not(s)
-        #s = self._assemble_and(s)
-        #s = self._assemble_or(s)
-
-        for operator in self.operators:
-            oper_str = operator["symbol"]
-            oper_func = operator["func"]
-            oper_side = operator["side"]
-            s = self._assemble_oper(s, oper_str=oper_str, oper_func=oper_func, side=oper_side)
-
-        # TODO: Clean this mess (but be careful)
-
-        return s[0] if isinstance(s, tuple) else s
-
-    def _assemble_oper(self, s:list, oper_str:str, oper_func:Callable, side="both"):
-        s = list(reversed(s))
-        while self._contains_operator(s, oper_str):
-            pos = self._index(s, [oper_str])
-
-            # Set the comparison object to "|" in the list
-
-            if side == "both":
-                obj = oper_func(s[pos+1], s[pos-1])
-                s[pos] = obj
-                # NOTE: We have reversed the "s" thus we also put the arguments to
-
-                # Remove lhs and rhs of the comparison as they are embedded in comparison object
-                del s[pos-1]
-                del s[pos+1-1] # We -1 because we already removed one element thus pos is misaligned
-            elif side == "right":
-                obj = oper_func(s[pos-1])
-                s[pos-1] = obj
-                del s[pos]
-            elif side == "left":
-                obj = oper_func(s[pos+1])
-                s[pos+1] = obj
-                del s[pos]
-
-        return tuple(reversed(s))
-
-    @staticmethod
-    def _contains_operator(s:list, oper_str:str):
-        for e in s:
-            if isinstance(e, str) and e in (oper_str,):
-                return True
-        return False
-
-    @staticmethod
-    def _index(s:list, items:list):
-        "Get "
-        for i, e in enumerate(s):
-            if isinstance(e, str) and e in items:
-                return i
-        raise KeyError
-
-    def _split_operations(self, s:str):
-        # The following are considered as reserved operators
-        #   "&" : and operator
-        #   "|" : or operator
-        #   "~" : not operator
-        symbols = ''.join(self.symbols)
-        regex = r'([' + symbols + '])'
-        s = s.strip()
-        if bool(re.search(regex, s)):
-            l = re.split(regex, s)
-            l = [elem for elem in l if elem.strip()]
-            if len(l) == 1:
-                # Has only the
-                return l[0]
-
-            return tuple(l)
-        return s
-
-
-def _flatten_tuples(cont):
-
-    for i, item in enumerate(cont):
-        if isinstance(item, tuple):
-            cont.pop(i)
-            for j, tpl_item in enumerate(item):
-                cont.insert(i+j, tpl_item)
-
-    return cont
-
-
-# Conditions
+    def _tokenize(self, s:str) -> List[str]:
+        "Split the string to items, operators and parentheses"
+        tokens = []
+        for token in self._regex.split(s):
+            token = token.strip()
+            if token:
+                tokens.append(token)
+        return tokens
+
+    def _parse_level(self, state:'_State', level:int):
+        if level == len(self._levels):
+            return self._parse_atom(state)
+
+        oper = self._levels[level]
+        symbol = oper["symbol"]
+        func = oper["func"]
+        side = oper["side"]
+
+        if side == "right":
+            # Prefix operator (ie. ~a)
+            if state.peek() == symbol:
+                state.pos += 1
+                return func(self._parse_level(state, level))
+            return self._parse_level(state, level + 1)
+
+        operand = self._parse_level(state, level + 1)
+        if side == "left":
+            # Postfix operator
+            while state.peek() == symbol:
+                state.pos += 1
+                operand = func(operand)
+            return operand
+
+        operands = [operand]
+        while state.peek() == symbol:
+            state.pos += 1
+            operands.append(self._parse_level(state, level + 1))
+        if len(operands) == 1:
+            return operand
+        # Creating the condition once instead of pairwise
+        # (which would copy the operands for each pair)
+        return func(*operands)
+
+    def _parse_atom(self, state:'_State'):
+        token = state.peek()
+        if token is None or token in self.symbols or token == ")":
+            # IndexError for backward compatibility
+            raise IndexError("Missing operand")
+        state.pos += 1
+        if token == "(":
+            e = self._parse_level(state, 0)
+            if state.peek() != ")":
+                raise ParserError("Missing closing parenthesis")
+            state.pos += 1
+            return e
+        return self.item_parser(token, **state.kwargs)
+
+
+class _State:
+    "Position in the tokens"
+
+    __slots__ = ("tokens", "pos", "kwargs")
+
+    def __init__(self, tokens:List[str], kwargs:dict):
+        self.tokens = tokens
+        self.pos = 0
+        self.kwargs = kwargs
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
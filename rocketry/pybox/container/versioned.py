@@ -0,0 +1,58 @@
+
+class VersionedDict(dict):
+    """Dictionary that counts its modifications.
+
+    The ``version`` is incremented every time the
+    dictionary is modified so that the objects derived
+    from it (ie. indexes) can be invalidated without
+    comparing the contents.
+
+    Example:
+    --------
+        d = VersionedDict(a=1)
+        d.version
+        >>> 0
+        d["b"] = 2
+        d.version
+        >>> 1
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def copy(self):
+        return type(self)(self)
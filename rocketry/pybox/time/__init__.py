@@ -3,4 +3,4 @@ from .convert import (
     timedelta_to_str, datetime_to_dict,
     to_timestamp
 )
-from .interval import Interval
+from .interval import Interval, IntervalSet
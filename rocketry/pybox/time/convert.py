@@ -1,6 +1,5 @@
 import datetime
 from typing import Union
-from dateutil.parser import parse
 
 ABBREVIATIONS = {
     'ns': 'nanosecond',
@@ -210,6 +209,8 @@ def timedelta_to_str(dt,
     return s
 
 def string_to_datetime(s):
+    # Imported here as dateutil is slow to import
+    from dateutil.parser import parse
     return parse(s)
 
 
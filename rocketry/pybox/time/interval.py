@@ -1,5 +1,7 @@
+import itertools
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 try:
     from typing import Literal
@@ -117,3 +119,139 @@ class Interval:
 
     def __repr__(self):
         return f'Interval({repr(self.left)}, {repr(self.right)}, closed={repr(self.closed)})'
+
+class IntervalSet:
+    """Sorted set of non-overlapping intervals.
+
+    Supports intersection (``&``), union (``|``)
+    and looking up the intervals around a point
+    in time using binary search.
+
+    Parameters
+    ----------
+    intervals : iterable of Interval
+        Non-overlapping intervals. Empty
+        intervals are dropped.
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = sorted(
+            (interval for interval in intervals if not interval.is_empty),
+            key=lambda interval: (interval.left, interval.right)
+        )
+        self._lefts = [interval.left for interval in self._intervals]
+        self._rights = [interval.right for interval in self._intervals]
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def __getitem__(self, i):
+        return self._intervals[i]
+
+    def __eq__(self, other):
+        if isinstance(other, IntervalSet):
+            return self._intervals == other._intervals
+        return False
+
+    def __contains__(self, dt):
+        # Only the intervals starting at or before dt
+        # can contain it. As the intervals do not overlap,
+        # dt can only be on the last one or, if dt is at
+        # an edge, on the one before it.
+        pos = bisect_right(self._lefts, dt)
+        return any(
+            dt in self._intervals[i]
+            for i in range(max(pos - 2, 0), pos)
+        )
+
+    def __and__(self, other:'IntervalSet') -> 'IntervalSet':
+        "Find the intervals that are in both sets"
+        # Sweep both sorted sets simultaneously
+        intervals = []
+        i, j = 0, 0
+        while i < len(self._intervals) and j < len(other._intervals):
+            a = self._intervals[i]
+            b = other._intervals[j]
+            if a.overlaps(b):
+                intersection = a & b
+                if not intersection.is_empty:
+                    intervals.append(intersection)
+            # Move the one that ends first
+            if a.right < b.right:
+                i += 1
+            elif a.right > b.right:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        return IntervalSet(intervals)
+
+    def __or__(self, other:'IntervalSet') -> 'IntervalSet':
+        "Find the intervals that are in either of the sets"
+        intervals = []
+        for interval in sorted(
+            itertools.chain(self._intervals, other._intervals),
+            key=lambda interval: (interval.left, interval.right)
+        ):
+            if intervals and intervals[-1].overlaps(interval):
+                intervals[-1] = _combine(intervals[-1], interval)
+            else:
+                intervals.append(interval)
+        return IntervalSet(intervals)
+
+    def rollforward(self, dt) -> Optional[Interval]:
+        """Get the interval containing dt (starting
+        from dt) or the next interval after dt. None
+        if there are no intervals after dt"""
+        # Intervals before this end before dt
+        pos = bisect_left(self._rights, dt)
+        for interval in itertools.islice(self._intervals, pos, None):
+            if dt in interval:
+                right_closed = interval.closed in ('right', 'both')
+                return Interval(dt, interval.right, closed=_close(True, right_closed))
+            if interval.left >= dt:
+                return interval
+        return None
+
+    def rollback(self, dt) -> Optional[Interval]:
+        """Get the interval containing dt (ending
+        to dt) or the previous interval before dt.
+        None if there are no intervals before dt"""
+        # Intervals after this start after dt
+        pos = bisect_right(self._lefts, dt)
+        for i in range(pos - 1, -1, -1):
+            interval = self._intervals[i]
+            if dt in interval:
+                if interval.left == dt:
+                    # Contains only dt
+                    return Interval(dt, dt, closed="both")
+                left_closed = interval.closed in ('left', 'both')
+                return Interval(interval.left, dt, closed=_close(left_closed, False))
+            if interval.right <= dt:
+                return interval
+        return None
+
+    def __repr__(self):
+        return f'IntervalSet({self._intervals!r})'
+
+def _close(left:bool, right:bool) -> str:
+    return (
+        "both" if left and right
+        else "left" if left
+        else "right" if right
+        else "neither"
+    )
+
+def _combine(a:Interval, b:Interval) -> Interval:
+    # Union of overlapping intervals (a starts first)
+    left_closed = a.closed in ('left', 'both') or (a.left == b.left and b.closed in ('left', 'both'))
+    if a.right > b.right:
+        right, right_closed = a.right, a.closed in ('right', 'both')
+    elif a.right < b.right:
+        right, right_closed = b.right, b.closed in ('right', 'both')
+    else:
+        right, right_closed = a.right, a.closed in ('right', 'both') or b.closed in ('right', 'both')
+    return Interval(a.left, right, closed=_close(left_closed, right_closed))
@@ -3,6 +3,7 @@ Utilities for getting information
 about the scehuler/task/parameters etc.
 """
 
+from contextlib import contextmanager
 from copy import copy
 import datetime
 import logging
@@ -17,6 +18,7 @@ from pydantic import BaseModel, root_validator, validator
 from rocketry.pybox.time import to_timedelta
 from rocketry.log.defaults import create_default_handler
 from rocketry._base import RedBase
+from rocketry.pybox.container.versioned import VersionedDict
 from rocketry.tasks.run_id import uuid
 
 try:
@@ -58,6 +60,7 @@ class Config(BaseModel):
     silence_task_logging: bool = False # Whether to silence errors occurred in logging a task
     silence_cond_check: bool = False # Whether to silence errors occurred in checking conditions
     cycle_sleep: Optional[float] = 0.1
+    dispatch_dependents: Optional[Literal['wake', 'same_cycle']] = 'wake' # How tasks depending on a finished task are checked
     debug: bool = False
 
     multilaunch: bool = False
@@ -176,8 +179,9 @@ class Session(RedBase):
     parameters: 'Parameters'
     _scheduler: 'Scheduler'
 
-    _time_parsers: ClassVar[Dict] = {}
-    _cls_cond_parsers: ClassVar[Dict] = {} # Default condition parsers
+    # Versioned so that the parser indexes know when to rebuild
+    _time_parsers: ClassVar[Dict] = VersionedDict()
+    _cls_cond_parsers: ClassVar[Dict] = VersionedDict() # Default condition parsers
 
     def _get_parameters(self, value):
         from rocketry.core import Parameters
@@ -219,14 +223,23 @@ class Session(RedBase):
         self.hooks = Hooks()
         self.returns = self._get_parameters(None)
         self._cond_parsers = self._cls_cond_parsers.copy()
+        self._has_default_parsers = False # Default parsers are set on first parse
         self._cond_cache: Dict = {} # Cached by CondParser to speed up expensive conditions
+        self._parser_indexes: Dict = {} # Dispatch indexes of the string parsers
         self._cond_states = {} # Used by FuncConds to relay condiiton states to conditions
+        self._clock = threading.local() # Snapshot of the current time (per thread)
+        self._task_index = None # Tasks by name (only when creating tasks in bulk)
         if delete_existing_loggers:
             self.delete_task_loggers()
 
     def __getitem__(self, task:Union['Task', str]):
         "Get a task from the session"
         task_name = self._get_task_name(task)
+        index = self._task_index
+        if index is not None:
+            if task_name in index:
+                return index[task_name]
+            raise KeyError(f"Task '{task_name}' not found")
         for task in self.tasks:
             if task.name == task_name:
                 return task
@@ -397,6 +410,12 @@ class Session(RedBase):
 
     def get_cond_parsers(self):
         "Used by the actual string condition parser"
+        if not self._has_default_parsers and self._cond_parsers is not None:
+            from rocketry.parse._setup_cond_parsers import setup_cond_parsers
+            setup_cond_parsers()
+            # Parsers set to the session override the defaults
+            self._cond_parsers = VersionedDict({**self._cls_cond_parsers, **self._cond_parsers})
+            self._has_default_parsers = True
         return self._cond_parsers
 
     def create_task(self, *, command=None, path=None, **kwargs):
@@ -414,6 +433,58 @@ class Session(RedBase):
             return FuncTask(path=path, **kwargs)
         return FuncTask(name_include_module=False, _name_template='{func_name}', **kwargs)
 
+    def create_tasks(self, specs:Iterable[dict]) -> List['Task']:
+        """Create tasks in bulk and put them to the session.
+
+        Faster than calling ``create_task`` for each task:
+        the names are checked using an index of the tasks
+        instead of going through the tasks of the session
+        and each unique condition string is parsed once.
+        If the names conflict and the session's
+        ``task_pre_exist`` is ``'raise'``, none of the tasks
+        are created.
+
+        Parameters
+        ----------
+        specs : iterable of dict
+            Keyword arguments of ``create_task`` for
+            each task.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            session.create_tasks(
+                {"command": f"python job_{i}.py", "name": f"job {i}", "start_cond": "daily"}
+                for i in range(10_000)
+            )
+        """
+        from rocketry.parse.condition import parse_condition
+
+        specs = [dict(spec) for spec in specs]
+        index = {task.name: task for task in self.tasks}
+        names = set()
+        conds = {}
+        for spec in specs:
+            name = spec.get("name")
+            if name is not None and self.config.task_pre_exist == "raise":
+                if name in index or name in names:
+                    raise ValueError(f"Task name '{name}' already exists.")
+                names.add(name)
+            for attr in ("start_cond", "end_cond"):
+                value = spec.get(attr)
+                if isinstance(value, str):
+                    if value not in conds:
+                        conds[value] = parse_condition(value, session=self)
+                    # The task copies the condition
+                    spec[attr] = conds[value]
+
+        self._task_index = index
+        try:
+            return [self.create_task(**spec) for spec in specs]
+        finally:
+            self._task_index = None
+
     def add_task(self, task: 'Task'):
         "Add the task to the session"
         if_exists = self.config.task_pre_exist
@@ -428,6 +499,8 @@ class Session(RedBase):
                 raise KeyError(f"Task '{task.name}' already exists")
         else:
             self.tasks.add(task)
+        if self._task_index is not None:
+            self._task_index[task.name] = task
 
         # Adding the session to the task
         task.session = self
@@ -437,6 +510,8 @@ class Session(RedBase):
         if not isinstance(task, Task):
             task = self[task]
         self.tasks.remove(task)
+        if self._task_index is not None:
+            self._task_index.pop(task.name, None)
 
     def task_exists(self, task: 'Task'):
         warnings.warn((
@@ -530,6 +605,9 @@ class Session(RedBase):
         state["tasks"] = set()
         state["_cond_cache"] = None
         state["_cond_parsers"] = None
+        state["_parser_indexes"] = None
+        state["_has_default_parsers"] = None
+        state["_clock"] = None
         state["session"] = None
         #state["parameters"] = None
         state['scheduler'] = None
@@ -539,7 +617,7 @@ class Session(RedBase):
         # Copy and remove typically unpicklable attrs.
         # Used when creating a child process
         unpicklable_conf = {'shut_cond'}
-        unpicklable = {'tasks', '_cond_cache', 'session', '_cond_parsers', 'parameters'}
+        unpicklable = {'tasks', '_cond_cache', 'session', '_cond_parsers', '_parser_indexes', '_has_default_parsers', 'parameters', '_clock'}
         new_self = copy(self)
         for attr in unpicklable:
             setattr(new_self, attr, None)
@@ -611,7 +689,50 @@ class Session(RedBase):
             return self.config.time_func()
         return time.time()
 
+    @contextmanager
+    def time_snapshot(self):
+        """Measure the current time once for a block.
+
+        Conditions evaluated in the block (in the same
+        thread) use the same current time so their
+        results are consistent. Nested blocks use the
+        outermost snapshot.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with session.time_snapshot() as (timestamp, now):
+                cond.observe(session=session)
+        """
+        clock = self._clock
+        snapshot = getattr(clock, "now", None)
+        if snapshot is not None:
+            yield snapshot
+            return
+        timestamp = self.get_time()
+        snapshot = (timestamp, self._format_timestamp(timestamp))
+        if clock is None:
+            # Unpickled session (in a child process)
+            yield snapshot
+            return
+        clock.now = snapshot
+        try:
+            yield snapshot
+        finally:
+            clock.now = None
+
+    def _get_time_now(self) -> float:
+        "Get current time as timestamp (the snapshot if taken)"
+        snapshot = getattr(self._clock, "now", None)
+        if snapshot is not None:
+            return snapshot[0]
+        return self.get_time()
+
     def _get_datetime_now(self):
+        snapshot = getattr(self._clock, "now", None)
+        if snapshot is not None:
+            return snapshot[1]
         return self._format_timestamp(self.get_time())
 
     def _format_timestamp(self, dt:float):
@@ -0,0 +1,270 @@
+import datetime
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from rocketry.core.time import TimePeriod
+from rocketry.core.utils.cache import get_ttl
+
+class ResultCache(ABC):
+    """Base class for caches of the outputs of
+    function tasks.
+
+    The output of a run is stored by the task and
+    the materialized parameters of the run. If a
+    later run has the same parameters and the
+    stored output is still fresh, the function is
+    not executed and the stored output is used
+    instead (and published to the returns of the
+    session).
+
+    Parameters
+    ----------
+    ttl : str, int, float, timedelta, optional
+        How long an output is fresh.
+    period : TimePeriod, optional
+        Output is fresh as long as the current
+        time is in the same interval of the period
+        as the time the output was created. For
+        example, ``TimeOfDay()`` makes the outputs
+        fresh for the rest of the day.
+    on_hit : str
+        Whether the run using a cached output is
+        logged as ``'success'`` or ``'inaction'``.
+
+    Notes
+    -----
+    If neither ``ttl`` nor ``period`` is given, the
+    outputs are fresh forever. Runs with parameters
+    that cannot be pickled are not cached.
+    """
+
+    def __init__(self, ttl:Union[str, int, float, datetime.timedelta]=None, period:TimePeriod=None, on_hit:str="success"):
+        if on_hit not in ("success", "inaction"):
+            raise ValueError(f"Invalid on_hit: {on_hit!r}")
+        self.ttl = get_ttl(ttl) if ttl is not None else None
+        self.period = period
+        self.on_hit = on_hit
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, task, params:dict) -> Tuple[bool, Any]:
+        """Look up the output of a run.
+
+        Returns
+        -------
+        tuple of bool and Any
+            Whether a fresh output was found and
+            the output.
+        """
+        key = self.get_key(task, params)
+        if key is not None:
+            cached = self.get(key)
+            if cached is not None:
+                value, created = cached
+                if self.is_fresh(created, session=task.session):
+                    self.hits += 1
+                    return True, value
+                self.delete(key)
+        self.misses += 1
+        return False, None
+
+    def store(self, task, params:dict, value:Any):
+        "Store the output of a run"
+        key = self.get_key(task, params)
+        if key is not None:
+            self.set(key, value, task.session.get_time())
+
+    def get_key(self, task, params:dict) -> Optional[str]:
+        "Get the key of a run (None if cannot be cached)"
+        try:
+            content = pickle.dumps((task.name, sorted(params.items())), protocol=4)
+        except Exception:
+            # Parameters cannot be pickled or compared
+            return None
+        return hashlib.sha256(content).hexdigest()
+
+    def is_fresh(self, created:float, session) -> bool:
+        "Whether an output created on given time is fresh"
+        now = session.get_time()
+        if self.ttl is not None and now - created >= self.ttl:
+            return False
+        if self.period is not None:
+            dt = session._format_timestamp(now)
+            if dt not in self.period:
+                return False
+            interval = self.period.rollback(dt)
+            try:
+                start = interval.left.timestamp()
+            except (OverflowError, ValueError, OSError):
+                # Period started before the epoch
+                return True
+            if created < start:
+                return False
+        return True
+
+    @abstractmethod
+    def get(self, key:str) -> Optional[Tuple[Any, float]]:
+        "Get the output and its creation time (None if missing)"
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key:str, value:Any, created:float):
+        "Set the output"
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key:str):
+        "Delete the output"
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        "Delete all of the outputs"
+        raise NotImplementedError
+
+class MemoryCache(ResultCache):
+    """Result cache that keeps the outputs in memory.
+
+    The least recently used outputs are dropped if
+    there are more than ``maxsize`` of them. The
+    outputs are not shared with tasks executed in
+    a process: use :py:class:`PickleCache` instead.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of outputs. If None,
+        unbounded.
+    **kwargs : dict
+        See :py:class:`ResultCache`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from rocketry.tasks.cache import MemoryCache
+        from rocketry.time import TimeOfDay
+
+        @app.task(result_cache=MemoryCache(period=TimeOfDay()))
+        def fetch_rates(currency="EUR"):
+            ...
+    """
+
+    def __init__(self, maxsize:Optional[int]=128, **kwargs):
+        super().__init__(**kwargs)
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None:
+                self._values.move_to_end(key)
+            return cached
+
+    def set(self, key, value, created):
+        with self._lock:
+            self._values[key] = (value, created)
+            self._values.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._values) > self.maxsize:
+                    self._values.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getstate__(self):
+        # Locks cannot be pickled and the
+        # outputs are not needed in a process
+        state = self.__dict__.copy()
+        state['_values'] = OrderedDict()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+class PickleCache(ResultCache):
+    """Result cache that pickles the outputs to a
+    directory (a file per output).
+
+    The outputs persist over restarts and are
+    shared with the tasks executed in a process.
+
+    Parameters
+    ----------
+    path : path-like
+        Directory of the outputs. Created if
+        missing.
+    **kwargs : dict
+        See :py:class:`ResultCache`.
+    """
+
+    def __init__(self, path:Union[str, Path], **kwargs):
+        super().__init__(**kwargs)
+        self.path = Path(path)
+
+    def _get_file(self, key:str) -> Path:
+        return self.path / f"{key}.pkl"
+
+    def get(self, key):
+        try:
+            with open(self._get_file(key), "rb") as file:
+                created, value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupted or cannot be unpickled
+            self.delete(key)
+            return None
+        return value, created
+
+    def set(self, key, value, created):
+        self.path.mkdir(parents=True, exist_ok=True)
+        try:
+            content = pickle.dumps((created, value))
+        except Exception:
+            # Output cannot be pickled
+            return
+        # Written to a temporary file first so that
+        # readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp, self._get_file(key))
+        except Exception:
+            _unlink(Path(tmp))
+            raise
+
+    def delete(self, key):
+        _unlink(self._get_file(key))
+
+    def clear(self):
+        if self.path.is_dir():
+            for file in self.path.glob("*.pkl"):
+                _unlink(file)
+
+def _unlink(path:Path):
+    "Remove the file if it exists"
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,164 @@
+import ast
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from rocketry.parse import parse_condition
+from .func import FuncTask, get_module_cached
+
+if TYPE_CHECKING:
+    from rocketry import Session
+    from rocketry.application import _AppMixin
+
+# Positional arguments of Grouper(...) and group.task(...)
+_GROUPER_ARGS = ("prefix", "start_cond", "execution")
+_TASK_ARGS = ("start_cond", "name")
+
+class _NotStatic(Exception):
+    "The arguments cannot be read without importing"
+
+def _read_args(call:ast.Call, names:Tuple[str, ...]) -> dict:
+    if len(call.args) > len(names):
+        raise _NotStatic()
+    kwargs = {}
+    try:
+        for name, arg in zip(names, call.args):
+            kwargs[name] = ast.literal_eval(arg)
+        for keyword in call.keywords:
+            if keyword.arg is None:
+                # **kwargs
+                raise _NotStatic()
+            kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+    except ValueError as exc:
+        raise _NotStatic() from exc
+    return kwargs
+
+def _get_call_name(node) -> Optional[str]:
+    func = node.func if isinstance(node, ast.Call) else None
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+def scan_tasks(path:Union[str, Path]) -> Optional[List[dict]]:
+    """Read the tasks of a module without importing it.
+
+    Finds the functions of the module decorated with
+    ``task`` of a module level ``Grouper``. The
+    arguments of the grouper and the decorators must
+    be literals (ie. the starting condition as a
+    string) and the module may contain only imports,
+    the groupers and functions (plain or decorated
+    with the ``task`` of a grouper).
+
+    Parameters
+    ----------
+    path : path-like
+        Path to the module.
+
+    Returns
+    -------
+    list of dict, None
+        Metadata of the tasks (``func_name``,
+        ``group`` and ``kwargs`` of the decorator)
+        or None if the arguments of some of them
+        cannot be read statically.
+    """
+    tree = ast.parse(Path(path).read_bytes(), filename=str(path))
+    groups = {}
+    tasks = []
+    body = tree.body
+    if ast.get_docstring(tree, clean=False) is not None:
+        body = body[1:]
+    try:
+        for node in body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                continue
+            if isinstance(node, ast.Assign) and _get_call_name(node.value) == "Grouper":
+                kwargs = _read_args(node.value, _GROUPER_ARGS)
+                if not all(isinstance(target, ast.Name) for target in node.targets):
+                    raise _NotStatic()
+                for target in node.targets:
+                    groups[target.id] = kwargs
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not node.decorator_list:
+                    continue
+                if len(node.decorator_list) > 1:
+                    raise _NotStatic()
+                decor = node.decorator_list[0]
+                if not isinstance(decor, ast.Call) or _get_call_name(decor) != "task":
+                    raise _NotStatic()
+                owner = decor.func.value if isinstance(decor.func, ast.Attribute) else None
+                if not isinstance(owner, ast.Name) or owner.id not in groups:
+                    raise _NotStatic()
+                tasks.append({
+                    "func_name": node.name,
+                    "group": groups[owner.id],
+                    "kwargs": _read_args(decor, _TASK_ARGS),
+                })
+            else:
+                # Anything else (ie. group.params(...) or
+                # @group.cond(...)) may affect the tasks
+                raise _NotStatic()
+    except _NotStatic:
+        return None
+    return tasks
+
+def discover_tasks(path:Union[str, Path], app:'_AppMixin', pattern:str="**/*.py") -> List[FuncTask]:
+    """Create the tasks of the modules in a directory
+    without importing the modules.
+
+    The tasks are found from the functions decorated
+    with the ``task`` of a module level ``Grouper``
+    (see :py:func:`scan_tasks`). The module is imported
+    only when a task of it is run for the first time.
+    Modules of which tasks cannot be read statically
+    (ie. the starting condition is not a string) are
+    imported and their groupers are included.
+
+    Parameters
+    ----------
+    path : path-like
+        Directory (or a file) of the task modules.
+    app : rocketry.Rocketry, rocketry.Grouper
+        Application the tasks are created to.
+    pattern : str
+        Glob pattern of the task modules.
+
+    Returns
+    -------
+    list of FuncTask
+        Created tasks.
+    """
+    from rocketry.application import Grouper
+    path = Path(path)
+    files = [path] if path.is_file() else sorted(path.glob(pattern))
+
+    tasks = []
+    for file in files:
+        specs = scan_tasks(file)
+        if specs is None:
+            # Import and include the groupers as usual
+            module = get_module_cached(file)
+            for group in vars(module).values():
+                if isinstance(group, Grouper):
+                    tasks += list(group.session.tasks)
+                    app.include_grouper(group)
+            continue
+        for spec in specs:
+            tasks.append(_create_task(file, spec, session=app.session))
+    return tasks
+
+def _create_task(file:Path, spec:Dict, session:'Session') -> FuncTask:
+    group = spec["group"]
+    kwargs = dict(spec["kwargs"])
+    name = kwargs.pop("name", None) or spec["func_name"]
+    if group.get("prefix"):
+        name = group["prefix"] + name
+    if kwargs.get("execution") is None and group.get("execution") is not None:
+        kwargs["execution"] = group["execution"]
+
+    task = FuncTask(path=file, func_name=spec["func_name"], name=name, session=session, **kwargs)
+    if group.get("start_cond") is not None:
+        task.start_cond &= parse_condition(group["start_cond"], session=session)
+    return task
@@ -0,0 +1,101 @@
+import asyncio
+import inspect
+import itertools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+def get_chunks(items:Iterable, size:int) -> List[list]:
+    "Split the items to lists of given size"
+    items = iter(items)
+    chunks = []
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return chunks
+        chunks.append(chunk)
+
+def run_chunk(func:Callable, param:str, chunk:list, params:dict) -> list:
+    "Call the function for each item of the chunk"
+    is_async = inspect.iscoroutinefunction(func)
+    outputs = []
+    for item in chunk:
+        output = func(**{**params, param: item})
+        if is_async:
+            output = asyncio.run(output)
+        outputs.append(output)
+    return outputs
+
+def _create_executor(execution:str, workers:int) -> Executor:
+    if execution == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rocketry-map")
+
+async def run_map(func:Callable, param:str, params:dict, chunksize:int=1,
+                  workers:Optional[int]=None, execution:str="thread", run_id:str=None, name:str=None) -> List[Any]:
+    """Call the function for each item of the
+    parameter in parallel.
+
+    The items are split to chunks that are run in a
+    pool of threads or processes. Chunks of a run are
+    logged (debug) with the run ID.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to call for each item.
+    param : str
+        Name of the parameter (in ``params``) that
+        contains the items.
+    params : dict
+        Parameters of the function.
+    chunksize : int
+        Number of items a worker processes at once.
+    workers : int, optional
+        Maximum number of threads or processes.
+        By default, the default of the executor.
+    execution : str
+        'thread' or 'process'.
+    run_id : str, optional
+        Run ID the chunks are logged with.
+    name : str, optional
+        Name of the task the chunks are logged with.
+
+    Returns
+    -------
+    list
+        Outputs of the function in the order of
+        the items.
+    """
+    params = dict(params)
+    chunks = get_chunks(params.pop(param), chunksize)
+    if not chunks:
+        return []
+    if execution == "process" and multiprocessing.current_process().daemon:
+        # Daemonic processes cannot have children
+        execution = "thread"
+    if workers is not None:
+        workers = min(workers, len(chunks))
+
+    logger = logging.getLogger(__name__)
+    executor = _create_executor(execution, workers)
+    extra = {"run_id": run_id, "task_name": name}
+    loop = asyncio.get_running_loop()
+    futures = []
+    try:
+        for i, chunk in enumerate(chunks):
+            logger.debug(f"Task '{name}' run '{run_id}': chunk {i + 1}/{len(chunks)} submitted ({len(chunk)} items)", extra=extra)
+            futures.append(asyncio.wrap_future(executor.submit(run_chunk, func, param, chunk, params), loop=loop))
+        outputs = []
+        for i, future in enumerate(futures):
+            outputs += await future
+            logger.debug(f"Task '{name}' run '{run_id}': chunk {i + 1}/{len(chunks)} finished", extra=extra)
+        return outputs
+    finally:
+        # Unstarted chunks are not run if one failed.
+        # The running ones are let to finish without
+        # blocking the event loop.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -1,14 +1,23 @@
 import sys
 import inspect
-import importlib
+import importlib.util
+import threading
 from pathlib import Path
 from typing import Callable, List, Optional
 import warnings
+try:
+    from typing import Literal
+except ImportError: # pragma: no cover
+    from typing_extensions import Literal
 
 from pydantic import Field, PrivateAttr, validator
 
 from rocketry.core.task import Task
 from rocketry.core.parameters import Parameters
+from rocketry.core.utils import get_func_plan
+from rocketry.exc import TaskInactionException
+from .cache import ResultCache
+from .fan_out import run_map
 from rocketry.pybox.pkg import find_package_root
 
 
@@ -31,6 +40,48 @@ def get_module(path, pkg_path=None):
         raise ImportError(f"Importing the file '{path}' failed.") from exc
     return task_module
 
+# Imported modules by (path, sys paths). The
+# modules are shared by the tasks of the same file
+# and reimported only if the file has changed.
+_MODULES = {}
+_MODULES_LOCK = threading.RLock()
+
+def get_module_cached(path, sys_paths=()):
+    """Import the module from path or get it from
+    the cache if the file has not changed since
+    (by its modification time and size)."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        # Fails in the import
+        return _import_module(path, sys_paths)
+    key = (Path(path).absolute(), tuple(str(sys_path) for sys_path in sys_paths))
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _MODULES.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _MODULES_LOCK:
+        cached = _MODULES.get(key)
+        if cached is not None and cached[0] == version:
+            # Imported by another thread meanwhile
+            return cached[1]
+        module = _import_module(path, sys_paths)
+        _MODULES[key] = (version, module)
+    return module
+
+def _import_module(path, sys_paths):
+    # Add dir of the path to sys.path so importing from that dir works
+    pkg_path = find_package_root(path)
+    root = str(Path(path).parent.absolute()) if not pkg_path else str(pkg_path)
+    with TempSysPath([root] + list(sys_paths)):
+        return get_module(path, pkg_path=pkg_path)
+
+def clear_module_cache():
+    "Forget the imported modules (imported again on next run)"
+    with _MODULES_LOCK:
+        _MODULES.clear()
+
 class TempSysPath:
     # TODO: To utils.
     sys_path = sys.path
@@ -133,6 +184,13 @@ class FuncTask(Task):
     path: Optional[Path] = Field(description="Path to the script that is executed")
     func_name: Optional[str] = Field(default="main", description="Name of the function in given path. Pass path as well")
     cache: bool = False
+    result_cache: Optional[ResultCache] = None
+
+    map_param: Optional[str] = None
+    map_chunksize: int = 1
+    map_workers: Optional[int] = None
+    map_execution: Literal['thread', 'process'] = 'thread'
+    map_reduce: Optional[Callable] = None
 
     sys_paths: List[Path] = []
 
@@ -223,22 +281,58 @@ class FuncTask(Task):
         "Run the actual, given, task"
         func = self.get_func(cache=self.cache)
 
+        result_cache = self.result_cache
+        if result_cache is not None:
+            is_cached, output = result_cache.lookup(self, params)
+            if is_cached:
+                if result_cache.on_hit == "inaction":
+                    # Return is still available for
+                    # the tasks that use it
+                    exc = TaskInactionException()
+                    exc.return_value = output
+                    raise exc
+                return output
+
         is_async = inspect.iscoroutinefunction(func)
-        if is_async:
+        if self.map_param is not None:
+            output = await self._execute_map(func, params)
+        elif is_async:
             output = await func(**params)
         else:
             output = func(**params)
+
+        if result_cache is not None:
+            result_cache.store(self, params, output)
         return output
 
+    async def _execute_map(self, func, params:dict):
+        "Run the function for each item of the map parameter"
+        workers = self.map_workers
+        if self.map_execution == "process":
+            session = self.session
+            n_free = session.config.max_process_count
+            if session.scheduler is not None:
+                n_free -= session.scheduler.count_process_tasks_alive()
+            workers = max(min(workers or n_free, n_free), 1)
+
+        task_run = self.get_current_run()
+        outputs = await run_map(
+            func, self.map_param, params,
+            chunksize=self.map_chunksize,
+            workers=workers,
+            execution=self.map_execution,
+            run_id=task_run.run_id if task_run is not None else None,
+            name=self.name,
+        )
+        if self.map_reduce is not None:
+            return self.map_reduce(outputs)
+        return outputs
+
     def get_func(self, cache=True):
         if self.func is None:
-            # Add dir of self.path to sys.path so importing from that dir works
-            pkg_path = find_package_root(self.path)
-            root = str(Path(self.path).parent.absolute()) if not pkg_path else str(pkg_path)
-
-            # _task_func is cached to faster performance
-            with TempSysPath([root] + self.sys_paths):
-                task_module = get_module(self.path, pkg_path=pkg_path)
+            # The module is imported again only if
+            # the file has changed
+            task_module = get_module_cached(self.path, sys_paths=self.sys_paths)
             task_func = getattr(task_module, self.func_name)
 
             if cache:
@@ -290,45 +384,29 @@ class FuncTask(Task):
             # pickling. If lazy, we filter after
             # pickling to handle problems in
             # pickling functions.
+            kw_args = get_func_plan(self.get_func()).kw_args
             return {
                 key: val for key, val in params.items()
-                if key in self.kw_args
+                if key in kw_args
             }
         return params
 
     def postfilter_params(self, params:Parameters):
         if self._is_delayed:
             # Was not filtered in prefiltering.
+            kw_args = get_func_plan(self.get_func()).kw_args
             return {
                 key: val for key, val in params.items()
-                if key in self.kw_args
+                if key in kw_args
             }
         return params
 
     @property
     def pos_args(self):
         func = self.get_func()
-        sig = inspect.signature(func)
-        pos_args = [
-            val.name
-            for name, val in sig.parameters.items()
-            if val.kind in (
-                inspect.Parameter.POSITIONAL_ONLY, # NOTE: Python <= 3.8 do not have positional arguments, but maybe in the future?
-                inspect.Parameter.POSITIONAL_OR_KEYWORD # Keyword argument
-            )
-        ]
-        return pos_args
+        return list(get_func_plan(func).pos_args)
 
     @property
     def kw_args(self):
         func = self.get_func()
-        sig = inspect.signature(func)
-        kw_args = [
-            val.name
-            for name, val in sig.parameters.items()
-            if val.kind in (
-                inspect.Parameter.POSITIONAL_OR_KEYWORD, # Normal argument
-                inspect.Parameter.KEYWORD_ONLY # Keyword argument
-            )
-        ]
-        return kw_args
+        return list(get_func_plan(func).kw_args)
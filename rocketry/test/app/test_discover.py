@@ -0,0 +1,125 @@
+import sys
+from textwrap import dedent
+
+import pytest
+
+from rocketry import Rocketry
+from rocketry.conds import daily
+from rocketry.tasks.discover import scan_tasks
+
+STATIC = dedent("""
+"Report tasks"
+from rocketry import Grouper
+import rocketry.test.app.test_discover as test_module
+
+group = Grouper(prefix="reports.", execution="main")
+
+@group.task("daily", parameters={"x": 5})
+def do_report(x):
+    return x * 2
+
+@group.task(name="the cleanup", execution="thread")
+def do_cleanup():
+    ...
+
+# The default is evaluated when imported
+def not_a_task(_=test_module.IMPORTED.append(__name__)):
+    ...
+""")
+
+DYNAMIC = dedent("""
+from rocketry import Grouper
+from rocketry.conds import daily
+
+group = Grouper()
+
+@group.task(daily)
+def do_dynamic():
+    ...
+""")
+
+PARAMS = dedent("""
+from rocketry import Grouper
+
+group = Grouper()
+group.params(x=5)
+
+@group.task("daily")
+def do_params(x):
+    return x
+""")
+
+CONDS = dedent("""
+from rocketry import Grouper
+
+group = Grouper()
+
+@group.cond("is ready2")
+def is_ready():
+    return True
+
+@group.task("is ready2")
+def do_when_ready():
+    return "done"
+""")
+
+IMPORTED = []
+
+@pytest.fixture(autouse=True)
+def reset_imported():
+    IMPORTED.clear()
+
+def test_scan(tmpdir):
+    file = tmpdir.join("mytasks.py")
+    file.write(STATIC)
+    assert scan_tasks(str(file)) == [
+        {"func_name": "do_report", "group": {"prefix": "reports.", "execution": "main"}, "kwargs": {"start_cond": "daily", "parameters": {"x": 5}}},
+        {"func_name": "do_cleanup", "group": {"prefix": "reports.", "execution": "main"}, "kwargs": {"name": "the cleanup", "execution": "thread"}},
+    ]
+    file.write(DYNAMIC)
+    assert scan_tasks(str(file)) is None
+
+def test_discover(tmpdir, session):
+    tmpdir.mkdir("tasks").join("static.py").write(STATIC)
+    tmpdir.join("tasks").join("dynamic.py").write(DYNAMIC)
+    app = Rocketry(config={"execution": "async"})
+
+    tasks = app.discover(tmpdir / "tasks")
+    assert {task.name for task in tasks} == {"reports.do_report", "reports.the cleanup", "do_dynamic"}
+    assert {task.name for task in app.session.tasks} == {"reports.do_report", "reports.the cleanup", "do_dynamic"}
+    assert IMPORTED == []
+
+    report = app.session["reports.do_report"]
+    assert report.execution == "main"
+    assert report.start_cond == daily
+    assert app.session["reports.the cleanup"].execution == "thread"
+    assert app.session["do_dynamic"].start_cond == daily
+
+    # Imported when run
+    report()
+    assert report.status == "success"
+    assert app.session.returns[report] == 10
+    assert len(IMPORTED) == 1
+
+@pytest.mark.parametrize("content", [PARAMS, CONDS], ids=["params", "conds"])
+def test_scan_other_statements(tmpdir, content):
+    # Statements that may affect the tasks
+    file = tmpdir.join("mytasks.py")
+    file.write(content)
+    assert scan_tasks(str(file)) is None
+
+def test_discover_params(tmpdir, session):
+    tmpdir.mkdir("tasks").join("params.py").write(PARAMS)
+    app = Rocketry(config={"execution": "main"})
+    app.discover(tmpdir / "tasks")
+    task = app.session["do_params"]
+    task()
+    assert task.status == "success"
+    assert app.session.returns[task] == 5
+
+def test_discover_conds(tmpdir, session):
+    tmpdir.mkdir("tasks").join("conds.py").write(CONDS)
+    app = Rocketry(config={"execution": "main"})
+    app.discover(tmpdir / "tasks")
+    task = app.session["do_when_ready"]
+    assert task.is_runnable()
@@ -0,0 +1,138 @@
+import threading
+import time
+
+from rocketry import Rocketry
+from rocketry.args import FuncArg, Task
+from rocketry.conditions import TaskStarted
+from rocketry.parameters import FuncParam
+from rocketry.tasks import FuncTask
+
+class MockTime:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def test_ttl(session):
+    mock_time = MockTime()
+    session.config.time_func = mock_time
+    calls = []
+    def get_value():
+        calls.append(mock_time.now)
+        return len(calls)
+
+    arg = FuncArg(get_value, cache_ttl="10 seconds")
+    assert arg.get_value(session=session) == 1
+    mock_time.now = 1009.0
+    assert arg.get_value(session=session) == 1
+
+    # Stale
+    mock_time.now = 1010.0
+    assert arg.get_value(session=session) == 2
+
+    arg.clear_cache()
+    assert arg.get_value(session=session) == 3
+    assert calls == [1000.0, 1010.0, 1010.0]
+
+def test_no_cache(session):
+    calls = []
+    arg = FuncArg(lambda: calls.append("called"))
+    arg.get_value(session=session)
+    arg.get_value(session=session)
+    assert calls == ["called", "called"]
+
+def test_by_task(session):
+    session.config.time_func = MockTime()
+    calls = []
+    def get_value(task=Task()):
+        calls.append(task.name)
+        return task.name
+
+    arg = FuncArg(get_value, cache_ttl=60, cache_size=2, cache_by_task=True)
+    task_a = FuncTask(lambda: None, name="a", session=session)
+    task_b = FuncTask(lambda: None, name="b", session=session)
+    task_c = FuncTask(lambda: None, name="c", session=session)
+
+    assert arg.get_value(task=task_a, session=session) == "a"
+    assert arg.get_value(task=task_b, session=session) == "b"
+    assert arg.get_value(task=task_a, session=session) == "a"
+    assert calls == ["a", "b"]
+
+    # "b" is evicted as least recently used
+    arg.get_value(task=task_c, session=session)
+    arg.get_value(task=task_b, session=session)
+    assert calls == ["a", "b", "c", "b"]
+
+    arg.clear_cache(task="b")
+    arg.get_value(task=task_b, session=session)
+    arg.get_value(task=task_c, session=session)
+    assert calls == ["a", "b", "c", "b", "b"]
+
+def test_threads(session):
+    calls = []
+    def get_value():
+        calls.append("called")
+        time.sleep(0.05)
+        return "value"
+
+    arg = FuncArg(get_value, cache_ttl=60)
+    values = []
+    threads = [
+        threading.Thread(target=lambda: values.append(arg.get_value(session=session)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert values == ["value"] * 5
+    assert calls == ["called"]
+
+def test_clear_from_parameters(session):
+    calls = []
+
+    @FuncParam(session=session, cache_ttl=60)
+    def my_param():
+        calls.append("called")
+        return len(calls)
+
+    assert session.parameters["my_param"] == 1
+    assert session.parameters["my_param"] == 1
+
+    session.parameters.clear_cache(my_param)
+    assert session.parameters["my_param"] == 2
+
+    # Unknown and non-cached keys are skipped
+    session.parameters["plain"] = 1
+    session.parameters.clear_cache("plain", "missing")
+    assert session.parameters["my_param"] == 2
+
+    # Plain values with their own clear_cache are left alone
+    class Client:
+        def __init__(self):
+            self.cleared = False
+        def clear_cache(self):
+            self.cleared = True
+    client = Client()
+    session.parameters["client"] = client
+    session.parameters.clear_cache()
+    assert not client.cleared
+    assert session.parameters["my_param"] == 3
+
+def test_app_param():
+    app = Rocketry(execution="async")
+    calls = []
+
+    @app.param("my_param", cache_ttl="1 hour")
+    def get_param():
+        calls.append("called")
+        return "value"
+
+    @app.task("true")
+    def do_things(my_param):
+        assert my_param == "value"
+
+    app.session.config.shut_cond = TaskStarted(task=do_things) >= 3
+    app.run()
+    assert calls == ["called"]
@@ -0,0 +1,181 @@
+import functools
+import threading
+import time
+
+import pytest
+
+from rocketry.args import FuncArg, PoolArg
+from rocketry.conditions import FuncCond, TaskStarted
+from rocketry.core.hook import _Hooker
+from rocketry.tasks import FuncTask
+
+class Resource:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def get_factory():
+    created = []
+    def create():
+        res = Resource(len(created))
+        created.append(res)
+        return res
+    return create, created
+
+def test_reuse(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=2, close=Resource.close)
+    used = []
+    def do_things(res=pool):
+        used.append(res)
+
+    task = FuncTask(do_things, execution="main", session=session, name="a task")
+    for _ in range(3):
+        task()
+    assert len(created) == 1
+    assert used == [created[0]] * 3
+    assert pool.stats["idle"] == 1
+    assert pool.stats["in_use"] == 0
+    assert pool.stats["checkouts"] == 3
+
+    pool.close()
+    assert created[0].closed
+    assert pool.stats["created"] == 0
+
+def test_release_on_failure(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1)
+    def do_fail(res=pool):
+        raise RuntimeError("Oops")
+
+    task = FuncTask(do_fail, execution="main", session=session, name="a task")
+    for _ in range(2):
+        task()
+    assert task.status == "fail"
+    assert len(created) == 1
+    assert pool.stats["idle"] == 1
+
+def test_discard_failed(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1, close=Resource.close, discard_failed=True)
+    def do_fail(res=pool):
+        raise RuntimeError("Oops")
+
+    task = FuncTask(do_fail, execution="main", session=session, name="a task")
+    task()
+    assert created[0].closed
+    assert pool.stats["created"] == 0
+
+def test_bound():
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=2, timeout=0.05)
+    res1 = pool.get_value()
+    res2 = pool.get_value()
+    assert res1 is not res2
+    with pytest.raises(TimeoutError):
+        pool.get_value()
+
+    pool.release(res1)
+    assert pool.get_value() is res1
+    assert len(created) == 2
+
+def test_wait():
+    factory, _ = get_factory()
+    pool = PoolArg(factory, size=1)
+    res = pool.get_value()
+    timer = threading.Timer(0.05, pool.release, args=(res,))
+    timer.start()
+    assert pool.get_value() is res
+    timer.join()
+    assert pool.stats["waits"] == 1
+    assert pool.stats["max_wait_time"] > 0
+
+def test_factory_fails():
+    def create():
+        raise RuntimeError("Oops")
+    pool = PoolArg(create, size=1, timeout=0.01)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            pool.get_value()
+    assert pool.stats["created"] == 0
+
+def test_no_checkout_on_compare():
+    factory, created = get_factory()
+    pool = PoolArg(factory)
+    assert pool == pool
+    assert pool != PoolArg(factory)
+    repr(pool)
+    assert pool.stage() is pool
+    assert created == []
+
+def test_pickle():
+    import pickle
+    pool = PoolArg(get_factory, size=3)
+    pool.release(pool.get_value())
+    unpickled = pickle.loads(pickle.dumps(pool))
+    assert unpickled.size == 3
+    assert unpickled.stats["created"] == 0
+
+def test_pickle_closes():
+    # Copies (ie. in child processes) close the resources after use
+    import pickle
+    pool = PoolArg(functools.partial(Resource, 0), size=3, close=Resource.close)
+    unpickled = pickle.loads(pickle.dumps(pool))
+    res = unpickled.get_value()
+    unpickled.release(res)
+    assert res.closed
+    assert unpickled.stats["created"] == 0
+    assert unpickled.stats["idle"] == 0
+
+def test_thread(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1)
+    used = []
+    def do_things(res=pool):
+        time.sleep(0.01)
+        used.append(res)
+
+    FuncTask(do_things, start_cond="every 1 second", execution="thread", session=session, name="task 1")
+    FuncTask(do_things, start_cond="every 1 second", execution="thread", session=session, name="task 2")
+    session.config.shut_cond = TaskStarted(task="task 1") & TaskStarted(task="task 2")
+    session.start()
+    # Let the threads finish
+    for _ in range(100):
+        if len(used) == 2:
+            break
+        time.sleep(0.01)
+    assert len(created) == 1
+    assert used == [created[0]] * 2
+
+def test_release_condition(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1, timeout=0.5)
+    cond = FuncCond(lambda res=pool: True)
+    for _ in range(2):
+        assert cond.observe(session=session)
+    assert len(created) == 1
+    assert pool.stats["idle"] == 1
+
+def test_release_func_arg(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1, timeout=0.5)
+    arg = FuncArg(lambda res=pool: res.n)
+    for _ in range(2):
+        assert arg(session=session) == 0
+    assert pool.stats["idle"] == 1
+
+def test_release_hook(session):
+    factory, created = get_factory()
+    pool = PoolArg(factory, size=1, timeout=0.5)
+    def hook(res=pool):
+        yield
+
+    hooker = _Hooker([hook])
+    for _ in range(2):
+        hooker.prerun(session=session)
+        assert pool.stats["in_use"] == 1
+        hooker.postrun(None, None, None)
+        assert pool.stats["idle"] == 1
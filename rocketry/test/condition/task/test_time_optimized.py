@@ -1,7 +1,11 @@
+import datetime
+
 import pytest
 
 from rocketry.conditions import (
     TaskStarted,
+    TaskExecutable,
+    TaskRunnable,
 
     TaskFinished,
     TaskFailed,
@@ -13,7 +17,7 @@ from rocketry.conditions.task import TaskInacted, TaskTerminated
 from rocketry.core.task import TaskRun
 from rocketry.pybox.time.convert import to_datetime, to_timestamp
 from rocketry.time import (
-    TimeOfDay
+    TimeOfDay, TimeOfHour, TimeOfWeek, TimeOfMonth, TimeDelta, Cron
 )
 from rocketry.tasks import FuncTask
 
@@ -165,3 +169,115 @@ def test_logs_used(session, cls, mock_datetime_now):
     else:
         cond = cls(task=task) == 1
     assert cond.observe(session=session)
+
+@pytest.mark.parametrize("get_cond,outcome",
+    [
+        pytest.param(lambda task: TaskStarted(task=task, period=TimeOfDay()) == 3, True, id="today"),
+        pytest.param(lambda task: TaskStarted(task=task, period=TimeOfDay()) == 2, False, id="today (false)"),
+        pytest.param(lambda task: TaskStarted(task=task, period=TimeOfDay("10:00", "12:00")) == 3, True, id="time of day"),
+        pytest.param(lambda task: TaskStarted(task=task, period=TimeOfHour()) == 1, True, id="this hour"),
+        pytest.param(lambda task: TaskSucceeded(task=task, period=TimeOfWeek()) == 2, True, id="this week"),
+        pytest.param(lambda task: TaskFinished(task=task, period=TimeOfMonth()) == 5, True, id="this month"),
+        pytest.param(lambda task: TaskFailed(task=task, period=TimeOfMonth()) == 1, True, id="this month (failed)"),
+    ]
+)
+def test_counts_used(session, mock_datetime_now, get_cond, outcome):
+    session.config.force_status_from_logs = False
+
+    task = FuncTask(
+        lambda:None,
+        name="the task",
+        execution="main",
+        session=session
+    )
+    logs = [
+        ("2021-01-01 10:00:00", "run"),
+        ("2021-01-01 10:10:00", "success"),
+        ("2021-01-01 12:00:00", "run"),
+        ("2021-01-01 12:10:00", "success"),
+        ("2021-01-04 10:00:00", "run"),
+        ("2021-01-04 10:10:00", "success"),
+        ("2021-01-06 10:00:00", "run"),
+        ("2021-01-06 10:10:00", "fail"),
+        ("2021-01-06 11:00:00", "run"),
+    ]
+    setup_task_state(mock_datetime_now, logs, task=task)
+    # Counted from the logs at startup
+    mock_datetime_now("2021-01-06 11:30")
+    task.set_cached()
+
+    # Later actions are counted on the fly
+    mock_datetime_now("2021-01-06 12:00")
+    task.log_running()
+    mock_datetime_now("2021-01-06 12:10")
+    task.log_success()
+    mock_datetime_now("2021-01-06 12:30")
+
+    # Logs are no longer read
+    task.logger.get_records = None
+
+    cond = get_cond(task)
+    assert cond.observe(session=session) == outcome
+
+@pytest.mark.parametrize("get_cond",
+    [
+        pytest.param(lambda: TaskExecutable(period=TimeOfDay()), id="daily"),
+        pytest.param(lambda: TaskExecutable(period=TimeOfDay("10:00", "12:00")), id="daily between"),
+        pytest.param(lambda: TaskExecutable(period=TimeOfHour()), id="hourly"),
+        pytest.param(lambda: TaskExecutable(period=TimeDelta("1 hour")), id="every (finish)"),
+        pytest.param(lambda: TaskStarted(period=TimeDelta("1 hour")) == 0, id="every"),
+        pytest.param(lambda: TaskRunnable(period=Cron("*/30")), id="cron"),
+    ]
+)
+def test_due_same_as_logs(session, mock_datetime_now, get_cond):
+    task = FuncTask(
+        lambda:None,
+        name="the task",
+        execution="main",
+        session=session
+    )
+    logs = {
+        "2021-01-01 10:00:00": "run",
+        "2021-01-01 10:10:00": "success",
+        "2021-01-01 11:55:00": "run",
+        "2021-01-01 12:00:00": "fail",
+        "2021-01-02 09:00:00": "run",
+        "2021-01-02 09:10:00": "inaction",
+    }
+    cond = get_cond()
+    times = [
+        datetime.datetime(2021, 1, 1, 9) + datetime.timedelta(minutes=5 * i)
+        for i in range(24 * 12 * 2)
+    ]
+    for now in times:
+        now = now.strftime("%Y-%m-%d %H:%M:%S")
+        mock_datetime_now(now)
+        if now in logs:
+            task._set_status(logs[now])
+        session.config.force_status_from_logs = True
+        expected = cond.observe(task=task, session=session)
+        session.config.force_status_from_logs = False
+        assert cond.observe(task=task, session=session) == expected, now
+
+def test_next_due(session, mock_datetime_now):
+    task = FuncTask(
+        lambda:None,
+        name="the task",
+        execution="main",
+        session=session
+    )
+    session.config.force_status_from_logs = False
+    daily = TaskExecutable(period=TimeOfDay("10:00", "12:00"))
+    every = TaskStarted(period=TimeDelta("1 hour")) == 0
+
+    mock_datetime_now("2021-01-01 09:00")
+    assert daily.get_next_due(task=task, session=session) == datetime.datetime(2021, 1, 1, 10)
+    assert every.get_next_due(task=task, session=session) == datetime.datetime(2021, 1, 1, 9)
+
+    mock_datetime_now("2021-01-01 10:00")
+    task.log_running()
+    task.log_success()
+    mock_datetime_now("2021-01-01 10:30")
+    assert not daily.observe(task=task, session=session)
+    assert daily.get_next_due(task=task, session=session) == datetime.datetime(2021, 1, 2, 10)
+    assert every.get_next_due(task=task, session=session) == datetime.datetime(2021, 1, 1, 11, 0, 0, 1)
@@ -0,0 +1,143 @@
+import re
+import time
+
+import pytest
+
+from rocketry import Rocketry
+from rocketry.conditions import FuncCond
+from rocketry.conditions.task.task import TaskStarted
+from rocketry.conds import true
+from rocketry.parse.condition import parse_condition
+
+class MockTime:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def test_ttl(session):
+    mock_time = MockTime()
+    session.config.time_func = mock_time
+    calls = []
+
+    @FuncCond(syntax="is foo", cache_ttl="10 seconds", session=session)
+    def is_foo():
+        calls.append(mock_time.now)
+        return True
+
+    cond = parse_condition("is foo", session=session)
+    assert cond.observe(session=session)
+    assert cond.observe(session=session)
+    assert calls == [1000.0]
+
+    mock_time.now = 1009.0
+    assert cond.observe(session=session)
+    assert calls == [1000.0]
+
+    # Stale
+    mock_time.now = 1010.0
+    assert cond.observe(session=session)
+    assert calls == [1000.0, 1010.0]
+
+    cond.clear_cache()
+    assert cond.observe(session=session)
+    assert calls == [1000.0, 1010.0, 1010.0]
+
+def test_shared_by_args(session):
+    session.config.time_func = MockTime()
+    calls = []
+
+    @FuncCond(syntax=re.compile(r"is foo (?P<val>.+)"), cache_ttl=60, session=session)
+    def is_foo(val):
+        calls.append(val)
+        return val == "true"
+
+    # Separately parsed conditions share the cache
+    assert parse_condition("is foo true", session=session).observe(session=session)
+    assert parse_condition("is foo true", session=session).observe(session=session)
+    assert not parse_condition("is foo false", session=session).observe(session=session)
+    assert calls == ["true", "false"]
+
+def test_size_bound(session):
+    session.config.time_func = MockTime()
+    calls = []
+
+    @FuncCond(cache_ttl=60, cache_size=2, session=session)
+    def is_foo(val):
+        calls.append(val)
+        return True
+
+    for val in ("a", "b", "c"):
+        is_foo(val).observe(session=session)
+    assert len(is_foo._cache) == 2
+
+    # "a" was evicted
+    is_foo("a").observe(session=session)
+    is_foo("c").observe(session=session)
+    assert calls == ["a", "b", "c", "a"]
+
+def test_background_refresh(session):
+    mock_time = MockTime()
+    session.config.time_func = mock_time
+    calls = []
+
+    @FuncCond(cache_ttl=10, cache_refresh=True, session=session)
+    def is_foo():
+        calls.append(mock_time.now)
+        return len(calls) == 1
+
+    assert is_foo.observe(session=session)
+
+    # Stale, last state is returned and refreshed in background
+    mock_time.now = 1020.0
+    assert is_foo.observe(session=session)
+    for _ in range(100):
+        if len(calls) == 2 and not is_foo._cache._refreshing:
+            break
+        time.sleep(0.01)
+    assert calls == [1000.0, 1020.0]
+    assert not is_foo.observe(session=session)
+
+def test_background_refresh_fail(session):
+    mock_time = MockTime()
+    session.config.time_func = mock_time
+    calls = []
+
+    @FuncCond(cache_ttl=10, cache_refresh=True, session=session)
+    def is_foo():
+        calls.append(mock_time.now)
+        if len(calls) > 1:
+            raise RuntimeError("Oops")
+        return True
+
+    assert is_foo.observe(session=session)
+    mock_time.now = 1020.0
+    assert is_foo.observe(session=session)
+    for _ in range(100):
+        if not is_foo._cache._refreshing:
+            break
+        time.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        is_foo.observe(session=session)
+
+def test_app_cond(session):
+    app = Rocketry(execution="async")
+    calls = []
+
+    @app.cond("is foo", cache_ttl="1 hour")
+    def is_foo():
+        calls.append("called")
+        return True
+
+    @app.task(true & is_foo)
+    def do_things():
+        ...
+
+    @app.task(true & is_foo)
+    def do_other_things():
+        ...
+
+    app.session.config.shut_cond = TaskStarted(task=do_things) >= 2
+    app.run()
+    assert calls == ["called"]
@@ -7,7 +7,7 @@ from rocketry.conditions import SchedulerCycles, SchedulerStarted, TaskStarted
 from rocketry import Session
 from rocketry.tasks import FuncTask
 
-N_PARSERS = len(Session._cls_cond_parsers)
+N_PARSERS = len(Session().get_cond_parsers())
 
 def is_foo(status):
     print(f"evaluating: {status}")
@@ -0,0 +1,119 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+from rocketry.conditions import AlwaysFalse, TaskStarted
+from rocketry.parse.condition import parse_condition
+from rocketry.parse.time import parse_time
+from rocketry.parse.utils import CondParser, ParserError, ParserIndex
+from rocketry.parse.utils.index import _get_first_token
+from rocketry.time import TimeOfDay
+
+@pytest.mark.parametrize("statement,expected", [
+    pytest.param("true", "true", id="string"),
+    pytest.param(re.compile(r"every (?P<past>.+)"), "every", id="prefix"),
+    pytest.param(re.compile(r"task '(?P<task>.+)' has failed"), "task", id="prefix (with args)"),
+    pytest.param(re.compile(r"secondly"), "secondly", id="literal"),
+    pytest.param(re.compile(r"(?P<x>.+) is true"), None, id="no prefix"),
+    pytest.param(re.compile(r"in ?past (?P<x>.+)"), None, id="optional space"),
+    pytest.param(re.compile(r"every (?P<past>.+)", re.IGNORECASE), None, id="ignore case"),
+    pytest.param(re.compile(r"is up|server (?P<x>.+) is down"), None, id="alternation"),
+    pytest.param(re.compile(r"task '(?P<task>.+)' (?:ran|failed)"), None, id="alternation in group"),
+    pytest.param(re.compile(r"(?:every) (?P<past>.+)"), None, id="group first"),
+])
+def test_first_token(statement, expected):
+    assert _get_first_token(statement) == expected
+
+def test_order():
+    parsers = {
+        re.compile(r"is (?P<x>.+)"): "first",
+        "is foo": "exact",
+        re.compile(r"(?P<x>.+) foo"): "generic",
+        re.compile(r"is foo"): "last",
+    }
+    index = ParserIndex(parsers)
+    assert index.match("is bar") == (re.compile(r"is (?P<x>.+)"), {"x": "bar"})
+    assert index.match("is foo") == (re.compile(r"is (?P<x>.+)"), {"x": "foo"})
+    assert index.match("was foo") == (re.compile(r"(?P<x>.+) foo"), {"x": "was"})
+    assert index.match("nothing") is None
+
+    parsers = {"is foo": "exact", re.compile(r"is (?P<x>.+)"): "pattern"}
+    assert ParserIndex(parsers).match("is foo") == ("is foo", {})
+
+def test_alternation(session):
+    session._cond_parsers[re.compile(r"is up|server (?P<task>.+) is down")] = lambda task=None: TaskStarted(task=task)
+    assert parse_condition("server a is down", session=session) == TaskStarted(task="a")
+    assert parse_condition("is up", session=session) == TaskStarted()
+
+def test_cache_bounded():
+    index = ParserIndex({re.compile(r"is (?P<x>.+)"): "pattern"}, maxsize=2)
+    for s in ("is a", "is b", "is c", "is a"):
+        index.match(s)
+    assert list(index.cache) == ["is c", "is a"]
+
+def test_new_parser(session):
+    with pytest.raises(ParserError):
+        parse_condition("is foo", session=session)
+
+    session._cond_parsers[re.compile(r"is (?P<task>.+)")] = TaskStarted
+    assert parse_condition("is foo", session=session) == TaskStarted(task="foo")
+
+    # Replaced parser
+    session._cond_parsers[re.compile(r"is (?P<task>.+)")] = lambda task: TaskStarted(task=task + " bar")
+    assert parse_condition("is foo", session=session) == TaskStarted(task="foo bar")
+
+def test_not_shared(session):
+    cond = parse_condition("has started", session=session)
+    assert cond == parse_condition("has started", session=session)
+    assert cond is not parse_condition("has started", session=session)
+
+def test_cond_parser_cached(session):
+    calls = []
+    def func(x):
+        calls.append(x)
+        return TaskStarted(task=x)
+    session._cond_parsers[re.compile(r"is cached (?P<x>.+)")] = CondParser(func, session=session, cached=True)
+    session._cond_parsers[re.compile(r"is not cached (?P<x>.+)")] = CondParser(func, session=session, cached=False)
+
+    assert parse_condition("is cached foo", session=session) is parse_condition("is cached foo", session=session)
+    assert parse_condition("is not cached foo", session=session) is not parse_condition("is not cached foo", session=session)
+    assert calls == ["foo", "foo", "foo"]
+
+def test_time_shared(session):
+    period = parse_time("time of day between 10:00 and 12:00", session=session)
+    assert period == TimeOfDay("10:00", "12:00")
+    assert period is parse_time("time of day between 10:00 and 12:00", session=session)
+
+def test_time_parser_replaced(session):
+    # Time parsers are shared by the sessions
+    parsers = session._time_parsers
+    try:
+        parsers["my period"] = TimeOfDay("10:00", "12:00")
+        assert parse_time("my period", session=session) == TimeOfDay("10:00", "12:00")
+
+        # Replaced under the same statement
+        parsers["my period"] = TimeOfDay("13:00", "14:00")
+        assert parse_time("my period", session=session) == TimeOfDay("13:00", "14:00")
+    finally:
+        parsers.pop("my period", None)
+
+def test_import_deferred():
+    # Parsers and slow dependencies are not imported with Rocketry
+    code = "import sys, rocketry; print([m for m in ('rocketry.parse._setup_cond_parsers', 'dateutil', 'redbird.repos') if m in sys.modules])"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == "[]"
+
+def test_session_overrides_default(session):
+    session._cond_parsers["true"] = AlwaysFalse()
+    assert parse_condition("true", session=session) == AlwaysFalse()
+    assert parse_condition("has started", session=session) == TaskStarted()
+
+def test_index_versioned(session):
+    parse_condition("true", session=session)
+    index = session._parser_indexes["condition"]
+    assert index.is_valid(session._cond_parsers)
+    session._cond_parsers["is new"] = AlwaysFalse()
+    assert not index.is_valid(session._cond_parsers)
+    assert parse_condition("is new", session=session) == AlwaysFalse()
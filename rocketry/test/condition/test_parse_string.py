@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from rocketry.conditions import All, Any, Not, AlwaysTrue, AlwaysFalse
+from rocketry.parse.condition import parse_condition
+from rocketry.parse.utils import ParserError
+from rocketry.parse.utils.string_parser import InstructionParser
+
+class Node:
+    def __init__(self, *args):
+        self.args = args
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self.args == other.args
+
+    def __repr__(self):
+        return f"Node{self.args!r}"
+
+PARSER = InstructionParser(
+    lambda s: s,
+    operators=[
+        {"symbol": "~", "func": lambda a: Node("not", a), "side": "right"},
+        {"symbol": "&", "func": lambda *args: Node("and", *args), "side": "both"},
+        {"symbol": "|", "func": lambda *args: Node("or", *args), "side": "both"},
+    ]
+)
+
+@pytest.mark.parametrize("s,expected", [
+    pytest.param("a", "a", id="item"),
+    pytest.param(" a b ", "a b", id="item (whitespace)"),
+    pytest.param("a & b", Node("and", "a", "b"), id="and"),
+    pytest.param("a & b & c", Node("and", "a", "b", "c"), id="chained"),
+    pytest.param("a | b & c", Node("or", "a", Node("and", "b", "c")), id="precedence"),
+    pytest.param("~a & b", Node("and", Node("not", "a"), "b"), id="not"),
+    pytest.param("~~a", Node("not", Node("not", "a")), id="double not"),
+    pytest.param("(a | b) & c", Node("and", Node("or", "a", "b"), "c"), id="parentheses"),
+    pytest.param(" ~ ((a)) | (b & ~(c))", Node("or", Node("not", "a"), Node("and", "b", Node("not", "c"))), id="nested"),
+])
+def test_parse(s, expected):
+    assert PARSER(s) == expected
+
+@pytest.mark.parametrize("s,exc", [
+    pytest.param("", IndexError, id="empty"),
+    pytest.param("a &", IndexError, id="missing right"),
+    pytest.param("& a", IndexError, id="missing left"),
+    pytest.param("()", IndexError, id="empty parentheses"),
+    pytest.param("(a", ParserError, id="missing closing"),
+    pytest.param("a)", ParserError, id="missing opening"),
+    pytest.param("a (b)", ParserError, id="missing operator"),
+])
+def test_invalid(s, exc):
+    with pytest.raises(exc):
+        PARSER(s)
+
+def test_long(session):
+    cond = parse_condition(" | ".join(["true & ~false"] * 1000), session=session)
+    assert cond == Any(*[All(AlwaysTrue(), Not(AlwaysFalse()))] * 1000)
+
+def test_linear(session):
+    def measure(n):
+        s = " | ".join(["true"] * n)
+        start = time.perf_counter()
+        parse_condition(s, session=session)
+        return time.perf_counter() - start
+    measure(100) # Warm up the caches
+    # Quadratic parsing would take ~9 times longer
+    assert measure(6000) < 4 * measure(2000) + 0.05
@@ -0,0 +1,78 @@
+import datetime
+import threading
+
+from rocketry.core.log import ActionCounter
+
+def to_ts(s):
+    return datetime.datetime.fromisoformat(s).timestamp()
+
+def dt(s):
+    return datetime.datetime.fromisoformat(s)
+
+def test_count():
+    counter = ActionCounter()
+    assert counter.count("run", dt("2022-01-01 00:00"), dt("2022-01-02 00:00")) is None
+
+    counter.rebuild(
+        [
+            {"action": "run", "created": to_ts("2022-01-01 10:00")},
+            {"action": "success", "created": to_ts("2022-01-01 10:05")},
+        ],
+        since=dt("2022-01-01 00:00")
+    )
+    counter.add("run", to_ts("2022-01-02 00:00"))
+    counter.add("fail", to_ts("2022-01-02 00:30:30"))
+
+    assert counter.count("run", dt("2022-01-01 00:00"), dt("2022-01-01 23:59:59")) == 1
+    # End is inclusive
+    assert counter.count("run", dt("2022-01-01 00:00"), dt("2022-01-02 00:00")) == 2
+    assert counter.count(["success", "fail"], dt("2022-01-01 00:00"), dt("2022-01-02 12:00")) == 2
+    assert counter.count("run", dt("2022-01-03 00:00"), dt("2022-01-03 12:00")) == 0
+
+    # Counted using smaller buckets
+    assert counter.count("fail", dt("2022-01-02 00:00"), dt("2022-01-02 00:10")) == 0
+    # Something occurred after the end in the last bucket
+    assert counter.count("fail", dt("2022-01-02 00:00"), dt("2022-01-02 00:30:10")) is None
+    # Not aligned to a bucket or before the counts
+    assert counter.count("run", dt("2022-01-01 10:00:30"), dt("2022-01-01 12:00")) is None
+    assert counter.count("run", dt("2021-12-31 00:00"), dt("2022-01-01 12:00")) is None
+
+def test_retention():
+    counter = ActionCounter(retention={"minute": datetime.timedelta(minutes=10)})
+    counter.rebuild([], since=dt("2022-01-01 00:00"))
+    counter.add("run", to_ts("2022-01-01 10:00:30"))
+    counter.add("run", to_ts("2022-01-01 11:00:30"))
+
+    assert len(counter._counts["run"]["minute"]) == 1
+    assert counter.count("run", dt("2022-01-01 10:00"), dt("2022-01-01 10:00:59")) is None
+    assert counter.count("run", dt("2022-01-01 11:00"), dt("2022-01-01 11:00:59")) == 1
+    # Coarser buckets are kept
+    assert counter.count("run", dt("2022-01-01 10:00"), dt("2022-01-01 11:00")) == 1
+
+def test_threaded():
+    counter = ActionCounter(retention={"minute": datetime.timedelta(minutes=10)})
+    counter.rebuild([], since=dt("2022-01-01 00:00"))
+    start = to_ts("2022-01-01 00:00")
+    errors = []
+
+    def add(action):
+        try:
+            for i in range(2000):
+                counter.add(action, start + i * 60)
+        except Exception as exc:
+            errors.append(exc)
+
+    def count():
+        try:
+            for _ in range(2000):
+                counter.count(["a", "b"], dt("2022-01-01 00:00"), dt("2022-01-02 00:00"))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=add, args=(action,)) for action in "ab"] + [threading.Thread(target=count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert counter.count(["a", "b"], dt("2022-01-01 00:00"), dt("2022-01-02 23:59:59")) == 4000
@@ -0,0 +1,47 @@
+from functools import partial
+
+from rocketry.args import Arg, Session as SessionArg
+from rocketry.core import Parameters
+from rocketry.core.utils import filter_keyword_args, get_func_plan
+from rocketry.tasks import FuncTask
+
+def myfunc(a, b=Arg("b"), *args, c=SessionArg(), **kwargs):
+    ...
+
+class MyClass:
+    def method(self, a, b=1):
+        ...
+
+def test_plan():
+    plan = get_func_plan(myfunc)
+    assert plan.kw_args == ("a", "b", "c")
+    assert plan.pos_args == ("a", "b")
+    assert list(plan.defaults) == ["b", "c"]
+    assert isinstance(plan.defaults["c"], SessionArg)
+
+    # Cached
+    assert get_func_plan(myfunc) is plan
+
+def test_plan_method():
+    plan = get_func_plan(MyClass().method)
+    assert plan.kw_args == ("a", "b")
+    assert get_func_plan(MyClass().method) is plan
+
+    # Unbound has self
+    assert get_func_plan(MyClass.method).kw_args == ("self", "a", "b")
+
+def test_plan_uncacheable():
+    func = partial(myfunc, 1)
+    assert get_func_plan(func).kw_args == ("b", "c")
+    assert filter_keyword_args(func, {"a": 0, "b": 1, "x": 2}) == {"b": 1}
+
+def test_from_signature():
+    params = Parameters._from_signature(myfunc)
+    assert list(params.keys()) == ["b", "c"]
+    assert params.to_dict()["b"] is get_func_plan(myfunc).defaults["b"]
+
+def test_task_params(session):
+    session.parameters.update({"a": "session a", "b": "session b", "x": "not used"})
+    task = FuncTask(myfunc, execution="main", session=session)
+    params = task.get_extra_params({"a": "passed a"}, execution="main")
+    assert dict(params.items()) == {"a": "passed a", "b": "session b"}
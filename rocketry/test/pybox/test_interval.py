@@ -1,6 +1,6 @@
 from datetime import datetime
 import pytest
-from rocketry.pybox.time import Interval, to_datetime
+from rocketry.pybox.time import Interval, IntervalSet, to_datetime
 
 @pytest.mark.parametrize("l,r",
     [
@@ -75,3 +75,41 @@ def test_empty():
 def test_repr():
     for closed in ("left", "right", "neither"):
         assert repr(Interval(datetime(2022, 1, 1), datetime(2022, 1, 1), closed=closed))
+
+def test_set_and_or():
+    a = IntervalSet([
+        Interval(datetime(2022, 1, 1), datetime(2022, 1, 5)),
+        Interval(datetime(2022, 1, 10), datetime(2022, 1, 20)),
+    ])
+    b = IntervalSet([
+        Interval(datetime(2022, 1, 4), datetime(2022, 1, 12)),
+        Interval(datetime(2022, 1, 15), datetime(2022, 1, 16), closed="both"),
+        Interval(datetime(2022, 1, 20), datetime(2022, 1, 25)),
+    ])
+    assert list(a & b) == [
+        Interval(datetime(2022, 1, 4), datetime(2022, 1, 5)),
+        Interval(datetime(2022, 1, 10), datetime(2022, 1, 12)),
+        Interval(datetime(2022, 1, 15), datetime(2022, 1, 16), closed="both"),
+    ]
+    assert list(a | b) == [
+        Interval(datetime(2022, 1, 1), datetime(2022, 1, 20)),
+        Interval(datetime(2022, 1, 20), datetime(2022, 1, 25)),
+    ]
+
+def test_set_roll():
+    intervals = IntervalSet([
+        Interval(datetime(2022, 1, 10), datetime(2022, 1, 20)),
+        Interval(datetime(2022, 1, 1), datetime(2022, 1, 5)),
+    ])
+    assert datetime(2022, 1, 1) in intervals
+    assert datetime(2022, 1, 5) not in intervals
+    assert datetime(2022, 1, 19) in intervals
+
+    assert intervals.rollforward(datetime(2022, 1, 3)) == Interval(datetime(2022, 1, 3), datetime(2022, 1, 5))
+    assert intervals.rollforward(datetime(2022, 1, 5)) == Interval(datetime(2022, 1, 10), datetime(2022, 1, 20))
+    assert intervals.rollforward(datetime(2022, 1, 20)) is None
+
+    assert intervals.rollback(datetime(2022, 1, 15)) == Interval(datetime(2022, 1, 10), datetime(2022, 1, 15))
+    assert intervals.rollback(datetime(2022, 1, 10)) == Interval(datetime(2022, 1, 10), datetime(2022, 1, 10), closed="both")
+    assert intervals.rollback(datetime(2022, 1, 8)) == Interval(datetime(2022, 1, 1), datetime(2022, 1, 5))
+    assert intervals.rollback(datetime(2021, 12, 31)) is None
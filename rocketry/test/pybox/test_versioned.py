@@ -0,0 +1,24 @@
+from rocketry.pybox.container.versioned import VersionedDict
+
+def test_version():
+    d = VersionedDict(a=1)
+    assert d.version == 0
+    d["b"] = 2
+    del d["a"]
+    d.update(c=3)
+    d |= {"d": 4}
+    d.setdefault("b", 5)
+    assert d.version == 4
+    d.setdefault("e", 5)
+    d.pop("e")
+    d.popitem()
+    d.clear()
+    assert d.version == 8
+    assert d == {}
+
+def test_copy():
+    d = VersionedDict(a=1)
+    copied = d.copy()
+    assert isinstance(copied, VersionedDict)
+    copied["b"] = 2
+    assert d == {"a": 1}
@@ -0,0 +1,155 @@
+import multiprocessing
+import time
+
+import pytest
+
+from rocketry.conditions import SchedulerCycles, TaskSucceeded
+from rocketry.core.job_queue import JobQueue
+from rocketry.tasks import FuncTask
+
+def do_record(file, out):
+    with open(out, "a") as f:
+        f.write(file + "\n")
+
+def do_fail(file, out):
+    raise RuntimeError("Oops")
+
+class AliveRun:
+    def is_alive(self):
+        return True
+
+def put_jobs(path, n):
+    queue = JobQueue(path, name="files")
+    queue.put_many({"file": f"file_{i}.csv"} for i in range(n))
+
+def test_queue(tmpdir):
+    queue = JobQueue(tmpdir / "jobs.db", name="files", max_attempts=2)
+    assert queue.claim() is None
+    queue.put(file="a.csv")
+    queue.put({"file": "b.csv"})
+    assert len(queue) == 2
+
+    job = queue.claim()
+    assert job.params == {"file": "a.csv"}
+    assert job.attempts == 1
+    queue.finish(job, status="succeeded")
+
+    job = queue.claim()
+    assert job.params == {"file": "b.csv"}
+    assert queue.claim() is None
+    queue.finish(job, status="failed", error="RuntimeError()")
+
+    # Retried once more
+    job = queue.claim()
+    assert job.attempts == 2
+    queue.finish(job, status="failed")
+    assert queue.claim() is None
+    assert [job.params for job in queue.get_failed()] == [{"file": "b.csv"}]
+
+    stats = queue.stats()
+    assert stats["pending"] == 0
+    assert stats["failed"] == 1
+    assert stats["succeeded_recently"] == 1
+    assert stats["failed_recently"] == 2
+
+    assert queue.retry_failed() == 1
+    assert queue.claim().params == {"file": "b.csv"}
+
+def test_visibility_timeout(tmpdir):
+    queue = JobQueue(tmpdir / "jobs.db", visibility_timeout=0.05)
+    queue.put(x=1)
+    job = queue.claim()
+    # The run crashed
+    assert queue.claim() is None
+    time.sleep(0.1)
+    job = queue.claim()
+    assert job.params == {"x": 1}
+    assert job.attempts == 2
+
+def test_claim_ownership(tmpdir):
+    queue = JobQueue(tmpdir / "jobs.db", visibility_timeout=0.05)
+    queue.put(x=1)
+    slow = queue.claim()
+    time.sleep(0.1)
+    # The slow run exceeded the timeout
+    job = queue.claim()
+    assert not queue.extend(slow)
+    assert not queue.finish(slow, status="succeeded")
+    assert len(queue) == 1
+    assert queue.stats()["succeeded_recently"] == 0
+
+    assert queue.finish(job, status="succeeded")
+    assert len(queue) == 0
+
+def test_extend(tmpdir):
+    queue = JobQueue(tmpdir / "jobs.db", visibility_timeout=0.05)
+    queue.put(x=1)
+    job = queue.claim()
+    assert queue.extend(job, timeout=60)
+    time.sleep(0.1)
+    assert queue.claim() is None
+    assert queue.finish(job, status="succeeded")
+
+def test_durable(tmpdir):
+    path = tmpdir / "jobs.db"
+    JobQueue(path, name="files").put(file="a.csv")
+    JobQueue(path, name="others").put(file="b.csv")
+    assert JobQueue(path, name="files").claim().params == {"file": "a.csv"}
+
+def test_put_from_process(tmpdir):
+    path = str(tmpdir / "jobs.db")
+    JobQueue(path, name="files")
+    proc = multiprocessing.Process(target=put_jobs, args=(path, 10))
+    proc.start()
+    proc.join()
+    assert len(JobQueue(path, name="files")) == 10
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_consume(tmpdir, session, execution):
+    out = tmpdir / "out.txt"
+    queue = JobQueue(tmpdir / "jobs.db", name="files", consumers=3)
+    task = FuncTask(
+        do_record, name="consumer", execution=execution,
+        job_queue=queue, multilaunch=True,
+        parameters={"out": str(out)}, session=session
+    )
+    task.run(file="file_0.csv")
+    put_jobs(str(tmpdir / "jobs.db"), 5)
+    assert len(queue) == 6
+    assert not task.batches
+
+    session.config.shut_cond = TaskSucceeded(task="consumer") >= 6
+    session.start()
+    # Processes mark the jobs done after logging
+    for _ in range(100):
+        if len(queue) == 0:
+            break
+        time.sleep(0.01)
+    assert len(queue) == 0
+    assert sorted(out.read().splitlines()) == sorted(["file_0.csv"] + [f"file_{i}.csv" for i in range(5)])
+    assert task.logger.filter_by(action="success").count() == 6
+    assert queue.stats()["succeeded_recently"] == 6
+
+def test_consume_fail(tmpdir, session):
+    queue = JobQueue(tmpdir / "jobs.db", max_attempts=2)
+    task = FuncTask(do_fail, name="consumer", execution="main", job_queue=queue, parameters={"out": "x"}, session=session)
+    task.run(file="a.csv")
+
+    session.config.shut_cond = SchedulerCycles() >= 5
+    session.start()
+    assert task.logger.filter_by(action="fail").count() == 2
+    failed = queue.get_failed()
+    assert len(failed) == 1
+    assert len(queue) == 0
+
+def test_consumers_limit(tmpdir, session):
+    queue = JobQueue(tmpdir / "jobs.db", consumers=2)
+    task = FuncTask(do_record, name="consumer", execution="thread", job_queue=queue, multilaunch=True, session=session)
+    for i in range(5):
+        queue.put(file=str(i), out=str(tmpdir / "out.txt"))
+    assert session.scheduler.is_task_runnable(task)
+
+    # Two runs alive
+    task._run_stack = [AliveRun(), AliveRun()]
+    assert not session.scheduler.is_task_runnable(task)
+    task._run_stack = []
@@ -3,9 +3,10 @@ import logging
 import time
 
 import pytest
-from rocketry.conditions.scheduler import SchedulerStarted
+from rocketry.conditions.scheduler import SchedulerCycles, SchedulerStarted
 from rocketry.core.time.base import TimeDelta
 
+from rocketry.args import Task, Session
 from rocketry.tasks import FuncTask
 from rocketry.conditions import TaskStarted, DependSuccess
 
@@ -65,3 +66,66 @@ def test_dependent(tmpdir, execution, session):
 
         assert a_start < after_a_start < after_all_start
         assert b_start < after_b_start < after_all_start
+
+def test_dependent_skip_checks(session):
+    checks = []
+
+    class CountedDependSuccess(DependSuccess):
+        def get_state(self, task=Task(default=None), session=Session()):
+            checks.append(self.depend_task)
+            return super().get_state(task=task, session=session)
+
+    task_a = FuncTask(run_succeeding, name="A", start_cond=~TaskStarted(), execution="main", session=session)
+    task_b = FuncTask(
+        run_succeeding,
+        name="B",
+        start_cond=CountedDependSuccess(depend_task="A"),
+        execution="main",
+        session=session
+    )
+
+    session.config.shut_cond = SchedulerCycles() >= 10
+    session.start()
+
+    assert task_b.last_run is not None
+    assert task_b.last_run > task_a.last_success
+    # Checked only when A or B have logged something
+    # (not on every cycle)
+    assert 2 <= len(checks) <= 3
+
+@pytest.mark.parametrize("execution", ["main", "async", "thread"])
+def test_dependent_wake_up(execution, session):
+    # Downstream tasks are created first so that they are checked
+    # before their upstream in a cycle
+    session.config.cycle_sleep = 2
+    names = [f"step {i}" for i in range(8)]
+    for i in reversed(range(1, 8)):
+        FuncTask(
+            run_succeeding, name=names[i],
+            start_cond=DependSuccess(depend_task=names[i-1]),
+            execution=execution, session=session
+        )
+    FuncTask(run_succeeding, name=names[0], start_cond=~TaskStarted(), execution=execution, session=session)
+
+    session.config.shut_cond = (TaskStarted(task=names[-1]) >= 1) | ~SchedulerStarted(period=TimeDelta("20 seconds"))
+    start = time.time()
+    session.start()
+    # Without waking up this would take at least 16 seconds
+    assert time.time() - start < 8
+    assert session[names[-1]].last_run is not None
+
+def test_dependent_same_cycle(session):
+    session.config.dispatch_dependents = "same_cycle"
+    names = [f"step {i}" for i in range(5)]
+    for i in reversed(range(1, 5)):
+        FuncTask(
+            run_succeeding, name=names[i],
+            start_cond=DependSuccess(depend_task=names[i-1]),
+            execution="main", session=session
+        )
+    FuncTask(run_succeeding, name=names[0], start_cond=~TaskStarted(), execution="main", session=session)
+
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    for name in names:
+        assert session[name].last_success is not None
@@ -4,6 +4,7 @@ from rocketry.conditions.task.task import TaskStarted
 from rocketry.core.parameters.parameters import Parameters
 from rocketry.tasks import FuncTask
 from rocketry.conditions import SchedulerCycles, AlwaysFalse
+from rocketry.exc import TaskRunQueueFull
 
 def run_succeeding():
     pass
@@ -87,6 +88,77 @@ def test_set_running_disabled(execution, session):
 
     assert task.disabled
 
+def test_run_coalesce(session):
+    task = FuncTask(
+        run_parametrized,
+        start_cond=AlwaysFalse(),
+        name="task",
+        execution="main",
+        coalesce_runs=True,
+        session=session
+    )
+    for _ in range(100):
+        task.run(arg="correct")
+    task.run(arg="incorrect")
+    task.run(arg="correct")
+    assert task.batches == [Parameters({"arg": "correct"}), Parameters({"arg": "incorrect"})]
+
+    session.config.shut_cond = SchedulerCycles() >= 3
+    session.start()
+    assert task.batches == []
+    assert 2 == task.logger.filter_by(action="run").count()
+
+    # Queued again after the run
+    task.run(arg="correct")
+    assert len(task.batches) == 1
+
+@pytest.mark.parametrize("on_full", ["raise", "drop", "drop_oldest"])
+def test_run_queue_full(session, on_full):
+    task = FuncTask(
+        run_parametrized,
+        start_cond=AlwaysFalse(),
+        name="task",
+        execution="main",
+        max_queued_runs=2,
+        on_queue_full=on_full,
+        session=session
+    )
+    task.run(arg=1)
+    task.run(arg=2)
+    if on_full == "raise":
+        with pytest.raises(TaskRunQueueFull):
+            task.run(arg=3)
+        assert task.batches == [Parameters({"arg": 1}), Parameters({"arg": 2})]
+    elif on_full == "drop":
+        task.run(arg=3)
+        assert task.batches == [Parameters({"arg": 1}), Parameters({"arg": 2})]
+    else:
+        task.run(arg=3)
+        assert task.batches == [Parameters({"arg": 2}), Parameters({"arg": 3})]
+
+@pytest.mark.parametrize("multilaunch", [True, False])
+def test_run_queue_multilaunch(session, multilaunch):
+    task = FuncTask(
+        run_succeeding,
+        start_cond=AlwaysFalse(),
+        name="task",
+        execution="async",
+        multilaunch=multilaunch,
+        session=session
+    )
+    for _ in range(3):
+        task.run()
+
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    if multilaunch:
+        # All launched in the first cycle
+        assert task.batches == []
+        assert 3 == task.logger.filter_by(action="run").count()
+    else:
+        assert len(task.batches) == 2
+        assert 1 == task.logger.filter_by(action="run").count()
+
 # Deprecated
 # ----------
 
@@ -1,9 +1,13 @@
 
+import datetime
 import logging
+import pickle
+import threading
 
 import pytest
 from rocketry import Session
-from rocketry.core import Parameters
+from rocketry.args import Session as SessionArg
+from rocketry.core import BaseCondition, Parameters
 from rocketry.core.log.adapter import TaskAdapter
 from rocketry.tasks import FuncTask
 
@@ -92,6 +96,36 @@ def test_create(session):
         ...
     assert session.tasks == {session['do_func'], session['do_command']}
 
+def test_create_many(session):
+    session.config.task_pre_exist = "raise"
+    session.create_task(name="existing", command="echo 'hello world'")
+
+    def do_things():
+        ...
+    tasks = session.create_tasks(
+        [{"name": "do_func", "func": do_things, "start_cond": "daily", "execution": "main"}]
+        + [{"name": f"do_command {i}", "command": "echo 'hello world'", "start_cond": "daily"} for i in range(10)]
+    )
+    assert len(tasks) == 11
+    assert len(session.tasks) == 12
+    assert session["do_command 9"] is tasks[-1]
+    assert session["do_func"].start_cond == session["do_command 0"].start_cond
+    assert session["do_func"].start_cond is not session["do_command 0"].start_cond
+    assert session._task_index is None
+
+    # Nothing created if a name exists
+    for specs in ([{"name": "new", "command": "echo"}, {"name": "existing", "command": "echo"}],
+                  [{"name": "new", "command": "echo"}, {"name": "new", "command": "echo"}]):
+        with pytest.raises(ValueError):
+            session.create_tasks(specs)
+    assert "new" not in session
+    assert len(session.tasks) == 12
+
+def test_create_many_rename(session):
+    session.config.task_pre_exist = "rename"
+    session.create_tasks([{"name": "a task", "command": "echo"}, {"name": "a task", "command": "echo"}])
+    assert {task.name for task in session.tasks} == {"a task", "a task - 1"}
+
 def test_remove(session):
     task_1 = FuncTask(
         lambda : None,
@@ -178,3 +212,56 @@ def test_clear(session):
 
     assert session.tasks == set()
     assert Parameters() == session.parameters
+
+def test_time_snapshot(session):
+    times = iter(range(1_000, 2_000))
+    session.config.time_func = lambda: float(next(times))
+
+    with session.time_snapshot() as (timestamp, now):
+        assert timestamp == 1000.0
+        assert now == datetime.datetime.fromtimestamp(1000.0)
+        assert session._get_time_now() == 1000.0
+        assert session._get_datetime_now() is now
+        with session.time_snapshot() as nested:
+            assert nested == (timestamp, now)
+
+        # Other threads measure the time themselves
+        others = []
+        thread = threading.Thread(target=lambda: others.append(session._get_time_now()))
+        thread.start()
+        thread.join()
+        assert others == [1001.0]
+
+        # Logging is not affected
+        assert session.get_time() == 1002.0
+
+    assert session._get_time_now() == 1003.0
+    assert session._get_datetime_now() == datetime.datetime.fromtimestamp(1004.0)
+
+class NowCond(BaseCondition):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get_state(self, session=SessionArg()):
+        self.calls.append(session._get_datetime_now())
+        return True
+
+def test_time_snapshot_cond(session):
+    times = iter(range(1_000, 2_000))
+    session.config.time_func = lambda: float(next(times))
+    calls = []
+    cond = NowCond(calls)
+    task = FuncTask(lambda: None, name="a", start_cond=cond & cond & cond, execution="main", session=session)
+
+    assert session.scheduler.check_task_cond(task)
+    assert len(calls) == 3
+    assert calls[0] == calls[1] == calls[2]
+
+    assert session.scheduler.check_task_cond(task)
+    assert calls[3] > calls[2]
+
+def test_time_snapshot_pickle(session):
+    session = pickle.loads(pickle.dumps(session))
+    with session.time_snapshot() as (timestamp, now):
+        assert isinstance(timestamp, float)
+        assert isinstance(now, datetime.datetime)
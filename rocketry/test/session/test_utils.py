@@ -1,7 +1,7 @@
 from rocketry.conditions.task import DependFailure, DependSuccess
 from rocketry.core.condition.base import All, Any
 from rocketry.tasks import FuncTask
-from rocketry.utils.dependencies import Dependencies, Link, get_dependencies
+from rocketry.utils.dependencies import Dependencies, DependencyGraph, Link, get_dependencies
 
 def test_dependency(session):
     ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main", session=session)
@@ -49,3 +49,53 @@ def test_link(session):
     assert str(Link(ta, tb, relation=DependSuccess, type=All)) == "'a' -> 'b' (multi)"
 
     assert repr(Link(ta, tb, relation=DependSuccess, type=All)) == "Link('a', 'b', relation=DependSuccess, type=All)"
+
+def test_dependency_graph(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main", session=session)
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main", session=session)
+    tc = FuncTask(lambda: None, name="c", start_cond="after task 'a' & ~after task 'b' failed", execution="main", session=session)
+    td = FuncTask(lambda: None, name="d", start_cond="after task 'a' | daily", execution="main", session=session)
+
+    graph = DependencyGraph(session)
+    graph.refresh()
+
+    assert graph.get_children("a") == {"b", "c", "d"}
+    assert graph.get_children("b") == {"c"}
+    assert graph.get_children("d") == set()
+    assert not graph.is_tracked(ta)
+    assert graph.is_tracked(tb)
+    assert graph.is_tracked(tc)
+    assert not graph.is_tracked(td)
+
+    graph.set_state(tb, False)
+    graph.set_state(tc, False)
+    graph.set_state(td, False)
+    assert graph.is_clean(tb)
+    assert graph.is_clean(tc)
+    assert not graph.is_clean(td)
+
+    graph.mark_dirty(tb)
+    assert not graph.is_clean(tb)
+    assert not graph.is_clean(tc)
+
+    graph.set_state(tb, False)
+    graph.set_state(tc, False)
+    graph.mark_dirty(ta)
+    assert not graph.is_clean(tb)
+    assert not graph.is_clean(tc)
+
+    # Parent finished while the condition was checked
+    generation = graph.get_generation(tb)
+    graph.mark_dirty(ta)
+    graph.set_state(tb, False, generation=generation)
+    assert not graph.is_clean(tb)
+    graph.set_state(tb, False, generation=graph.get_generation(tb))
+    assert graph.is_clean(tb)
+
+    # Changing the condition rebuilds the graph
+    graph.set_state(tb, False)
+    tb.start_cond = "daily"
+    graph.refresh()
+    assert not graph.is_tracked(tb)
+    assert not graph.is_clean(tb)
+    assert graph.get_children("a") == {"c", "d"}
@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from rocketry.args import Return
+from rocketry.conditions import TaskSucceeded
+from rocketry.tasks import FuncTask
+from rocketry.tasks.fan_out import get_chunks
+
+def do_square(x, offset=0):
+    return x * x + offset
+
+async def do_square_async(x):
+    return x * x
+
+def do_fail(x):
+    if x == 3:
+        raise RuntimeError("Oops")
+    return x
+
+def do_fail_or_sleep(x):
+    if x == 1:
+        raise RuntimeError("Oops")
+    time.sleep(2)
+    return x
+
+def get_items():
+    return [1, 2, 3]
+
+threads = set()
+
+def do_record_thread(x):
+    threads.add(threading.get_ident())
+    return x
+
+def test_chunks():
+    assert get_chunks(range(5), 2) == [[0, 1], [2, 3], [4]]
+    assert get_chunks([], 2) == []
+
+@pytest.mark.parametrize("execution", ["main", "async", "thread"])
+@pytest.mark.parametrize("map_execution", ["thread", "process"])
+def test_map(session, execution, map_execution):
+    task = FuncTask(
+        do_square, name="a task", execution=execution,
+        parameters={"x": list(range(10)), "offset": 1},
+        map_param="x", map_chunksize=3, map_workers=2, map_execution=map_execution,
+        session=session
+    )
+    task.run()
+    session.config.shut_cond = TaskSucceeded(task="a task")
+    session.start()
+    assert session.returns[task] == [x * x + 1 for x in range(10)]
+
+def test_map_async_func(session):
+    task = FuncTask(do_square_async, name="a task", execution="main", parameters={"x": [1, 2]}, map_param="x", session=session)
+    task()
+    assert session.returns[task] == [1, 4]
+
+def test_map_reduce(session):
+    task = FuncTask(do_square, name="a task", execution="main", parameters={"x": [1, 2, 3]}, map_param="x", map_reduce=sum, session=session)
+    task()
+    assert session.returns[task] == 14
+
+def test_map_return(session):
+    FuncTask(get_items, name="upstream", execution="main", session=session)()
+    task = FuncTask(do_square, name="a task", execution="main", parameters={"x": Return("upstream")}, map_param="x", session=session)
+    task()
+    assert session.returns[task] == [1, 4, 9]
+
+def test_map_workers(session):
+    threads.clear()
+    task = FuncTask(do_record_thread, name="a task", execution="main", parameters={"x": list(range(20))}, map_param="x", map_workers=1, session=session)
+    task()
+    assert session.returns[task] == list(range(20))
+    assert len(threads) == 1
+
+def test_map_fail(session):
+    task = FuncTask(do_fail, name="a task", execution="main", parameters={"x": [1, 2, 3, 4]}, map_param="x", session=session)
+    task()
+    assert task.status == "fail"
+    assert task.get_current_run() is None
+
+def test_map_fail_not_waiting(session):
+    task = FuncTask(
+        do_fail_or_sleep, name="a task", execution="main",
+        parameters={"x": [1, 2, 3, 4]}, map_param="x", map_workers=2,
+        session=session
+    )
+    start = time.perf_counter()
+    task()
+    assert task.status == "fail"
+    # The running chunk is not waited for
+    # and the unstarted ones are cancelled
+    assert time.perf_counter() - start < 1.5
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def test_map_logs_run_id(session):
+    logger = logging.getLogger("rocketry.tasks.fan_out")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        task = FuncTask(do_square, name="a task", execution="main", parameters={"x": [1, 2]}, map_param="x", session=session)
+        task()
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+    assert len(handler.records) == 4
+    run_ids = {rec.run_id for rec in handler.records}
+    assert len(run_ids) == 1
+    assert None not in run_ids
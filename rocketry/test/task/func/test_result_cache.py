@@ -0,0 +1,153 @@
+import datetime
+
+import pytest
+
+from rocketry.conditions import TaskSucceeded
+from rocketry.conditions.task import TaskInacted
+from rocketry.tasks import FuncTask
+from rocketry.tasks.cache import MemoryCache, PickleCache, ResultCache
+from rocketry.time import TimeOfDay
+
+class MockTime:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+calls = []
+
+def do_square(x=2):
+    calls.append(x)
+    return x * x
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+def test_memory(session):
+    cache = MemoryCache()
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    task(params={"x": 3})
+    task(params={"x": 3})
+    task(params={"x": 4})
+    assert calls == [3, 4]
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert session.returns[task] == 16
+
+    # Cached run publishes the return
+    task(params={"x": 3})
+    assert session.returns[task] == 9
+    assert calls == [3, 4]
+    assert task.status == "success"
+
+def test_memory_lru(session):
+    cache = MemoryCache(maxsize=1)
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    for x in (1, 2, 1):
+        task(params={"x": x})
+    assert calls == [1, 2, 1]
+    assert len(cache) == 1
+
+def test_ttl(session):
+    mock_time = MockTime(1_000_000.0)
+    session.config.time_func = mock_time
+    cache = MemoryCache(ttl="1 minute")
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    task()
+    mock_time.now += 59
+    task()
+    assert calls == [2]
+    mock_time.now += 1
+    task()
+    assert calls == [2, 2]
+
+def test_period(session):
+    mock_time = MockTime(datetime.datetime(2024, 1, 1, 10, 0).timestamp())
+    session.config.time_func = mock_time
+    cache = MemoryCache(period=TimeOfDay("08:00", "12:00"))
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    task()
+    mock_time.now = datetime.datetime(2024, 1, 1, 11, 59).timestamp()
+    task()
+    assert calls == [2]
+
+    # Outside the period
+    mock_time.now = datetime.datetime(2024, 1, 1, 13, 0).timestamp()
+    task()
+    assert calls == [2, 2]
+
+    # Next day
+    mock_time.now = datetime.datetime(2024, 1, 2, 9, 0).timestamp()
+    task()
+    assert calls == [2, 2, 2]
+
+def test_inaction(session):
+    cache = MemoryCache(on_hit="inaction")
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    task()
+    task()
+    assert task.status == "inaction"
+    assert session.returns[task] == 4
+    assert calls == [2]
+
+def test_per_task(session):
+    cache = MemoryCache()
+    task1 = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="task 1")
+    task2 = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="task 2")
+    task1()
+    task2()
+    assert calls == [2, 2]
+
+def test_unpicklable_params(session):
+    cache = MemoryCache()
+    task = FuncTask(do_square, execution="main", result_cache=cache, session=session, name="a task")
+    unpicklable = type("Square", (), {"__mul__": lambda self, other: 1, "__reduce__": None})()
+    task(params={"x": unpicklable})
+    task(params={"x": unpicklable})
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+def test_pickle_dir(session, tmpdir):
+    path = tmpdir / "cache"
+    task = FuncTask(do_square, execution="main", result_cache=PickleCache(path), session=session, name="a task")
+    task(params={"x": 3})
+    assert len(path.listdir()) == 1
+
+    # New cache object using the same directory
+    task.result_cache = PickleCache(path)
+    task(params={"x": 3})
+    assert calls == [3]
+    assert session.returns[task] == 9
+
+    task.result_cache.clear()
+    task(params={"x": 3})
+    assert calls == [3, 3]
+
+def test_pickle_dir_process(session, tmpdir):
+    path = tmpdir / "cache"
+    task = FuncTask(do_square, execution="process", result_cache=PickleCache(path), session=session, name="a task")
+    # Set a value the function would not return
+    task.result_cache.store(task, {}, 100)
+    task.run()
+    session.config.shut_cond = TaskSucceeded(task="a task")
+    session.start()
+    assert session.returns[task] == 100
+
+def test_inaction_process(session, tmpdir):
+    path = tmpdir / "cache"
+    task = FuncTask(do_square, execution="process", result_cache=PickleCache(path, on_hit="inaction"), session=session, name="a task")
+    task.result_cache.store(task, {}, 100)
+    task.run()
+    session.config.shut_cond = TaskInacted(task="a task")
+    session.start()
+    assert task.status == "inaction"
+    assert session.returns[task] == 100
+
+def test_incomplete_backend():
+    class MyCache(ResultCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        MyCache()
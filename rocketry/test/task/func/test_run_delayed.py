@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from textwrap import dedent
 import pytest
 
@@ -264,3 +266,58 @@ def test_parametrization_kwargs(tmpdir, script_files, session):
             {"task_name": "a task", "action": "run"},
             {"task_name": "a task", "action": "success"},
         ] == records
+
+def test_module_cached(tmpdir, session):
+    task_dir = tmpdir.mkdir("mytasks")
+    script = task_dir.join("myfile.py")
+    script.write(dedent("""
+    IMPORTS.append("imported")
+    def myfunc():
+        return 1
+    def otherfunc():
+        return 2
+    """))
+    imports = []
+    import builtins
+    builtins.IMPORTS = imports
+    try:
+        with tmpdir.as_cwd():
+            task1 = FuncTask(func_name="myfunc", path="mytasks/myfile.py", name="task 1", execution="main", session=session)
+            task2 = FuncTask(func_name="otherfunc", path="mytasks/myfile.py", name="task 2", execution="main", session=session)
+            task1()
+            task1()
+            task2()
+            assert session.returns[task1] == 1
+            assert session.returns[task2] == 2
+            assert imports == ["imported"]
+
+            # Modify the file
+            script.write(dedent("""
+            IMPORTS.append("reimported")
+            def myfunc():
+                return 10
+            """))
+            task1()
+            assert session.returns[task1] == 10
+            assert imports == ["imported", "reimported"]
+    finally:
+        del builtins.IMPORTS
+
+def test_run_fresh_interpreter(tmpdir):
+    # Pytest imports importlib.util itself thus
+    # the task is run in a fresh interpreter
+    script = tmpdir.join("myfile.py")
+    script.write(dedent("""
+    def myfunc():
+        return 1
+    """))
+    code = dedent(f"""
+    from rocketry import Session
+    from rocketry.tasks import FuncTask
+    session = Session()
+    task = FuncTask(func_name="myfunc", path={str(script)!r}, name="a task", execution="main", session=session)
+    task()
+    print(task.status, session.returns[task])
+    """)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == "success 1"
@@ -119,6 +119,10 @@ def test_json(session):
         "fmt_log_message": "Task '{task}' status: '{action}'",
         "daemon": null,
         "batches": [],
+        "coalesce_runs": false,
+        "max_queued_runs": null,
+        "on_queue_full": "raise",
+        "job_queue": null,
         "name": "mytest",
         "description": null,
         "logger_name": "rocketry.task",
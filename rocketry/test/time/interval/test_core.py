@@ -1,6 +1,11 @@
 
+import datetime
+import random
+
 import pytest
 from rocketry.core.time.anchor import AnchoredInterval
+from rocketry.pybox.time import to_microseconds
+from rocketry.time import TimeOfSecond, TimeOfMinute, TimeOfHour, TimeOfDay, TimeOfWeek
 
 # Test no unexpected errors in all
 @pytest.mark.parametrize("method", ["__str__", "__repr__"])
@@ -8,3 +13,22 @@ from rocketry.core.time.anchor import AnchoredInterval
 def test_magic_noerror(method, cls):
     obj = cls()
     getattr(obj, method)()
+
+@pytest.mark.parametrize("cls,components", [
+    pytest.param(TimeOfSecond, ("microsecond",), id="TimeOfSecond"),
+    pytest.param(TimeOfMinute, ("second", "microsecond"), id="TimeOfMinute"),
+    pytest.param(TimeOfHour, ("minute", "second", "microsecond"), id="TimeOfHour"),
+    pytest.param(TimeOfDay, ("hour", "minute", "second", "microsecond"), id="TimeOfDay"),
+])
+def test_anchor_dt(cls, components):
+    rand = random.Random(0)
+    for _ in range(200):
+        dt = datetime.datetime(2000, 1, 1) + datetime.timedelta(microseconds=rand.randrange(100 * 366 * 24 * 60 * 60 * 1_000_000))
+        d = {comp: getattr(dt, comp) for comp in components}
+        assert cls().anchor_dt(dt) == to_microseconds(**d)
+
+def test_anchor_dt_week():
+    dt = datetime.datetime(2024, 1, 3, 10, 30, 15, 123) # Wednesday
+    assert TimeOfWeek().anchor_dt(dt) == to_microseconds(day=2, hour=10, minute=30, second=15, microsecond=123)
+    aware = dt.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=-5)))
+    assert TimeOfWeek().anchor_dt(aware) == TimeOfWeek().anchor_dt(dt)
@@ -1,11 +1,14 @@
 import datetime
+import sys
+from time import perf_counter
 
 import pytest
 
 from rocketry.core.time.base import (
-    All, Any
+    All, Any, NoOverlapError
 )
-from rocketry.time.interval import TimeOfDay, TimeOfMinute
+from rocketry.pybox.time import Interval
+from rocketry.time.interval import TimeOfDay, TimeOfHour, TimeOfMinute, TimeOfMonth, TimeOfWeek, TimeOfYear
 
 from_iso = datetime.datetime.fromisoformat
 
@@ -210,3 +213,71 @@ def test_rollback_any(dt, periods, roll_start, roll_end):
     interval = time.rollback(dt)
     assert roll_start == interval.left
     assert roll_end == interval.right
+
+def test_roll_all_sparse():
+    # Friday the 13th of February (none between 2043 and 2054)
+    time = All(TimeOfYear("Feb", "Feb"), TimeOfMonth("13th", "13th"), TimeOfWeek("Fri", "Fri"))
+
+    interval = time.rollforward(from_iso("2043-03-01 00:00:00"))
+    assert interval.left == from_iso("2054-02-13 00:00:00")
+    assert interval.right == from_iso("2054-02-14 00:00:00")
+
+    interval = time.rollback(from_iso("2054-01-01 00:00:00"))
+    assert interval.left == from_iso("2043-02-13 00:00:00")
+    assert interval.right == from_iso("2043-02-14 00:00:00")
+
+    time = All(TimeOfYear("Feb", "Feb"), TimeOfMonth("13th", "13th"), TimeOfWeek("Fri", "Fri"), horizon=datetime.timedelta(days=3660))
+    with pytest.raises(NoOverlapError):
+        time.rollforward(from_iso("2043-03-01 00:00:00"))
+
+def test_roll_all_no_overlap():
+    time = All(TimeOfDay("08:00", "10:00"), TimeOfDay("12:00", "14:00"), horizon="30 days")
+    with pytest.raises(NoOverlapError, match="have no overlapping interval between 2020-01-01 07:00:00 and 2020-01-31 07:00:00"):
+        time.rollforward(from_iso("2020-01-01 07:00:00"))
+    with pytest.raises(NoOverlapError):
+        time.rollback(from_iso("2020-01-01 07:00:00"))
+
+def test_roll_all_no_recursion():
+    # Each try moves only a minute forward thus
+    # there are more tries than the recursion limit
+    time = All(TimeOfMinute("00", "30"), TimeOfMinute("31", "59"), horizon="1 day")
+    assert sys.getrecursionlimit() < 24 * 60
+    with pytest.raises(NoOverlapError):
+        time.rollforward(from_iso("2020-01-01 07:00:00"))
+    with pytest.raises(NoOverlapError):
+        time.rollback(from_iso("2020-01-01 07:00:00"))
+
+def test_get_intervals():
+    start = from_iso("2020-01-01 00:00:00")
+    end = from_iso("2020-01-03 09:00:00")
+    time = All(TimeOfDay("08:00", "18:00"), TimeOfDay("12:00", "20:00"))
+    assert list(time.get_intervals(start, end)) == [
+        Interval(from_iso("2020-01-01 12:00:00"), from_iso("2020-01-01 18:00:00")),
+        Interval(from_iso("2020-01-02 12:00:00"), from_iso("2020-01-02 18:00:00")),
+    ]
+
+    time = Any(TimeOfDay("08:00", "18:00"), TimeOfDay("12:00", "20:00"))
+    intervals = time.get_intervals(start, end)
+    assert list(intervals) == [
+        Interval(from_iso("2020-01-01 08:00:00"), from_iso("2020-01-01 20:00:00")),
+        Interval(from_iso("2020-01-02 08:00:00"), from_iso("2020-01-02 20:00:00")),
+        Interval(from_iso("2020-01-03 08:00:00"), from_iso("2020-01-03 09:00:00")),
+    ]
+    assert from_iso("2020-01-02 19:00:00") in intervals
+    assert from_iso("2020-01-02 21:00:00") not in intervals
+
+def test_roll_all_no_overlap_fast():
+    # The cycles of the periods are checked
+    # instead of rolling through the horizon
+    time = All(TimeOfHour("10:00", "20:00"), TimeOfHour("30:00", "40:00"))
+    start = perf_counter()
+    with pytest.raises(NoOverlapError):
+        time.rollforward(from_iso("2024-01-01 00:00:00"))
+    with pytest.raises(NoOverlapError):
+        time.rollback(from_iso("2024-01-01 00:00:00"))
+    assert perf_counter() - start < 1
+
+    time = All(TimeOfHour("10:00", "20:00"), TimeOfDay("10:00", "11:00"))
+    interval = time.rollforward(from_iso("2024-01-01 00:00:00"))
+    assert interval.left == from_iso("2024-01-01 10:10:00")
+    assert interval.right == from_iso("2024-01-01 10:20:00")
@@ -0,0 +1,72 @@
+import datetime
+import random
+
+import pytest
+
+from rocketry.time import (
+    CachedPeriod, Cron, TimeDelta,
+    TimeOfDay, TimeOfHour, TimeOfMonth, TimeOfWeek,
+)
+
+@pytest.mark.parametrize("period", [
+    pytest.param(TimeOfDay("08:00", "18:00"), id="TimeOfDay"),
+    pytest.param(TimeOfDay("22:00", "02:00"), id="TimeOfDay (over midnight)"),
+    pytest.param(TimeOfDay(), id="TimeOfDay (full)"),
+    pytest.param(TimeOfDay("10:00", "12:00", right_closed=True), id="TimeOfDay (right closed)"),
+    pytest.param(TimeOfHour("15:00", "45:00"), id="TimeOfHour"),
+    pytest.param(TimeOfDay("08:00", "18:00") & TimeOfWeek("Mon", "Fri"), id="All"),
+    pytest.param(TimeOfMonth("5th", "10th") & TimeOfDay("10:00", "11:00"), id="All (sparse)"),
+    pytest.param(TimeOfDay("08:00", "10:00") | TimeOfDay("09:00", "12:00") | TimeOfDay("15:00", "16:00"), id="Any"),
+    pytest.param(Cron("*/15", "9-17", "*", "*", "1-5"), id="Cron"),
+])
+def test_same_as_uncached(period):
+    cached = CachedPeriod(period)
+    rand = random.Random(1)
+    dt = datetime.datetime(2022, 1, 1)
+    for _ in range(1000):
+        dt += datetime.timedelta(minutes=rand.choice([1, 5, 15, 60, 7 * 60]), seconds=rand.choice([0, 0, 30]))
+        assert cached.rollforward(dt) == period.rollforward(dt)
+        assert cached.rollback(dt) == period.rollback(dt)
+        assert (dt in cached) == (dt in period)
+
+def test_regenerate():
+    cached = CachedPeriod(TimeOfDay("08:00", "18:00"), horizon="2 days")
+    assert datetime.datetime(2022, 1, 1, 9) in cached
+    first = cached._cache
+    assert first[0] == datetime.datetime(2021, 12, 30, 9)
+    assert first[1] == datetime.datetime(2022, 1, 3, 9)
+
+    # Inside the horizon
+    assert datetime.datetime(2022, 1, 1, 19) not in cached
+    assert cached._cache is first
+
+    # Close to the end of the horizon
+    assert datetime.datetime(2022, 1, 2, 10) in cached
+    assert cached._cache is not first
+    assert cached._cache[0] == datetime.datetime(2021, 12, 31, 10)
+
+    # Timezone changed
+    dt = datetime.datetime(2022, 1, 2, 10, tzinfo=datetime.timezone.utc)
+    assert dt in cached
+    assert cached._cache[2] is datetime.timezone.utc
+
+def test_beyond_horizon():
+    period = TimeOfMonth("5th", "10th") & TimeOfDay("10:00", "11:00")
+    cached = CachedPeriod(period, horizon="1 day")
+    dt = datetime.datetime(2022, 1, 20)
+    assert cached.rollforward(dt) == period.rollforward(dt)
+    assert cached.rollback(dt) == period.rollback(dt)
+
+def test_fail():
+    with pytest.raises(TypeError):
+        CachedPeriod(TimeDelta("1 hour"))
+    with pytest.raises(TypeError):
+        CachedPeriod(TimeOfDay("08:00", "10:00") & TimeDelta("1 hour"))
+    with pytest.raises(ValueError):
+        CachedPeriod(TimeOfDay("08:00", "10:00"), horizon="0 seconds")
+
+def test_repr():
+    cached = CachedPeriod(TimeOfDay("08:00", "10:00"))
+    assert str(cached) == str(TimeOfDay("08:00", "10:00"))
+    assert repr(cached).startswith("CachedPeriod(TimeOfDay(")
+    assert cached == CachedPeriod(TimeOfDay("08:00", "10:00"))
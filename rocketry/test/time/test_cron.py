@@ -1,4 +1,5 @@
 import datetime
+import random
 import pytest
 from rocketry.time import Cron
 from rocketry.time.interval import TimeOfDay, TimeOfHour, TimeOfMinute, TimeOfMonth, TimeOfWeek, TimeOfYear
@@ -209,3 +210,86 @@ def test_roll_conflict_day_of_month_first():
     interv = period.rollback(datetime.datetime(2022, 12, 7, 10, 0, 0))
     assert interv.left == datetime.datetime.fromisoformat("2022-10-29 22:15:00")
     assert interv.right == datetime.datetime.fromisoformat("2022-10-29 22:16:00")
+
+@pytest.mark.parametrize("expr,dt,forward,back", [
+    pytest.param("0 0 29 2 *", "2022-03-01 00:00", "2024-02-29 00:00", "2020-02-29 00:00", id="leap day"),
+    pytest.param("0 0 29 2 *", "2096-03-01 00:00", "2104-02-29 00:00", "2096-02-29 00:00", id="leap day (no leap in 2100)"),
+    pytest.param("0 0 31 * *", "2022-04-01 00:00", "2022-05-31 00:00", "2022-03-31 00:00", id="31st"),
+    pytest.param("59 23 31 12 *", "2022-06-01 00:00", "2022-12-31 23:59", "2021-12-31 23:59", id="year end"),
+    pytest.param("0 12 13 * FRI", "2022-05-14 00:00", "2022-05-20 12:00", "2022-05-13 12:00", id="day of month or week"),
+])
+def test_roll_rare(expr, dt, forward, back):
+    period = Cron(*expr.split(" "))
+    dt = datetime.datetime.fromisoformat(dt)
+    assert period.rollforward(dt).left == datetime.datetime.fromisoformat(forward)
+    assert period.rollback(dt).left == datetime.datetime.fromisoformat(back)
+
+def test_roll_no_match():
+    period = Cron(*"0 0 30 2 *".split(" "))
+    with pytest.raises(ValueError, match="has no matching times"):
+        period.rollforward(datetime.datetime(2022, 1, 1))
+    with pytest.raises(ValueError, match="has no matching times"):
+        period.rollback(datetime.datetime(2022, 1, 1))
+
+def _random_field(rng, low, high, names=()):
+    kind = rng.choice(["*", "at", "range", "step", "list", "range step", "name"])
+    a = rng.randint(low, high)
+    b = rng.randint(a, high)
+    if kind == "at":
+        return str(a)
+    if kind == "range":
+        return f"{a}-{b}"
+    if kind == "step":
+        return f"*/{rng.randint(1, (high - low) // 2)}"
+    if kind == "list":
+        return ",".join(str(val) for val in sorted(rng.sample(range(low, high + 1), 3)))
+    if kind == "range step":
+        return f"{a}-{b}/{rng.randint(1, 3)}"
+    if kind == "name" and names:
+        return rng.choice(names)
+    return "*"
+
+def test_fuzz_same_as_subperiod():
+    # Test the compiled cron against the cron as a combination of time periods
+    rng = random.Random(0)
+    for _ in range(150):
+        expr = (
+            _random_field(rng, 0, 59),
+            _random_field(rng, 0, 23),
+            _random_field(rng, 1, 28),
+            _random_field(rng, 1, 12, ["JAN", "JUN", "FEB-MAR"]),
+            _random_field(rng, 0, 6, ["MON", "SUN", "FRI-SUN", "Tue-Fri/2"]),
+        )
+        period = Cron(*expr)
+        dt = datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=rng.randint(0, 3 * 365 * 24 * 60 * 60), microseconds=rng.choice([0, 1, 500000]))
+        try:
+            subperiod = period.get_subperiod()
+        except ValueError:
+            # Invalid expression
+            with pytest.raises(ValueError):
+                period.rollforward(dt)
+            continue
+
+        for method in ("__contains__", "rollforward", "rollback"):
+            try:
+                expected = getattr(subperiod, method)(dt)
+            except (RecursionError, ValueError):
+                # The combination of the periods fails
+                # with rare expressions
+                continue
+            actual = getattr(period, method)(dt)
+            if method == "__contains__":
+                assert actual == expected, expr
+                continue
+            assert actual.closed == expected.closed
+            assert actual.left in period
+            if actual.left == expected.left:
+                # The combination of the periods may end the interval
+                # a microsecond earlier at the end of a day or a month
+                assert actual.right - expected.right in (datetime.timedelta(0), datetime.timedelta(microseconds=1)), expr
+            elif method == "rollforward":
+                # The combination of the periods may skip matching
+                # times when it rolls over a month
+                assert dt <= actual.left < expected.left, expr
+            else:
+                assert expected.left < actual.left <= dt, expr
@@ -0,0 +1,137 @@
+import datetime
+
+import pytest
+
+from rocketry.pybox.time import Interval
+from rocketry.time import DayCalendar, TimeOfDay, read_ical
+
+ICAL = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+SUMMARY:Christmas
+DTSTART;VALUE=DATE:20231225
+DTEND;VALUE=DATE:20231227
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:New Year
+DTSTART;VALUE=DATE:20240101
+END:VEVENT
+END:VCALENDAR
+"""
+
+@pytest.fixture
+def workdays():
+    return DayCalendar.business_days(2023, 2024, holidays=read_ical(ICAL))
+
+def test_construct():
+    cal = DayCalendar(["2024-01-03", datetime.date(2024, 1, 1)])
+    assert cal.start == datetime.date(2024, 1, 1)
+    assert cal.end == datetime.date(2024, 1, 3)
+    assert cal.bitmap == b"\x01\x00\x01"
+
+    cal = DayCalendar(["2024-01-03"], start=2024, end=2024)
+    assert cal.start == datetime.date(2024, 1, 1)
+    assert cal.end == datetime.date(2024, 12, 31)
+    assert len(cal.bitmap) == 366
+
+    assert DayCalendar.from_rule(lambda day: day.day == 1, 2024, 2024).bitmap.count(1) == 12
+    with pytest.raises(ValueError):
+        DayCalendar()
+    with pytest.raises(ValueError):
+        DayCalendar(start=2024, end=2023)
+
+def test_ical(tmpdir):
+    assert read_ical(ICAL) == [datetime.date(2023, 12, 25), datetime.date(2023, 12, 26), datetime.date(2024, 1, 1)]
+
+    file = tmpdir.join("holidays.ics")
+    file.write(ICAL)
+    cal = DayCalendar.from_ical(str(file))
+    assert cal.start == datetime.date(2023, 12, 25)
+    assert cal.end == datetime.date(2024, 1, 1)
+    assert datetime.datetime(2023, 12, 26, 12) in cal
+    assert datetime.datetime(2023, 12, 27, 12) not in cal
+
+@pytest.mark.parametrize("dt,expected", [
+    (datetime.datetime(2023, 12, 22, 10), True),
+    (datetime.datetime(2023, 12, 23, 10), False), # Saturday
+    (datetime.datetime(2023, 12, 25, 0), False), # Holiday
+    (datetime.datetime(2023, 12, 27, 0), True),
+    (datetime.datetime(2022, 12, 30, 10), False), # Before range
+    (datetime.datetime(2025, 1, 1, 10), False), # After range
+])
+def test_contains(workdays, dt, expected):
+    assert (dt in workdays) == expected
+
+@pytest.mark.parametrize("dt,expected", [
+    pytest.param(
+        datetime.datetime(2023, 12, 18, 10),
+        Interval(datetime.datetime(2023, 12, 18, 10), datetime.datetime(2023, 12, 23)),
+        id="On period"
+    ),
+    pytest.param(
+        datetime.datetime(2023, 12, 23, 10),
+        Interval(datetime.datetime(2023, 12, 27), datetime.datetime(2023, 12, 30)),
+        id="Over weekend and holidays"
+    ),
+    pytest.param(
+        datetime.datetime(2022, 6, 1),
+        Interval(datetime.datetime(2023, 1, 2), datetime.datetime(2023, 1, 7)),
+        id="Before range"
+    ),
+    pytest.param(
+        datetime.datetime(2025, 6, 1),
+        Interval(DayCalendar.max, DayCalendar.max),
+        id="After range"
+    ),
+])
+def test_rollforward(workdays, dt, expected):
+    assert workdays.rollforward(dt) == expected
+
+@pytest.mark.parametrize("dt,expected", [
+    pytest.param(
+        datetime.datetime(2023, 12, 20, 10),
+        Interval(datetime.datetime(2023, 12, 18), datetime.datetime(2023, 12, 20, 10)),
+        id="On period"
+    ),
+    pytest.param(
+        datetime.datetime(2023, 12, 18),
+        Interval(datetime.datetime(2023, 12, 18), datetime.datetime(2023, 12, 18), closed="both"),
+        id="On start"
+    ),
+    pytest.param(
+        datetime.datetime(2023, 12, 26, 10),
+        Interval(datetime.datetime(2023, 12, 18), datetime.datetime(2023, 12, 23)),
+        id="Over weekend and holidays"
+    ),
+    pytest.param(
+        datetime.datetime(2025, 6, 1),
+        Interval(datetime.datetime(2024, 12, 30), datetime.datetime(2025, 1, 1)),
+        id="After range"
+    ),
+    pytest.param(
+        datetime.datetime(2022, 6, 1),
+        Interval(DayCalendar.min, DayCalendar.min),
+        id="Before range"
+    ),
+])
+def test_rollback(workdays, dt, expected):
+    assert workdays.rollback(dt) == expected
+
+def test_timezone(workdays):
+    tz = datetime.timezone(datetime.timedelta(hours=2))
+    interval = workdays.rollforward(datetime.datetime(2023, 12, 23, 10, tzinfo=tz))
+    assert interval.left == datetime.datetime(2023, 12, 27, tzinfo=tz)
+
+def test_combine(workdays):
+    office_hours = workdays & TimeOfDay("09:00", "17:00")
+    assert datetime.datetime(2023, 12, 22, 10) in office_hours
+    assert datetime.datetime(2023, 12, 22, 18) not in office_hours
+    assert office_hours.rollforward(datetime.datetime(2023, 12, 22, 18)) == Interval(
+        datetime.datetime(2023, 12, 27, 9), datetime.datetime(2023, 12, 27, 17)
+    )
+
+def test_contains_many(workdays):
+    np = pytest.importorskip("numpy")
+    times = np.arange("2022-12-25", "2025-01-05", dtype="datetime64[D]").astype("datetime64[us]") + np.timedelta64(10, "h")
+    expected = [t.astype(datetime.datetime) in workdays for t in times]
+    assert workdays.contains_many(times).tolist() == expected
@@ -0,0 +1,85 @@
+import datetime
+import random
+
+import pytest
+
+from rocketry.time import (
+    All, NoOverlapError,
+    CachedPeriod, Cron, StaticInterval,
+    TimeOfSecond, TimeOfMinute, TimeOfHour, TimeOfDay,
+    TimeOfWeek, TimeOfMonth, TimeOfYear,
+)
+
+np = pytest.importorskip("numpy")
+
+def get_times(n=500):
+    rand = random.Random(0)
+    start = datetime.datetime(2023, 1, 1)
+    times = []
+    for i in range(n):
+        dt = start + datetime.timedelta(microseconds=rand.randrange(3 * 366 * 24 * 60 * 60 * 1_000_000))
+        # Include times on the edges
+        if i % 3 == 0:
+            dt = dt.replace(second=0, microsecond=0)
+        if i % 5 == 0:
+            dt = dt.replace(minute=0)
+        if i % 7 == 0:
+            dt = dt.replace(hour=0)
+        if i % 11 == 0:
+            dt = dt.replace(day=1)
+        times.append(dt)
+    return times
+
+@pytest.mark.parametrize("period", [
+    pytest.param(TimeOfSecond("100", "600"), id="TimeOfSecond"),
+    pytest.param(TimeOfMinute("15", "45"), id="TimeOfMinute"),
+    pytest.param(TimeOfHour("45:00", "15:00"), id="TimeOfHour (over hour)"),
+    pytest.param(TimeOfDay("08:00", "18:00"), id="TimeOfDay"),
+    pytest.param(TimeOfDay("22:00", "02:00"), id="TimeOfDay (over midnight)"),
+    pytest.param(TimeOfDay(), id="TimeOfDay (full)"),
+    pytest.param(TimeOfWeek("Sat", "Mon"), id="TimeOfWeek"),
+    pytest.param(TimeOfMonth("5th", "10th"), id="TimeOfMonth"),
+    pytest.param(TimeOfMonth("31st", "31st"), id="TimeOfMonth (31st)"),
+    pytest.param(TimeOfYear("Nov", "Feb"), id="TimeOfYear"),
+    pytest.param(TimeOfDay("09:00", "17:00") & TimeOfWeek("Mon", "Fri"), id="All"),
+    pytest.param(TimeOfDay("08:00", "10:00") | TimeOfDay("09:00", "12:00") | TimeOfDay("09:30", "10:30") | TimeOfDay("11:30", "14:00"), id="Any"),
+    pytest.param((TimeOfDay("08:00", "10:00") | TimeOfWeek("Sat", "Sun")) & TimeOfMonth("1st", "15th"), id="All of Any"),
+    pytest.param(TimeOfYear("Feb", "Feb") & TimeOfMonth("13th", "13th") & TimeOfWeek("Fri", "Fri"), id="All (sparse)"),
+    pytest.param(Cron("*/15", "9-17", "*", "*", "1-5"), id="Cron"),
+    pytest.param(Cron("0", "0", "29", "2", "*"), id="Cron (leap day)"),
+    pytest.param(Cron("30", "12", "13", "*", "5"), id="Cron (day or weekday)"),
+    pytest.param(Cron("*/15", "9-17", "*", "*", "1-5") & TimeOfMonth("1st", "7th"), id="All with Cron"),
+    pytest.param(CachedPeriod(TimeOfDay("08:00", "18:00")), id="CachedPeriod"),
+    pytest.param(StaticInterval("2023-05-01", "2024-01-01"), id="StaticInterval (not vectorized)"),
+])
+def test_same_as_scalar(period):
+    times = get_times()
+    arr = np.array(times, dtype="datetime64[us]")
+
+    contains = period.contains_many(arr)
+    assert contains.dtype == bool
+    assert contains.tolist() == [dt in period for dt in times]
+
+    starts = period.next_starts(arr)
+    assert starts.dtype == np.dtype("datetime64[us]")
+    assert starts.astype(datetime.datetime).tolist() == [period.rollforward(dt).left for dt in times]
+
+def test_shape():
+    period = TimeOfDay("08:00", "18:00")
+    times = np.array([
+        ["2024-01-01T07:00", "2024-01-01T09:00"],
+        ["2024-01-01T17:00", "2024-01-01T19:00"],
+    ], dtype="datetime64[us]")
+    assert period.contains_many(times).tolist() == [[False, True], [True, False]]
+    assert period.next_starts(times).tolist() == [
+        [datetime.datetime(2024, 1, 1, 8), datetime.datetime(2024, 1, 1, 9)],
+        [datetime.datetime(2024, 1, 1, 17), datetime.datetime(2024, 1, 2, 8)],
+    ]
+
+    # Python datetimes are accepted as well
+    assert period.contains_many([datetime.datetime(2024, 1, 1, 9)]).tolist() == [True]
+
+def test_no_match():
+    period = All(TimeOfDay("08:00", "10:00"), TimeOfDay("12:00", "14:00"), horizon="30 days")
+    with pytest.raises(NoOverlapError):
+        period.next_starts(np.array(["2024-01-01"], dtype="datetime64[us]"))
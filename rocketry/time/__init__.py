@@ -1,11 +1,12 @@
 from rocketry.core.time import always, never
 from rocketry.session import Session
-from rocketry.core.time import TimeDelta, StaticInterval, All, Any
+from rocketry.core.time import TimeDelta, StaticInterval, All, Any, NoOverlapError, CachedPeriod
 
 from .interval import *
 from .construct import get_between, get_before, get_after, get_full_cycle, get_on
 from .delta import TimeSpanDelta
 from .cron import Cron
+from .dates import DayCalendar, read_ical
 
 Session._time_parsers.update(
     {
@@ -1,10 +1,51 @@
-from typing import Callable
+import calendar
+import datetime
+from typing import Callable, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
-from rocketry.core.time.base import TimePeriod, always
+from rocketry.core.time.base import DAY_US as _DAY_US, TimePeriod, always, import_numpy, month_start_many, split_many
+from rocketry.pybox.time import Interval
 
 from .interval import TimeOfHour, TimeOfDay, TimeOfMinute, TimeOfWeek, TimeOfMonth, TimeOfYear
 
+_MINUTE = datetime.timedelta(minutes=1)
+
+# Microseconds (for the batch methods)
+_MINUTE_US = 60 * 1_000_000
+_HOUR_US = 60 * _MINUTE_US
+
+# How many years are searched for a matching time
+# (leap years repeat every 400 years)
+_MAX_YEARS = 400
+
+class CronFields(NamedTuple):
+    "Compiled cron expression (bitsets of the allowed values)"
+    minutes: int # Bits 0-59
+    hours: int # Bits 0-23
+    days: int # Bits 1-31
+    months: int # Bits 1-12
+    weekdays: Tuple[int, ...] # Day bits (1-31) for each weekday of the first day of month
+    days_or_weekdays: bool # Whether day of month and day of week are OR'ed
+
+def _next_bit(bits:int, start:int) -> Optional[int]:
+    "Get the first set bit at or after start"
+    bits >>= start
+    if not bits:
+        return None
+    return start + (bits & -bits).bit_length() - 1
+
+def _prev_bit(bits:int, end:int) -> Optional[int]:
+    "Get the last set bit at or before end"
+    if end < 0:
+        return None
+    bits &= (1 << (end + 1)) - 1
+    if not bits:
+        return None
+    return bits.bit_length() - 1
+
+def _to_bits(period, values, to_datetime) -> int:
+    return sum(1 << value for value in values if period is always or to_datetime(value) in period)
+
 @dataclass(frozen=True)
 class Cron(TimePeriod):
 
@@ -26,13 +67,260 @@ class Cron(TimePeriod):
         # -: range of values
         # /: step values
 
+    def __contains__(self, dt):
+        "Whether the datetime is on the period"
+        return self._is_match(dt.replace(second=0, microsecond=0))
+
     def rollforward(self, dt):
-        "Get previous time interval of the period."
-        return self.get_subperiod().rollforward(dt)
+        "Get next time interval of the period."
+        minute = dt.replace(second=0, microsecond=0)
+        if self._is_match(minute):
+            return Interval(dt, minute + _MINUTE)
+        start = self._next_match(minute + _MINUTE)
+        return Interval(start, start + _MINUTE)
 
     def rollback(self, dt):
         "Get previous time interval of the period."
-        return self.get_subperiod().rollback(dt)
+        minute = dt.replace(second=0, microsecond=0)
+        if dt > minute and self._is_match(minute):
+            return Interval(minute, dt)
+        start = self._prev_match(minute - _MINUTE)
+        return Interval(start, start + _MINUTE)
+
+    @property
+    def _expr(self):
+        return " ".join(str(field) for field in (self.minute, self.hour, self.day_of_month, self.month, self.day_of_week))
+
+    def get_fields(self) -> CronFields:
+        "Get the compiled fields of the expression"
+        fields = self.__dict__.get("_fields")
+        if fields is None:
+            fields = self._compile()
+            object.__setattr__(self, "_fields", fields)
+        return fields
+
+    def _compile(self) -> CronFields:
+        # The fields are parsed to periods and the periods
+        # are turned to bitsets of the values they contain
+        day_of_month = self._get_period_from_expr(TimeOfMonth, self.day_of_month)
+        day_of_week = self._get_period_from_expr(TimeOfWeek, self.day_of_week, conv=self._convert_day_of_week)
+
+        # 2024-01-01 is Monday
+        weekdays = _to_bits(day_of_week, range(7), lambda i: datetime.datetime(2024, 1, 1 + i, 12))
+        weekday_days = tuple(
+            # Days of a month (that starts on the given weekday) that are on the weekdays
+            sum(1 << day for day in range(1, 32) if weekdays >> ((first_weekday + day - 1) % 7) & 1)
+            for first_weekday in range(7)
+        )
+        fields = CronFields(
+            minutes=_to_bits(self._get_period_from_expr(TimeOfHour, self.minute), range(60), lambda i: datetime.datetime(2024, 1, 1, 0, i, 30)),
+            hours=_to_bits(self._get_period_from_expr(TimeOfDay, self.hour), range(24), lambda i: datetime.datetime(2024, 1, 1, i, 30)),
+            days=_to_bits(day_of_month, range(1, 32), lambda i: datetime.datetime(2024, 1, i, 12)),
+            months=_to_bits(self._get_period_from_expr(TimeOfYear, self.month), range(1, 13), lambda i: datetime.datetime(2024, i, 15, 12)),
+            weekdays=weekday_days,
+            days_or_weekdays=day_of_month is not always and day_of_week is not always,
+        )
+        if not all((fields.minutes, fields.hours, fields.months)) or not any((fields.days, weekdays)):
+            raise ValueError(f"Cron expression '{self._expr}' has no matching times")
+        return fields
+
+    def _get_days(self, year:int, month:int) -> int:
+        "Get bitset of the days of the month that are on the period"
+        fields = self.get_fields()
+        first_weekday, n_days = calendar.monthrange(year, month)
+        weekdays = fields.weekdays[first_weekday]
+        days = fields.days | weekdays if fields.days_or_weekdays else fields.days & weekdays
+        return days & ((1 << (n_days + 1)) - 2)
+
+    def _is_match(self, dt) -> bool:
+        fields = self.get_fields()
+        return bool(
+            fields.minutes >> dt.minute & 1
+            and fields.hours >> dt.hour & 1
+            and fields.months >> dt.month & 1
+            and self._get_days(dt.year, dt.month) >> dt.day & 1
+        )
+
+    def _get_tables(self):
+        "Get the compiled fields as NumPy lookup tables (for the batch methods)"
+        tables = self.__dict__.get("_tables")
+        if tables is None:
+            np = import_numpy()
+            fields = self.get_fields()
+            days = [
+                fields.days | weekdays if fields.days_or_weekdays else fields.days & weekdays
+                for weekdays in fields.weekdays
+            ]
+            def to_next(bits, n):
+                # Next allowed value (at or after) for each value
+                # (n if there is none)
+                return np.array([
+                    n if _next_bit(bits, i) is None else _next_bit(bits, i)
+                    for i in range(n + 1)
+                ], dtype=np.int64)
+            tables = {
+                "minutes": to_next(fields.minutes, 60),
+                "hours": to_next(fields.hours, 24),
+                "months": np.array([bool(fields.months >> i & 1) for i in range(13)]),
+                # Indexed by the weekday of the first day of the month
+                "days": np.array([to_next(bits, 32) for bits in days]),
+            }
+            object.__setattr__(self, "_tables", tables)
+        return tables
+
+    def _split_many(self, us):
+        months, days, day_us = split_many(us)
+        month_start = month_start_many(months)
+        month_end = month_start_many(months + 1)
+        return {
+            "month": months % 12 + 1,
+            "day": days + 1,
+            "hour": day_us // _HOUR_US,
+            "minute": day_us % _HOUR_US // _MINUTE_US,
+            # 1970-01-01 is Thursday
+            "first_weekday": (month_start + 3) % 7,
+            "day_start": us - day_us,
+            "month_start": month_start * _DAY_US,
+            "month_end": month_end * _DAY_US,
+        }
+
+    def _match_many(self, us):
+        tables = self._get_tables()
+        comps = self._split_many(us)
+        return (
+            (tables["minutes"][comps["minute"]] == comps["minute"])
+            & (tables["hours"][comps["hour"]] == comps["hour"])
+            & tables["months"][comps["month"]]
+            & (tables["days"][comps["first_weekday"], comps["day"]] == comps["day"])
+            & (comps["day"] < (comps["month_end"] - comps["month_start"]) // _DAY_US + 1)
+        )
+
+    def _next_match_many(self, us):
+        "Get the first matching minute at or after each of the (minute) times"
+        np = import_numpy()
+        tables = self._get_tables()
+        result = us.copy()
+        limit = us + _MAX_YEARS * 366 * _DAY_US
+        idx = np.arange(len(us))
+        curr = us.copy()
+        while len(idx):
+            comps = self._split_many(curr)
+            hour_start = comps["day_start"] + comps["hour"] * _HOUR_US
+
+            next_day = tables["days"][comps["first_weekday"], comps["day"]]
+            next_hour = tables["hours"][comps["hour"]]
+            next_minute = tables["minutes"][comps["minute"]]
+            n_days = (comps["month_end"] - comps["month_start"]) // _DAY_US
+
+            bad_month = ~tables["months"][comps["month"]]
+            bad_day = ~bad_month & (next_day != comps["day"])
+            bad_hour = ~bad_month & ~bad_day & (next_hour != comps["hour"])
+            bad_minute = ~bad_month & ~bad_day & ~bad_hour & (next_minute != comps["minute"])
+            matched = ~(bad_month | bad_day | bad_hour | bad_minute)
+
+            curr = np.select(
+                [
+                    bad_month | (bad_day & (next_day > n_days)),
+                    bad_day,
+                    bad_hour & (next_hour == 24),
+                    bad_hour,
+                    bad_minute & (next_minute == 60),
+                    bad_minute,
+                ],
+                [
+                    comps["month_end"],
+                    comps["month_start"] + (next_day - 1) * _DAY_US,
+                    comps["day_start"] + _DAY_US,
+                    comps["day_start"] + next_hour * _HOUR_US,
+                    hour_start + _HOUR_US,
+                    hour_start + next_minute * _MINUTE_US,
+                ],
+                default=curr,
+            )
+            result[idx[matched]] = curr[matched]
+            idx = idx[~matched]
+            curr = curr[~matched]
+            over = curr > limit[idx]
+            if over.any():
+                dt = datetime.datetime(1970, 1, 1) + datetime.timedelta(microseconds=int(us[idx[over][0]]))
+                raise ValueError(f"Cron expression '{self._expr}' has no matching times after {dt}")
+        return result
+
+    def _contains_many(self, us):
+        return self._match_many(us // _MINUTE_US * _MINUTE_US)
+
+    def _rollforward_many(self, us):
+        np = import_numpy()
+        minute = us // _MINUTE_US * _MINUTE_US
+        matched = self._match_many(minute)
+        start = us.copy()
+        start[~matched] = self._next_match_many(minute[~matched] + _MINUTE_US)
+        end = np.where(matched, minute, start) + _MINUTE_US
+        return start, end
+
+    def _next_match(self, dt):
+        "Get the first matching minute at or after dt"
+        fields = self.get_fields()
+        year, month, day, hour, minute = dt.year, dt.month, dt.day, dt.hour, dt.minute
+        while year < dt.year + _MAX_YEARS:
+            next_month = _next_bit(fields.months, month)
+            if next_month is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, 0, 0
+
+            next_day = _next_bit(self._get_days(year, month), day)
+            if next_day is None:
+                year, month, day, hour, minute = (year + 1, 1, 1, 0, 0) if month == 12 else (year, month + 1, 1, 0, 0)
+                continue
+            if next_day != day:
+                day, hour, minute = next_day, 0, 0
+
+            next_hour = _next_bit(fields.hours, hour)
+            next_minute = _next_bit(fields.minutes, minute) if next_hour == hour else _next_bit(fields.minutes, 0)
+            if next_hour is not None and next_hour == hour and next_minute is None:
+                # No more minutes in the hour
+                next_hour = _next_bit(fields.hours, hour + 1)
+                next_minute = _next_bit(fields.minutes, 0)
+            if next_hour is None:
+                # No more hours in the day
+                day, hour, minute = day + 1, 0, 0
+                continue
+            return dt.replace(year=year, month=month, day=day, hour=next_hour, minute=next_minute)
+        raise ValueError(f"Cron expression '{self._expr}' has no matching times after {dt}")
+
+    def _prev_match(self, dt):
+        "Get the last matching minute at or before dt"
+        fields = self.get_fields()
+        year, month, day, hour, minute = dt.year, dt.month, dt.day, dt.hour, dt.minute
+        while year > dt.year - _MAX_YEARS:
+            prev_month = _prev_bit(fields.months, month)
+            if prev_month is None:
+                year, month, day, hour, minute = year - 1, 12, 31, 23, 59
+                continue
+            if prev_month != month:
+                month, day, hour, minute = prev_month, 31, 23, 59
+
+            prev_day = _prev_bit(self._get_days(year, month), day)
+            if prev_day is None:
+                year, month, day, hour, minute = (year - 1, 12, 31, 23, 59) if month == 1 else (year, month - 1, 31, 23, 59)
+                continue
+            if prev_day != day:
+                day, hour, minute = prev_day, 23, 59
+
+            prev_hour = _prev_bit(fields.hours, hour)
+            prev_minute = _prev_bit(fields.minutes, minute) if prev_hour == hour else _prev_bit(fields.minutes, 59)
+            if prev_hour is not None and prev_hour == hour and prev_minute is None:
+                # No earlier minutes in the hour
+                prev_hour = _prev_bit(fields.hours, hour - 1)
+                prev_minute = _prev_bit(fields.minutes, 59)
+            if prev_hour is None:
+                # No earlier hours in the day
+                day, hour, minute = day - 1, 23, 59
+                continue
+            return dt.replace(year=year, month=month, day=day, hour=prev_hour, minute=prev_minute)
+        raise ValueError(f"Cron expression '{self._expr}' has no matching times before {dt}")
 
     def _get_period_from_expr(self, cls, expression:str, conv:Callable=None, default=always):
 
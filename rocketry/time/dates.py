@@ -0,0 +1,226 @@
+import datetime
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Union
+
+from rocketry.core.time.base import DAY_US as _DAY_US, TimePeriod, import_numpy
+from rocketry.pybox.time import Interval
+
+DateLike = Union[datetime.date, str, int]
+
+# Ordinal of the epoch of the batch methods (1970-01-01)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+def _to_date(value:DateLike, side:str="start") -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, int):
+        # Year
+        return datetime.date(value, 1, 1) if side == "start" else datetime.date(value, 12, 31)
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    raise TypeError(f"Cannot convert to date: {type(value)}")
+
+@dataclass(frozen=True, repr=False)
+class DayCalendar(TimePeriod):
+    """Time period of specific days.
+
+    The days between start and end are precomputed
+    to a day bitmap so checking whether a time is
+    on the period is an index lookup and rolling
+    is a scan of the bitmap. Consecutive days form
+    one interval. Times outside the range are not
+    on the period.
+
+    Parameters
+    ----------
+    days : iterable of datetime.date
+        Days that are on the period.
+    start : datetime.date, str, int, optional
+        First day of the range. Year if integer.
+        By default, the first of the days.
+    end : datetime.date, str, int, optional
+        Last day of the range (inclusive). Year if
+        integer. By default, the last of the days.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from rocketry.time import DayCalendar, TimeOfDay
+
+        workdays = DayCalendar.business_days(2020, 2030, holidays=["2023-12-25", "2023-12-26"])
+        office_hours = workdays & TimeOfDay("09:00", "17:00")
+    """
+
+    start: datetime.date
+    end: datetime.date
+    bitmap: bytes
+
+    def __init__(self, days:Iterable[DateLike]=(), start:DateLike=None, end:DateLike=None):
+        days = sorted({_to_date(day) for day in days})
+        if start is None or end is None:
+            if not days:
+                raise ValueError("Start and end must be given if there are no days")
+        start = _to_date(start, side="start") if start is not None else days[0]
+        end = _to_date(end, side="end") if end is not None else days[-1]
+        if start > end:
+            raise ValueError("Start cannot be after end")
+
+        offset = start.toordinal()
+        bitmap = bytearray(end.toordinal() - offset + 1)
+        for day in days:
+            if start <= day <= end:
+                bitmap[day.toordinal() - offset] = 1
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "end", end)
+        object.__setattr__(self, "bitmap", bytes(bitmap))
+
+    @classmethod
+    def from_rule(cls, rule:Callable[[datetime.date], bool], start:DateLike, end:DateLike) -> 'DayCalendar':
+        "Create the calendar from the days the rule is true"
+        start = _to_date(start, side="start")
+        end = _to_date(end, side="end")
+        days = (
+            datetime.date.fromordinal(ordinal)
+            for ordinal in range(start.toordinal(), end.toordinal() + 1)
+        )
+        return cls((day for day in days if rule(day)), start=start, end=end)
+
+    @classmethod
+    def business_days(cls, start:DateLike, end:DateLike, holidays:Iterable[DateLike]=(), weekdays:Iterable[int]=(0, 1, 2, 3, 4)) -> 'DayCalendar':
+        """Create a calendar of business days.
+
+        Parameters
+        ----------
+        start : datetime.date, str, int
+            First day of the range. Year if integer.
+        end : datetime.date, str, int
+            Last day of the range. Year if integer.
+        holidays : iterable of datetime.date
+            Days that are not business days.
+        weekdays : iterable of int
+            Weekdays that are business days (Monday
+            is 0). By default from Monday to Friday.
+        """
+        holidays = {_to_date(day) for day in holidays}
+        weekdays = set(weekdays)
+        return cls.from_rule(
+            lambda day: day.weekday() in weekdays and day not in holidays,
+            start=start, end=end
+        )
+
+    @classmethod
+    def from_ical(cls, file:Union[str, Path], start:DateLike=None, end:DateLike=None) -> 'DayCalendar':
+        "Create the calendar from the days of the events of an iCalendar file"
+        return cls(read_ical(file), start=start, end=end)
+
+    def _get_index(self, dt) -> int:
+        return dt.toordinal() - self.start.toordinal()
+
+    def _get_day(self, index:int, tz) -> datetime.datetime:
+        day = datetime.date.fromordinal(self.start.toordinal() + index)
+        return datetime.datetime.combine(day, datetime.time.min, tzinfo=tz)
+
+    def __contains__(self, dt) -> bool:
+        index = self._get_index(dt)
+        return 0 <= index < len(self.bitmap) and self.bitmap[index] == 1
+
+    def rollforward(self, dt) -> Interval:
+        "Get next time interval of the period"
+        bitmap = self.bitmap
+        tz = dt.tzinfo
+        index = self._get_index(dt)
+        start = bitmap.find(1, max(index, 0))
+        if start == -1:
+            # No more days on the period
+            end = self.max.replace(tzinfo=tz)
+            return Interval(end, end)
+        end = bitmap.find(0, start)
+        if end == -1:
+            end = len(bitmap)
+        start_dt = dt if start == index else self._get_day(start, tz)
+        return Interval(start_dt, self._get_day(end, tz))
+
+    def rollback(self, dt) -> Interval:
+        "Get previous time interval of the period"
+        bitmap = self.bitmap
+        tz = dt.tzinfo
+        index = self._get_index(dt)
+        if dt in self:
+            # On the period, the interval ends to dt
+            start = bitmap.rfind(0, 0, index) + 1
+            start_dt = self._get_day(start, tz)
+            if start_dt == dt:
+                # Only the dt is included
+                return Interval(dt, dt, closed="both")
+            return Interval(start_dt, dt)
+
+        end = bitmap.rfind(1, 0, max(min(index, len(bitmap)), 0))
+        if end == -1:
+            # No earlier days on the period
+            start = self.min.replace(tzinfo=tz)
+            return Interval(start, start)
+        start = bitmap.rfind(0, 0, end) + 1
+        return Interval(self._get_day(start, tz), self._get_day(end + 1, tz))
+
+    def _contains_many(self, us):
+        np = import_numpy()
+        bitmap = np.frombuffer(self.bitmap, dtype=np.uint8)
+        index = us // _DAY_US + (_EPOCH_ORDINAL - self.start.toordinal())
+        inside = (index >= 0) & (index < len(bitmap))
+        result = np.zeros(len(us), dtype=bool)
+        result[inside] = bitmap[index[inside]] == 1
+        return result
+
+    def __repr__(self):
+        return f"DayCalendar(start={self.start!r}, end={self.end!r}, n_days={self.bitmap.count(1)})"
+
+    def __str__(self):
+        return f"calendar days between {self.start} and {self.end}"
+
+def read_ical(file:Union[str, Path]) -> List[datetime.date]:
+    """Read the days of the events in an iCalendar
+    (.ics) file. The end of an event is exclusive.
+    Recurring events (RRULE) are not expanded.
+
+    Parameters
+    ----------
+    file : str, path-like
+        Path to the file or the content.
+    """
+    if isinstance(file, Path) or "BEGIN:" not in file:
+        content = Path(file).read_text(encoding="utf-8")
+    else:
+        content = file
+    # Unfold continuation lines
+    content = re.sub(r"\r?\n[ \t]", "", content)
+
+    days = []
+    start = end = None
+    for line in content.splitlines():
+        name, _, value = line.partition(":")
+        name = name.split(";")[0].upper()
+        if name == "BEGIN" and value.strip().upper() == "VEVENT":
+            start = end = None
+        elif name == "DTSTART":
+            start = _parse_ical_date(value)
+        elif name == "DTEND":
+            end = _parse_ical_date(value)
+        elif name == "END" and value.strip().upper() == "VEVENT":
+            if start is None:
+                continue
+            end = end if end is not None and end > start else start + datetime.timedelta(days=1)
+            days += [
+                datetime.date.fromordinal(ordinal)
+                for ordinal in range(start.toordinal(), end.toordinal())
+            ]
+    return days
+
+def _parse_ical_date(value:str) -> datetime.date:
+    # Ie. 20240101 or 20240101T120000Z
+    value = value.strip()
+    return datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
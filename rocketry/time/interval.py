@@ -4,13 +4,17 @@ import re
 from dataclasses import dataclass
 from typing import ClassVar, List
 
-import dateutil
 
-from rocketry.core.time.anchor import AnchoredInterval
+from rocketry.core.time.anchor import AnchoredInterval, to_day_us
+from rocketry.core.time.base import DAY_US as _DAY_US, import_numpy, month_start_many, split_many
 from rocketry.core.time.base import TimeInterval
 from rocketry.pybox.time import datetime_to_dict, to_microseconds
 from rocketry.pybox.time.interval import Interval
 
+def _days_in_month_many(months):
+    "Number of days in months (months from epoch)"
+    return month_start_many(months + 1) - month_start_many(months)
+
 @dataclass(frozen=True, init=False)
 class TimeOfSecond(AnchoredInterval):
     """Time interval anchored to second cycle of a clock
@@ -131,21 +135,13 @@ class TimeOfDay(AnchoredInterval):
 
     def anchor_str(self, s, **kwargs):
         # ie. "10:00:15"
-        dt = dateutil.parser.parse(s)
+        # Imported here as dateutil is slow to import
+        from dateutil.parser import parse
+        dt = parse(s)
         d = datetime_to_dict(dt)
         components = ("hour", "minute", "second", "microsecond")
         return to_microseconds(**{key: int(val) for key, val in d.items() if key in components})
 
-    def anchor_dt(self, dt, **kwargs):
-        "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("hour", "minute", "second", "microsecond")
-        }
-        return to_microseconds(**d)
-
 @dataclass(frozen=True, init=False)
 class TimeOfWeek(AnchoredInterval):
     """Time interval anchored to week cycle
@@ -204,17 +200,6 @@ class TimeOfWeek(AnchoredInterval):
 
         return to_microseconds(day=1) * nth_day + microseconds
 
-    def anchor_dt(self, dt, **kwargs):
-        "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("hour", "minute", "second", "microsecond")
-        }
-        dayofweek = dt.weekday()
-        return to_microseconds(**d) + dayofweek * to_microseconds(day=1)
-
 
 @dataclass(frozen=True, init=False)
 class TimeOfMonth(AnchoredInterval):
@@ -274,22 +259,21 @@ class TimeOfMonth(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("day", "hour", "minute", "second", "microsecond")
-        }
-        if "day" in d:
-            # Day (of month) does not start from 0 (but from 1)
-            d["day"] = d["day"] - 1
+        # Day (of month) does not start from 0 (but from 1)
+        return (dt.day - 1) * _DAY_US + to_day_us(dt)
 
-        return to_microseconds(**d)
+    def anchor_many(self, us):
+        _, days, day_us = split_many(us)
+        return days * _DAY_US + day_us
 
     def get_scope_forward(self, dt):
         n_days = calendar.monthrange(dt.year, dt.month)[1]
         return to_microseconds(day=1) * n_days
 
+    def _get_scope_forward_many(self, us):
+        months, _, _ = split_many(us)
+        return _DAY_US * _days_in_month_many(months)
+
     def get_scope_back(self, dt):
         month = 12 if dt.month == 1 else dt.month - 1
         year = dt.year - 1 if dt.month == 1 else dt.year
@@ -389,17 +373,14 @@ class TimeOfYear(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        dt_dict = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in dt_dict.items()
-            if key in ("day", "hour", "minute", "second", "microsecond")
-        }
-        nth_month = dt_dict["month"] - 1
-        if "day" in d:
-            # Day (of month) does not start from 0 (but from 1)
-            d["day"] = d["day"] - 1
-        return self._month_start_mapping[nth_month] + to_microseconds(**d)
+        # Day (of month) does not start from 0 (but from 1)
+        return self._month_start_mapping[dt.month - 1] + (dt.day - 1) * _DAY_US + to_day_us(dt)
+
+    def anchor_many(self, us):
+        np = import_numpy()
+        months, days, day_us = split_many(us)
+        month_starts = np.array([self._month_start_mapping[i] for i in range(12)], dtype=np.int64)
+        return month_starts[months % 12] + days * _DAY_US + day_us
 
 
 @dataclass(frozen=True, init=False)
@@ -1,9 +1,11 @@
-from typing import List, Optional, Union
+import threading
+from typing import Dict, List, Optional, Set, Union
 
 from pydantic import BaseModel
 
-from rocketry.conditions import Any, All, DependFinish, DependSuccess
+from rocketry.conditions import Any, All, Not, DependFinish, DependSuccess
 from rocketry.conditions.task import DependFailure
+from rocketry.conditions.task.utils import DependMixin
 from rocketry.core import Task
 
 from rocketry import Session
@@ -52,22 +54,165 @@ class Dependencies(BaseModel):
         super().__init__(session=session, **kwargs)
 
     def __iter__(self):
-        for task in self.session.tasks:
-            yield from self._get_links(task)
+        tasks = {task.name: task for task in self.session.tasks}
+        for task in tasks.values():
+            yield from self._get_links(task, tasks=tasks)
 
-    def _get_links(self, task:Task) -> Union[Any, All]:
+    def _get_links(self, task:Task, tasks:Optional[Dict[str, Task]]=None) -> Union[Any, All]:
         cond = task.start_cond
         if isinstance(cond, (Any, All)):
             for subcond in cond:
                 if isinstance(subcond, (DependFinish, DependSuccess, DependFailure)):
-                    req_task = subcond.depend_task
-                    req_task = self.session[req_task]
+                    req_task = self._get_task(subcond.depend_task, tasks)
                     yield Link(parent=req_task, child=task, relation=type(subcond), type=type(cond))
         elif isinstance(cond, (DependFinish, DependSuccess, DependFailure)):
-            req_task = cond.depend_task
-            req_task = self.session[req_task]
+            req_task = self._get_task(cond.depend_task, tasks)
             yield Link(req_task, task, relation=type(cond))
 
+    def _get_task(self, task, tasks:Optional[Dict[str, Task]]=None) -> Task:
+        if tasks is None:
+            return self.session[task]
+        name = self.session._get_task_name(task)
+        try:
+            return tasks[name]
+        except KeyError:
+            raise KeyError(f"Task '{name}' not found")
+
+class DependencyGraph:
+    """Graph of task dependencies used to skip
+    unnecessary condition checks.
+
+    A task's state is tracked only if its starting
+    condition consists solely of dependency conditions
+    (``DependSuccess``, ``DependFailure`` and ``DependFinish``
+    combined with ``&``, ``|`` and ``~``). The state of
+    such a condition can change only when one of its
+    parents or the task itself logs an action. Once
+    the condition is found false, the task is considered
+    clean and checking the condition is skipped until
+    a parent or the task itself is marked dirty.
+
+    Tasks may be marked dirty from other threads (ie.
+    a parent finishing in a thread) while the condition
+    is being checked. Each mark increments the
+    generation of the task and the task is set clean
+    only if the generation has not changed since the
+    check started.
+
+    Parameters
+    ----------
+    session : rocketry.Session
+        Session of the tasks.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._children: Dict[str, Set[str]] = {}
+        self._tracked: Set[str] = set()
+        self._clean: Set[str] = set()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._signature = None
+
+    def refresh(self, tasks=None):
+        "Rebuild the graph if the tasks or their conditions changed"
+        tasks = self.session.tasks if tasks is None else tasks
+        signature = frozenset((task.name, id(task.start_cond)) for task in tasks)
+        if signature == self._signature:
+            return
+        with self._lock:
+            self._clean = set()
+        self._children = {}
+        self._tracked = set()
+        for task in tasks:
+            try:
+                parents = [
+                    self.session._get_task_name(cond.depend_task)
+                    for cond in self._iter_depend_conds(task.start_cond)
+                ]
+                is_tracked = self._get_depend_conds(task.start_cond, task_name=task.name) is not None
+            except TypeError:
+                # Cannot determine the tasks, let the condition handle it
+                continue
+            if is_tracked:
+                self._tracked.add(task.name)
+            for parent in parents:
+                self._children.setdefault(parent, set()).add(task.name)
+        self._signature = signature
+
+    def _iter_depend_conds(self, cond):
+        "Iterate all dependency conditions in the condition"
+        if isinstance(cond, DependMixin):
+            yield cond
+        elif isinstance(cond, (All, Any, Not)):
+            for subcond in cond.subconditions:
+                yield from self._iter_depend_conds(subcond)
+
+    def _get_depend_conds(self, cond, task_name) -> Optional[List[DependMixin]]:
+        "Get the dependency conditions if the condition consists only of such"
+        if isinstance(cond, DependMixin):
+            if cond.task is not None and self.session._get_task_name(cond.task) != task_name:
+                # Depends on the runs of another task
+                return None
+            return [cond]
+        if isinstance(cond, (All, Any, Not)):
+            conds = []
+            for subcond in cond.subconditions:
+                subconds = self._get_depend_conds(subcond, task_name=task_name)
+                if subconds is None:
+                    return None
+                conds += subconds
+            return conds if conds else None
+        return None
+
+    def get_children(self, task) -> Set[str]:
+        "Get names of the tasks that have a dependency condition on the given task"
+        name = self.session._get_task_name(task)
+        return self._children.get(name, set())
+
+    def is_tracked(self, task:Task) -> bool:
+        "Whether the task's start condition is tracked by the graph"
+        return task.name in self._tracked
+
+    def is_clean(self, task:Task) -> bool:
+        "Whether the task's start condition is known to be false"
+        return task.name in self._clean
+
+    def get_generation(self, task:Task) -> int:
+        "Get the number of times the task has been marked dirty"
+        return self._generations.get(task.name, 0)
+
+    def set_state(self, task:Task, state:bool, generation:Optional[int]=None):
+        """Set the observed state of the task's start condition
+
+        Parameters
+        ----------
+        task : Task
+            Task which condition was observed.
+        state : bool
+            State of the condition.
+        generation : int, optional
+            Generation of the task (``get_generation``)
+            before the condition was observed. If the
+            task was marked dirty after that, it is not
+            set clean.
+        """
+        name = task.name
+        with self._lock:
+            is_stale = generation is not None and self._generations.get(name, 0) != generation
+            if not state and name in self._tracked and not is_stale:
+                self._clean.add(name)
+            else:
+                self._clean.discard(name)
+
+    def mark_dirty(self, task:Task):
+        "Mark the task and its children to be checked again"
+        name = task.name
+        with self._lock:
+            for dirty in (name, *self._children.get(name, ())):
+                self._clean.discard(dirty)
+                self._generations[dirty] = self._generations.get(dirty, 0) + 1
+
 
 def get_dependencies(session) -> List[Link]:
     "Get list of dependency links"